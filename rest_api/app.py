@@ -13,29 +13,42 @@ to helper modules:
 - `progress_utils.py` for progress and remaining-time estimates
 - `storage.py` for run-directory naming and lookup
 - `nas_smb.py` for SMB upload and retention operations
+- `job_archive.py` for finished jobs (and, with ``BOX_SHARED_STATE``, the
+  mirrored active jobs read by the `http_front.py` workers)
+
+Startup keeps `/health` fast: pyBEEP's plotting stack is not imported here,
+device discovery runs in a background thread after startup (`/health` reports
+``scanning``), and the duration of each startup phase is logged.
 
 Error responses are normalized through `http_error(...)` so GUI ViewModels can
 surface stable error codes/messages without parsing framework-native payloads.
 """
 
-import logging, os, uuid, threading, zipfile, io, pathlib, datetime, platform, subprocess, shutil
-from typing import Optional, Literal, Dict, List, Any
+import time
+
+_STARTUP_T0 = time.perf_counter()
+
+import logging, os, uuid, threading, pathlib, datetime, platform, subprocess, shutil
+from typing import Optional, Literal, Dict, List, Any, Set, Tuple
 from datetime import timezone
 import serial.tools.list_ports
 from fastapi import Body, FastAPI, HTTPException, Header, Request, Response, UploadFile, File
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.exception_handlers import request_validation_exception_handler
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from contextlib import asynccontextmanager
 import shlex  
 import nas_smb as nas  
 import asyncio
+import inspect
 import json
+import itertools
 import math
 import random
-import time
+import zlib
 from dataclasses import dataclass, asdict
+from functools import partial
 from fastapi import Query
 from fastapi.responses import StreamingResponse
 
@@ -51,30 +64,68 @@ from pyBEEP.controller import (
     connect_to_potentiostats,  # liefert List[PotentiostatController]
     PotentiostatController,
 )
-# Optional: use existing plot functions
-from pyBEEP.plotter import plot_cv_cycles, plot_time_series
-from progress_utils import compute_progress, estimate_planned_duration, utcnow_iso
+from progress_utils import compute_progress, estimate_planned_duration, parse_iso, utcnow_iso
 from validation import (
     ValidationResult,
     UnsupportedModeError,
     validate_mode_payload,
 )
 import storage
+import slot_scheduler
+import slot_workers
+import job_events
+import job_archive
+import live_stream
+import plot_pool
+import preview
+import sse_broadcast
+import run_archive
+import run_manifest
+import zip_stream
 from update_package import (
     PackageUpdateManager,
     UpdateApplyError,
     UpdatePackageError,
 )
 
+_STARTUP_IMPORTS_S = time.perf_counter() - _STARTUP_T0
+
 API_KEY = os.getenv("BOX_API_KEY", "")
 BOX_ID = os.getenv("BOX_ID", "")
 REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
 RUNS_ROOT = pathlib.Path(os.getenv("RUNS_ROOT", "/opt/box/runs"))
 RUNS_ROOT.mkdir(parents=True, exist_ok=True)
 storage.configure_runs_root(RUNS_ROOT)
+RUN_MANIFESTS = run_manifest.RunManifestStore(RUNS_ROOT)
 NAS_CONFIG_PATH = pathlib.Path(os.getenv("NAS_CONFIG_PATH", "/opt/box/nas_smb.json"))
 NAS = nas.NASManager(runs_root=RUNS_ROOT, config_path=NAS_CONFIG_PATH, logger=logging.getLogger("nas_smb"))
 UPDATES_ROOT = pathlib.Path(os.getenv("UPDATES_ROOT", "/opt/box/updates"))
+CAPTURE_FORMAT = (os.getenv("BOX_CAPTURE_FORMAT", "csv").strip().lower() or "csv")
+CAPTURE_SUFFIX = run_manifest.CAPTURE_SUFFIX
+# Acquisition blocks beyond the high-water mark spill to disk (pyBEEP SpillQueue);
+# keep them on the runs volume instead of a RAM-backed /tmp.
+SPILL_DIR = pathlib.Path(os.getenv("BOX_SPILL_DIR", str(RUNS_ROOT / ".spill")))
+SPILL_DIR.mkdir(parents=True, exist_ok=True)
+CONTROLLER_OPTIONS = {
+    "queue_high_water": int(os.getenv("BOX_QUEUE_HIGH_WATER", "4096")),  # pyBEEP's default
+    "spill_dir": str(SPILL_DIR),
+}
+SLOT_WORKERS_PROCESS = slot_workers.process_workers_enabled()
+LIVE_STREAMS = live_stream.LiveStreamHub(
+    points_per_s=float(os.getenv("BOX_LIVE_POINTS_PER_S", str(live_stream.DEFAULT_POINTS_PER_S))),
+    max_blocks=int(os.getenv("BOX_LIVE_BUFFER_BLOCKS", str(live_stream.DEFAULT_BUFFER_BLOCKS))),
+)
+PREVIEWS = preview.PreviewCache(
+    max_entries=int(os.getenv("BOX_PREVIEW_CACHE_ENTRIES", str(preview.DEFAULT_CACHE_ENTRIES))),
+)
+JOB_ARCHIVE = job_archive.JobArchive(RUNS_ROOT / "_job_archive.sqlite3")
+JOB_MEMORY_MAX = int(os.getenv("BOX_JOB_MEMORY_MAX", "200"))          # terminal jobs kept in memory
+JOB_MEMORY_AGE_S = float(os.getenv("BOX_JOB_MEMORY_AGE_S", "3600"))   # ... for at most this long after ending
+JOB_ARCHIVE_INTERVAL_S = 30.0
+JOB_PAGE_MAX = 1000
+JOB_PAGE_DEFAULT = min(max(int(os.getenv("BOX_JOB_PAGE_DEFAULT", "100")), 1), JOB_PAGE_MAX)  # /jobs?cursor= without ?limit=
+SHARED_STATE = job_archive.shared_state_from_env()  # mirror active jobs for `http_front` workers
+JOB_MIRROR_INTERVAL_S = 1.0
 
 RunStorageInfo = storage.RunStorageInfo
 RUN_DIRECTORY_LOCK = storage.RUN_DIRECTORY_LOCK
@@ -85,11 +136,16 @@ _sanitize_path_segment = storage.sanitize_path_segment
 _sanitize_optional_segment = storage.sanitize_optional_segment
 _sanitize_client_datetime = storage.sanitize_client_datetime
 _record_run_directory = storage.record_run_directory
+_record_run_directories = storage.record_run_directories
 _forget_run_directory = storage.forget_run_directory
 _resolve_run_directory = storage.resolve_run_directory
+_runs_for_group = storage.runs_for_group
+_release_cached_directories = storage.release_cached_directories
 configure_run_storage_root = storage.configure_runs_root
 
 API_VERSION = "1.0"
+# Optional endpoints advertised by /health so clients can pick them without probing.
+API_FEATURES = ("jobs.batch", "jobs.events", "runs.live")
 
 try:
     from seva.utils.logging import configure_root as _configure_logging, level_name as _level_name
@@ -295,46 +351,173 @@ class DeviceInfo(BaseModel):
 DEVICES: Dict[str, PotentiostatController] = {}   # slot -> controller
 DEV_META: Dict[str, DeviceInfo] = {}              # slot -> info
 DEVICE_SCAN_LOCK = threading.Lock()
+DEVICE_DISCOVERY_LOCK = threading.Lock()  # serializes scans; DEVICE_SCAN_LOCK only guards the registry swap
+DEVICE_SCAN_DONE = threading.Event()      # set once the first scan finished
+DEVICE_SCAN_STATE: Dict[str, Any] = {"scanning": False, "error": None, "duration_s": None}
+DEVICE_SCAN_WAIT_S = float(os.getenv("BOX_DEVICE_SCAN_WAIT_S", "30"))
 
 def discover_devices():
     """Scan connected potentiostats and refresh in-memory slot metadata.
-    
+
+    Ports are opened in parallel and outside `DEVICE_SCAN_LOCK`; the registry
+    is swapped under the lock once the scan finished, so `/health` and slot
+    lookups keep answering from the previous registry meanwhile.
+
     Parameters
     ----------
     None
         This callable does not receive explicit input parameters.
-    
+
     Returns
     -------
     Any
         Value returned to the caller or consumed by the route handler.
-    
+
     Notes
     -----
     Used by FastAPI routes and background slot worker orchestration.
-    
+
     Raises
     ------
     HTTPException
         Raises HTTPException when request data, auth, or storage resolution fails.
     """
+    with DEVICE_DISCOVERY_LOCK:
+        started = time.perf_counter()
+        DEVICE_SCAN_STATE["scanning"] = True
+        try:
+            _scan_devices()
+            DEVICE_SCAN_STATE["error"] = None
+        except ConnectionError as exc:
+            # No potentiostat attached: serve an empty registry instead of failing.
+            log.warning("Device scan found no potentiostats: %s", exc)
+            DEVICE_SCAN_STATE["error"] = str(exc)
+            with DEVICE_SCAN_LOCK:
+                stale = [ctrl for ctrl in DEVICES.values() if isinstance(ctrl, slot_workers.SlotWorker)]
+                DEVICES.clear()
+                DEV_META.clear()
+            for worker in stale:
+                worker.stop()
+        finally:
+            DEVICE_SCAN_STATE["scanning"] = False
+            DEVICE_SCAN_STATE["duration_s"] = round(time.perf_counter() - started, 3)
+            DEVICE_SCAN_DONE.set()
+        log.info("Device scan finished in %.2fs: %d device(s)", DEVICE_SCAN_STATE["duration_s"], len(DEVICES))
+
+
+def _scan_devices() -> None:
+    """Open all potentiostats and install them as slots (see `discover_devices`)."""
+    ports = {p.device: p for p in serial.tools.list_ports.comports()}
+
+    kept: Dict[str, slot_workers.SlotWorker] = {}
+    kept_meta: Dict[str, DeviceInfo] = {}
+    stale_workers: List[slot_workers.SlotWorker] = []
+    if SLOT_WORKERS_PROCESS:
+        # A live worker keeps its slot and its port is not opened again here:
+        # the worker owns it, and a failed second open must not cost the slot
+        # its worker (or interrupt a measurement in progress). Workers whose
+        # device is gone are replaced unless a run still uses their slot.
+        with DEVICE_SCAN_LOCK:
+            for slot, ctrl in DEVICES.items():
+                if not isinstance(ctrl, slot_workers.SlotWorker):
+                    continue
+                listed = ctrl.port in ports or ctrl.port.startswith("sim://")
+                if ctrl.is_alive() and (listed or slot in SLOT_RUNS):
+                    kept[slot] = ctrl
+                    if slot in DEV_META:
+                        kept_meta[slot] = DEV_META[slot]
+                else:
+                    stale_workers.append(ctrl)
+        # Release stale ports before they are opened again.
+        for worker in stale_workers:
+            worker.stop()
+
+    try:
+        controllers = connect_to_potentiostats(
+            skip_ports={worker.port for worker in kept.values()}, **CONTROLLER_OPTIONS
+        )
+    except ConnectionError:
+        if not kept:
+            raise
+        controllers = []
+
+    devices: Dict[str, Any] = {}
+    meta: Dict[str, DeviceInfo] = {}
+    # New devices take the lowest slot numbers not held by a kept worker.
+    free_slots = (f"slot{i:02d}" for i in itertools.count(1) if f"slot{i:02d}" not in kept)
+    for ctrl in controllers:
+        slot = next(free_slots)
+        devices[slot] = ctrl
+        try:
+            port_name = ctrl.device.device.serial.port
+            serial_info = ports.get(port_name)
+            serial_number = serial_info.serial_number if serial_info else None
+        except Exception:
+            port_name, serial_number = "<unknown>", None
+
+        meta[slot] = DeviceInfo(slot=slot, port=str(port_name), sn=serial_number)
+
+    if SLOT_WORKERS_PROCESS:
+        # Hand each new port over to a dedicated worker process that reopens it.
+        slot_ports: Dict[str, str] = {}
+        for slot, ctrl in devices.items():
+            try:
+                ctrl.device.device.serial.close()
+            except Exception:
+                pass
+            slot_ports[slot] = meta[slot].port
+        workers = slot_workers.start_workers(slot_ports, CONTROLLER_OPTIONS)
+        for slot in list(devices):
+            if slot in workers:
+                devices[slot] = workers[slot]
+            else:
+                devices.pop(slot)
+                meta.pop(slot)
+        devices.update(kept)
+        meta.update(kept_meta)
+        devices = dict(sorted(devices.items()))
+        meta = dict(sorted(meta.items()))
+
     with DEVICE_SCAN_LOCK:
         DEVICES.clear()
+        DEVICES.update(devices)
         DEV_META.clear()
-        controllers = connect_to_potentiostats()
-        ports = {p.device: p for p in serial.tools.list_ports.comports()}
+        DEV_META.update(meta)
+
+
+def _start_background_discovery() -> None:
+    """Run the startup device scan without holding up `/health`."""
+    DEVICE_SCAN_STATE["scanning"] = True
+    threading.Thread(target=_background_discovery, name="device-discovery", daemon=True).start()
+
+
+def _background_discovery() -> None:
+    try:
+        discover_devices()
+    except Exception:
+        log.exception("Startup device scan failed")
 
-        for i, ctrl in enumerate(controllers, start=1):
-            slot = f"slot{i:02d}"
-            DEVICES[slot] = ctrl
-            try:
-                port_name = ctrl.device.device.serial.port
-                serial_info = ports.get(port_name)
-                serial_number = serial_info.serial_number if serial_info else None
-            except Exception:
-                port_name, serial_number = "<unknown>", None
 
-            DEV_META[slot] = DeviceInfo(slot=slot, port=str(port_name), sn=serial_number)
+def _wait_for_device_scan() -> None:
+    """Block until the first device scan finished (bounded by `DEVICE_SCAN_WAIT_S`).
+
+    Lets slot lookups right after startup see the scanned devices instead of
+    an empty registry.
+    """
+    if not DEVICE_SCAN_DONE.is_set():
+        DEVICE_SCAN_DONE.wait(DEVICE_SCAN_WAIT_S)
+
+
+def _release_devices() -> None:
+    """Stop slot workers and close serial ports on shutdown."""
+    for ctrl in DEVICES.values():
+        if isinstance(ctrl, slot_workers.SlotWorker):
+            ctrl.stop()
+            continue
+        try:
+            ctrl.device.device.serial.close()
+        except Exception:
+            pass
 
 # ---------- Job models ----------
 class JobRequest (BaseModel):
@@ -358,6 +541,16 @@ class JobRequest (BaseModel):
     make_plot: bool = True
 
 
+class JobBatchRequest(BaseModel):
+    """Schema for `/jobs/batch`: several job requests started together.
+    
+    Notes
+    -----
+    Used by FastAPI routes to validate or serialize request and response payloads.
+    """
+    jobs: List[JobRequest] = Field(..., description="One entry per job, e.g. one per slot with its own modes/params")
+
+
 def _build_run_storage_info(req: JobRequest) -> RunStorageInfo:
     """Derive sanitized storage naming metadata from a job request.
     
@@ -404,7 +597,35 @@ def _build_run_storage_info(req: JobRequest) -> RunStorageInfo:
     )
 
 
-class SlotStatus(BaseModel):
+# Every JobStatus/SlotStatus mutation draws the next number; the state version of
+# a job is the highest number of the job and its slots. Numbering continues
+# after the archived jobs so `since_version` stays valid across restarts.
+_STATE_VERSIONS = itertools.count(JOB_ARCHIVE.max_version() + 1)
+
+
+_UNSET = object()
+
+
+class _VersionedModel(BaseModel):
+    """Base model that records a new state version whenever a field changes.
+
+    Assigning a field its current value keeps the version, so unchanged jobs
+    keep their ETag and publish no event.
+    """
+
+    _state_version: int = PrivateAttr(default_factory=lambda: next(_STATE_VERSIONS))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        changed = getattr(self, name, _UNSET) != value
+        super().__setattr__(name, value)
+        if changed:
+            self._state_version = next(_STATE_VERSIONS)
+
+
+class SlotStatus(_VersionedModel):
     """Schema for per-slot execution state inside a run.
     
     Notes
@@ -417,8 +638,11 @@ class SlotStatus(BaseModel):
     ended_at: Optional[str] = None
     message: Optional[str] = None
     files: List[str] = Field(default_factory=list)  # relative paths
+    queue: Optional[Dict[str, int]] = None  # acquisition queue depth/spill counters (/devices/status)
+    queue_position: Optional[int] = None  # 1 = next to start on this slot (queued slots only)
+    estimated_start_at: Optional[str] = None  # ISO timestamp, from planned durations of the runs ahead
 
-class JobStatus(BaseModel):
+class JobStatus(_VersionedModel):
     """Schema for full run status responses.
     
     Notes
@@ -429,7 +653,7 @@ class JobStatus(BaseModel):
     # For backward compatibility we use 'mode' as the *current* mode
     mode: str
     started_at: str
-    status: Literal["running", "done", "failed", "cancelled"]
+    status: Literal["queued", "running", "done", "failed", "cancelled"]
     ended_at: Optional[str] = None
     slots: List[SlotStatus]
     progress_pct: int = 0
@@ -437,6 +661,15 @@ class JobStatus(BaseModel):
     modes: List[str] = Field(default_factory=list)
     current_mode: Optional[str] = None
     remaining_modes: List[str] = Field(default_factory=list)
+    # While slots wait in their queues: best position / earliest estimated start among them
+    queue_position: Optional[int] = None
+    estimated_start_at: Optional[str] = None
+    # Grows with every job or slot change; see `since_version` on the status routes
+    version: int = 0
+
+    def state_version(self) -> int:
+        """Return the latest state version of the job and its slots."""
+        return max([self._state_version, *(slot._state_version for slot in self.slots)])
 
 
 class JobOverview(BaseModel):
@@ -462,15 +695,31 @@ class JobStatusBulkRequest(BaseModel):
     Used by FastAPI routes to validate or serialize request and response payloads.
     """
     run_ids: List[str] = Field(..., min_length=1, description="run_id list for bulk status lookup")
+    since_version: Optional[int] = Field(
+        None, description="Only return runs changed after this version (active runs are always returned)"
+    )
 
 JOBS: Dict[str, JobStatus] = {}            # run_id -> status
 JOB_LOCK = threading.Lock()
 SLOT_STATE_LOCK = threading.Lock()
-SLOT_RUNS: Dict[str, str] = {}             # slot -> run_id
+SLOT_RUNS: Dict[str, str] = {}             # slot -> run_id (running)
+SLOT_SCHEDULER = slot_scheduler.SlotScheduler()  # per-slot FIFO of submitted runs
 JOB_META: Dict[str, Dict[str, Any]] = {}   # run_id -> metadata bag
 JOB_GROUP_IDS: Dict[str, str] = {}         # run_id -> provided group identifier (raw)
 JOB_GROUP_FOLDERS: Dict[str, str] = {}     # run_id -> sanitized storage folder name
+JOB_RUN_DIRS: Dict[str, pathlib.Path] = {}  # run_id -> output directory
 CANCEL_FLAGS: Dict[str, threading.Event] = {}  # run_id -> cancel flag
+JOB_SNAPSHOTS: Dict[str, "_SnapshotEntry"] = {}  # run_id -> snapshot cached per state version
+TERMINAL_STATES = ("done", "failed", "cancelled")
+JOB_EVENTS = job_events.JobEventLog()  # bounded log behind /jobs/events
+PENDING_PLOTS: Dict[str, int] = {}         # run_id -> PNGs still queued/rendering (JOB_LOCK)
+PLOT_POOL = plot_pool.PlotPool(
+    workers=plot_pool.workers_from_env(),
+    defer_while_busy=plot_pool.defer_from_env(),
+    is_busy=lambda: bool(SLOT_RUNS),
+)
+JOB_EVENT_PROGRESS_TICK_S = 1.0
+JOB_EVENT_PING_S = 15.0
 
 
 def record_job_meta(run_id: str, mode: str, params: Dict[str, Any]) -> None:
@@ -512,44 +761,6 @@ def _normalize_group_value(value: Optional[str]) -> Optional[str]:
     return trimmed or None
 
 
-def _derive_group_folder(run_id: str) -> Optional[str]:
-    """Infer the storage group folder from a run identifier.
-    
-    Parameters
-    ----------
-    run_id : str
-        Value supplied by the API caller or internal orchestration.
-    
-    Returns
-    -------
-    Optional[str]
-        Value returned to the caller or consumed by the route handler.
-    
-    Notes
-    -----
-    Used by FastAPI routes and background slot worker orchestration.
-    
-    Raises
-    ------
-    HTTPException
-        Raises HTTPException when request data, auth, or storage resolution fails.
-    """
-    try:
-        run_dir = _resolve_run_directory(run_id)
-    except HTTPException:
-        return None
-    except Exception:
-        return None
-    try:
-        relative = run_dir.relative_to(RUNS_ROOT)
-    except Exception:
-        return None
-    parts = relative.parts
-    if len(parts) >= 3:
-        return parts[-2]
-    return None
-
-
 def _job_overview_status(job: JobStatus) -> Literal["queued", "running", "done", "failed", "cancelled"]:
     """Compute list-level status semantics from per-slot states.
     
@@ -589,44 +800,174 @@ def job_snapshot(job: JobStatus) -> JobStatus:
     Returns
     -------
     JobStatus
-        Value returned to the caller or consumed by the route handler.
+        Value returned to the caller or consumed by the route handler. The
+        snapshot is shared with the snapshot cache and must not be mutated.
     
     Notes
     -----
-    Used by FastAPI routes and background slot worker orchestration.
+    Must be called with ``JOB_LOCK`` held. Used by FastAPI routes and
+    background slot worker orchestration.
     
     Raises
     ------
     HTTPException
         Raises HTTPException when request data, auth, or storage resolution fails.
     """
-    copy = job.model_copy(deep=True)
+    return _snapshot_entry(job).snapshot
+
+
+@dataclass
+class _SnapshotEntry:
+    """Cached snapshot of one job at one state version."""
+
+    version: int
+    base: JobStatus
+    slot_payload: List[Dict[str, Any]]
+    snapshot: Optional[JobStatus] = None
+    dynamic_key: Optional[tuple] = None
+    published: bool = False
+    _body: Optional[bytes] = None
+
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = self.snapshot.model_dump_json().encode("utf-8")
+        return self._body
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}-{zlib.crc32(self.body):08x}"'
+
+
+def _snapshot_entry(job: JobStatus) -> _SnapshotEntry:
+    """Return the cached snapshot of ``job``, rebuilding only what changed.
+
+    The deep copy is taken once per state version. Progress, remaining time
+    and queue estimates still advance with the clock while a job is active,
+    so they are recomputed on each call and the snapshot is replaced only
+    when one of them changed. Terminal snapshots are returned as cached.
+    """
+    version = job.state_version()
+    entry = JOB_SNAPSHOTS.get(job.run_id)
+    if entry is None or entry.version != version:
+        base = job.model_copy(deep=True)
+        base.version = version
+        entry = _SnapshotEntry(
+            version=version,
+            base=base,
+            slot_payload=[slot.model_dump() for slot in base.slots],
+        )
+        JOB_SNAPSHOTS[job.run_id] = entry
+    elif entry.snapshot is not None and entry.base.status in TERMINAL_STATES:
+        return entry
 
+    base = entry.base
     # only create/retain meta while the job is running
-    meta = JOB_META.get(copy.run_id)
-    if meta is None and copy.status == "running":
-        meta = JOB_META[copy.run_id] = {"mode": copy.mode, "params": {}}
+    meta = JOB_META.get(base.run_id)
+    if meta is None and base.status == "running":
+        meta = JOB_META[base.run_id] = {"mode": base.mode, "params": {}}
     elif meta is None:
-        meta = {"mode": copy.mode, "params": {}}
+        meta = {"mode": base.mode, "params": {}}
 
     params = meta.get("params") if isinstance(meta.get("params"), dict) else {}
     planned = meta.get("planned_duration_s")
     if planned is None:
-        planned = estimate_planned_duration(meta.get("mode") or copy.mode, params)
+        planned = estimate_planned_duration(meta.get("mode") or base.mode, params)
         # store planned only for running jobs to avoid re-populating after cleanup
-        if copy.status == "running":
+        if base.status == "running":
             meta["planned_duration_s"] = planned
 
-    slot_payload = [slot.model_dump() for slot in copy.slots]
     metrics = compute_progress(
-        status=copy.status,
-        slots=slot_payload,
-        started_at=copy.started_at,
+        status=base.status,
+        slots=entry.slot_payload,
+        started_at=base.started_at,
         planned_duration_s=planned,
     )
-    copy.progress_pct = metrics.get("progress_pct") or 0
-    copy.remaining_s = metrics.get("remaining_s")
-    return copy
+    estimates = _queue_estimates(base)
+    dynamic_key = (
+        metrics.get("progress_pct") or 0,
+        metrics.get("remaining_s"),
+        tuple((slot, e.position, e.estimated_start_at) for slot, e in sorted(estimates.items())),
+    )
+    if entry.snapshot is None or dynamic_key != entry.dynamic_key:
+        snapshot = base.model_copy(
+            update={
+                "progress_pct": dynamic_key[0],
+                "remaining_s": dynamic_key[1],
+                "slots": [slot.model_copy() for slot in base.slots],
+            }
+        )
+        _apply_queue_estimates(snapshot, estimates)
+        entry.snapshot = snapshot
+        entry.dynamic_key = dynamic_key
+        entry._body = None
+    return entry
+
+
+def _publish_job_locked(job: Optional[JobStatus]) -> None:
+    """Publish the job snapshot to `/jobs/events` once per state version."""
+    if job is None:
+        return
+    entry = _snapshot_entry(job)
+    if entry.published:
+        return
+    entry.published = True
+    JOB_EVENTS.publish("job", job.run_id, _job_group_key(job.run_id), entry.body.decode("utf-8"))
+    JOB_MIRROR_WAKE.set()
+
+
+def _publish_files(run_id: str, slot: str, files: List[str]) -> None:
+    """Publish a ``files`` event for outputs a finished step has written."""
+    if not files:
+        return
+    with JOB_LOCK:
+        group = _job_group_key(run_id)
+    payload = json.dumps({"run_id": run_id, "slot": slot, "files": files}, separators=(",", ":"))
+    JOB_EVENTS.publish("files", run_id, group, payload)
+
+
+def _job_group_key(run_id: str) -> Optional[str]:
+    """Lower-cased group id of a run for event filtering."""
+    group = JOB_GROUP_IDS.get(run_id)
+    return group.lower() if group else None
+
+
+def _queue_estimates(job: JobStatus) -> Dict[str, slot_scheduler.QueueEstimate]:
+    """Queue position and estimated start per queued slot, from the slot scheduler."""
+    estimates: Dict[str, slot_scheduler.QueueEstimate] = {}
+    for slot in job.slots:
+        if slot.status != "queued":
+            continue
+        estimate = SLOT_SCHEDULER.estimate(slot.slot, job.run_id)
+        if estimate is not None:
+            estimates[slot.slot] = estimate
+    return estimates
+
+
+def _apply_queue_estimates(job: JobStatus, estimates: Dict[str, slot_scheduler.QueueEstimate]) -> None:
+    """Fill queue position and estimated start of queued slots."""
+    for slot in job.slots:
+        estimate = estimates.get(slot.slot)
+        if estimate is None:
+            continue
+        slot.queue_position = estimate.position
+        slot.estimated_start_at = estimate.estimated_start_at
+    if not estimates:
+        return
+    job.queue_position = min(e.position for e in estimates.values())
+    starts = [e.estimated_start_at for e in estimates.values() if e.estimated_start_at]
+    job.estimated_start_at = min(starts) if starts else None
+
+
+def _planned_sequence_duration(req: "JobRequest") -> Optional[float]:
+    """Planned duration of all modes of a request, or ``None`` if any is unknown."""
+    total = 0.0
+    for mode in req.modes or []:
+        planned = estimate_planned_duration(mode, dict(req.params_by_mode.get(mode, {}) or {}))
+        if planned is None:
+            return None
+        total += planned
+    return total
 
 
 # ---------- Startup ----------
@@ -653,19 +994,38 @@ async def lifespan(app: FastAPI):
     HTTPException
         Raises HTTPException when request data, auth, or storage resolution fails.
     """
-    discover_devices()
+    init_done = time.perf_counter()
+    _start_background_discovery()
+    archive_stop = threading.Event()
+    threading.Thread(target=_job_archive_loop, args=(archive_stop,), name="job-archive", daemon=True).start()
+    if SHARED_STATE:
+        _fail_interrupted_jobs()
+        threading.Thread(target=_job_mirror_loop, args=(archive_stop,), name="job-mirror", daemon=True).start()
     try:
         NAS.start_background()
     except Exception:
         log.exception("Failed to start NAS background tasks")
+    nas_done = time.perf_counter()
+    log.info(
+        "Startup timing: imports=%.2fs init=%.2fs nas=%.2fs ready=%.2fs (device scan in background)",
+        _STARTUP_IMPORTS_S,
+        init_done - _STARTUP_T0 - _STARTUP_IMPORTS_S,
+        nas_done - init_done,
+        nas_done - _STARTUP_T0,
+    )
     try:
         yield
     finally:
-        for ctrl in DEVICES.values():
-            try:
-                ctrl.device.device.serial.close()
-            except Exception:
-                pass
+        archive_stop.set()
+        JOB_MIRROR_WAKE.set()
+        try:
+            if SHARED_STATE:
+                _mirror_jobs()
+            _archive_jobs(flush=True)
+        except Exception:
+            log.exception("Failed to archive finished jobs on shutdown")
+        PLOT_POOL.shutdown()
+        _release_devices()
 
 app = FastAPI(title="Potentiostat Box API", version=API_VERSION, lifespan=lifespan)
 # TODO(metrics): optional Prometheus /metrics exporter (future)
@@ -977,7 +1337,7 @@ def version_info() -> Dict[str, str]:
 # ---------- Health / Devices / Modes ----------
 @app.get("/health")
 def health(x_api_key: Optional[str] = Header(None)):
-    """Return service health and discovered-device count.
+    """Return service health, discovered-device count and optional API features.
     
     Parameters
     ----------
@@ -1002,7 +1362,13 @@ def health(x_api_key: Optional[str] = Header(None)):
         return auth_error
     with DEVICE_SCAN_LOCK:
         device_count = len(DEVICES)
-    return {"ok": True, "devices": device_count, "box_id": BOX_ID}
+    return {
+        "ok": True,
+        "devices": device_count,
+        "scanning": DEVICE_SCAN_STATE["scanning"],
+        "box_id": BOX_ID,
+        "features": list(API_FEATURES),
+    }
 
 @app.get("/devices")
 def list_devices(x_api_key: Optional[str] = Header(None)):
@@ -1029,6 +1395,7 @@ def list_devices(x_api_key: Optional[str] = Header(None)):
     """
     if auth_error := require_key(x_api_key):
         return auth_error
+    _wait_for_device_scan()
     with DEVICE_SCAN_LOCK:
         slots = sorted(DEV_META.keys())
         return {
@@ -1040,6 +1407,8 @@ def list_devices(x_api_key: Optional[str] = Header(None)):
 @app.get("/devices/status", response_model=List[SlotStatus])
 def list_device_status(x_api_key: Optional[str] = Header(None)) -> List[SlotStatus]:
     """Return per-slot runtime state derived from active jobs.
+
+    Running slots also report the acquisition queue depth and disk-spill counters.
     
     Parameters
     ----------
@@ -1062,6 +1431,7 @@ def list_device_status(x_api_key: Optional[str] = Header(None)) -> List[SlotStat
     """
     if auth_error := require_key(x_api_key):
         return auth_error
+    _wait_for_device_scan()
     with DEVICE_SCAN_LOCK:
         slots = sorted(DEV_META.keys())
 
@@ -1087,6 +1457,17 @@ def list_device_status(x_api_key: Optional[str] = Header(None)) -> List[SlotStat
                 results.append(slot_status.model_copy(deep=True))
             else:
                 results.append(SlotStatus(slot=slot, status="idle"))
+
+    for entry in results:
+        if entry.status != "running":
+            continue
+        ctrl = DEVICES.get(entry.slot)
+        get_stats = getattr(ctrl, "get_queue_stats", None)
+        if callable(get_stats):
+            try:
+                entry.queue = get_stats()
+            except Exception:
+                log.debug("Queue stats unavailable for %s", entry.slot, exc_info=True)
     return results
 
 @app.get("/modes")
@@ -1221,8 +1602,20 @@ def _update_job_status_locked(job: Optional[JobStatus]) -> None:
     """
     if not job:
         return
+    try:
+        _recompute_job_status_locked(job)
+    finally:
+        _publish_job_locked(job)
 
+
+def _recompute_job_status_locked(job: JobStatus) -> None:
+    """Aggregate slot states into the job state; see `_update_job_status_locked`."""
+    was_terminal = job.status in ("done", "failed", "cancelled")
     statuses = [slot.status for slot in job.slots]
+    if statuses and all(state == "queued" for state in statuses):
+        job.status = "queued"
+        job.ended_at = None
+        return
     if any(state in ("queued", "running") for state in statuses):
         job.status = "running"
         job.ended_at = None
@@ -1234,10 +1627,24 @@ def _update_job_status_locked(job: Optional[JobStatus]) -> None:
         job.status = "cancelled"
     else:
         job.status = "done"
-    job.ended_at = utcnow_iso()
+    if not was_terminal or job.ended_at is None:
+        job.ended_at = utcnow_iso()
     #drop transient meta once job is terminal
     JOB_META.pop(job.run_id, None)
     CANCEL_FLAGS.pop(job.run_id, None)
+    if PENDING_PLOTS.get(job.run_id):
+        # Archive and upload once the queued PNGs exist (see `_plot_finished`).
+        return
+    _finish_run_outputs_locked(job, was_terminal)
+
+
+def _finish_run_outputs_locked(job: JobStatus, was_terminal: bool) -> None:
+    """Prebuild the archive and queue the NAS upload of a terminal run."""
+    run_dir = JOB_RUN_DIRS.get(job.run_id)
+    if not was_terminal and run_dir is not None and not _run_dir_writers_locked(run_dir):
+        # Last job of the run directory (e.g. last well of a plate) finished.
+        RUN_MANIFESTS.schedule(run_dir)
+        RUN_ARCHIVES.schedule(run_dir)
     # NEW: enqueue upload only for 'done' (not for failed/cancelled)
     if job.status == "done":
         try:
@@ -1246,6 +1653,166 @@ def _update_job_status_locked(job: Optional[JobStatus]) -> None:
             log.exception("Failed to enqueue NAS upload for run_id=%s", job.run_id)
 
 
+def _run_dir_writers_locked(run_dir: pathlib.Path) -> List[str]:
+    """Jobs still writing into ``run_dir``: not terminal yet or PNGs pending (call under `JOB_LOCK`)."""
+    return [
+        run_id
+        for run_id, job_dir in JOB_RUN_DIRS.items()
+        if job_dir == run_dir
+        and run_id in JOBS
+        and (JOBS[run_id].status not in TERMINAL_STATES or PENDING_PLOTS.get(run_id))
+    ]
+
+
+def _archive_jobs(flush: bool = False) -> int:
+    """Move finished jobs from the in-memory job table to `JOB_ARCHIVE`.
+
+    A terminal job is archived once it ended more than `JOB_MEMORY_AGE_S` ago,
+    or (oldest first) while more than `JOB_MEMORY_MAX` terminal jobs are in
+    memory; ``flush`` archives all of them. Jobs whose PNGs are still
+    rendering stay. Rows are written before the jobs leave memory, so lookups
+    always find a job in one of the two places.
+
+    Returns
+    -------
+    int
+        Number of jobs moved.
+    """
+    with SLOT_STATE_LOCK:
+        busy = set(SLOT_RUNS.values())
+    cutoff = datetime.datetime.now(timezone.utc) - datetime.timedelta(seconds=JOB_MEMORY_AGE_S)
+    with JOB_LOCK:
+        finished = [
+            job
+            for run_id, job in JOBS.items()
+            if job.status in TERMINAL_STATES and not PENDING_PLOTS.get(run_id) and run_id not in busy
+        ]
+        finished.sort(key=lambda job: (job.ended_at or "", job.run_id))
+        excess = len(finished) - JOB_MEMORY_MAX
+        selected: List[_SnapshotEntry] = []
+        rows: List[job_archive.ArchivedJob] = []
+        for index, job in enumerate(finished):
+            ended = parse_iso(job.ended_at)
+            if flush or index < excess or ended is None or ended < cutoff:
+                entry = _snapshot_entry(job)
+                selected.append(entry)
+                rows.append(_archive_row(entry, JOB_GROUP_IDS.get(job.run_id), JOB_GROUP_FOLDERS.get(job.run_id)))
+    if not selected:
+        return 0
+
+    JOB_ARCHIVE.store(rows)
+
+    moved: List[str] = []
+    with JOB_LOCK:
+        for entry in selected:
+            run_id = entry.base.run_id
+            job = JOBS.get(run_id)
+            if job is None or job.state_version() != entry.version:
+                continue  # changed meanwhile; the next pass archives it again
+            JOBS.pop(run_id, None)
+            JOB_SNAPSHOTS.pop(run_id, None)
+            JOB_GROUP_IDS.pop(run_id, None)
+            JOB_GROUP_FOLDERS.pop(run_id, None)
+            JOB_RUN_DIRS.pop(run_id, None)
+            JOB_META.pop(run_id, None)
+            CANCEL_FLAGS.pop(run_id, None)
+            moved.append(run_id)
+    _release_cached_directories(moved)
+    if moved:
+        log.info("Archived %d finished job(s)", len(moved))
+    return len(moved)
+
+
+def _archive_row(entry: _SnapshotEntry, group_id: Optional[str], folder: Optional[str]) -> job_archive.ArchivedJob:
+    """Job store row of a snapshot (call with ``JOB_LOCK`` held; the body is built lazily)."""
+    base = entry.base
+    group_id = _normalize_group_value(group_id)
+    folder = _normalize_group_value(folder)
+    return job_archive.ArchivedJob(
+        run_id=base.run_id,
+        mode=base.mode,
+        status=_job_overview_status(base),
+        started_at=base.started_at,
+        ended_at=base.ended_at,
+        devices=[slot.slot for slot in base.slots],
+        group_key=group_id.lower() if group_id else None,
+        folder_key=folder.lower() if folder else None,
+        version=entry.version,
+        body=entry.body,
+    )
+
+
+def _job_archive_loop(stop: threading.Event) -> None:
+    """Archive finished jobs every `JOB_ARCHIVE_INTERVAL_S` until ``stop`` is set."""
+    while not stop.wait(JOB_ARCHIVE_INTERVAL_S):
+        try:
+            _archive_jobs()
+        except Exception:
+            log.exception("Job archive pass failed")
+
+
+JOB_MIRROR_LOCK = threading.Lock()
+JOB_MIRROR_WAKE = threading.Event()
+_MIRRORED_ETAGS: Dict[str, str] = {}  # run_id -> ETag last written to the job store (JOB_MIRROR_LOCK)
+
+
+def _mirror_jobs() -> None:
+    """Write the snapshots of in-memory jobs that changed to the job store.
+
+    Only used with ``BOX_SHARED_STATE``: the `http_front` workers answer status
+    reads from the store, so it follows every state change and, for active
+    jobs, the progress fields.
+    """
+    with JOB_MIRROR_LOCK:
+        with JOB_LOCK:
+            changed: Dict[str, str] = {}
+            rows: List[job_archive.ArchivedJob] = []
+            for run_id, job in JOBS.items():
+                entry = _snapshot_entry(job)
+                if _MIRRORED_ETAGS.get(run_id) != entry.etag:
+                    changed[run_id] = entry.etag
+                    rows.append(_archive_row(entry, JOB_GROUP_IDS.get(run_id), JOB_GROUP_FOLDERS.get(run_id)))
+            gone = [run_id for run_id in _MIRRORED_ETAGS if run_id not in JOBS]
+        JOB_ARCHIVE.store(rows)
+        _MIRRORED_ETAGS.update(changed)
+        for run_id in gone:
+            _MIRRORED_ETAGS.pop(run_id, None)
+
+
+def _job_mirror_loop(stop: threading.Event) -> None:
+    """Mirror job changes right after they are published, and progress every `JOB_MIRROR_INTERVAL_S`."""
+    while not stop.is_set():
+        JOB_MIRROR_WAKE.wait(JOB_MIRROR_INTERVAL_S)
+        JOB_MIRROR_WAKE.clear()
+        try:
+            _mirror_jobs()
+        except Exception:
+            log.exception("Job mirror pass failed")
+
+
+def _fail_interrupted_jobs() -> None:
+    """Mark jobs left queued or running in the job store by a previous process as failed."""
+    rows = []
+    for archived in JOB_ARCHIVE.active():
+        job = JobStatus.model_validate_json(archived.body)
+        ended_at = utcnow_iso()
+        for slot in job.slots:
+            if slot.status in ("queued", "running"):
+                slot.status = "failed"
+                slot.ended_at = ended_at
+                slot.message = "interrupted: acquisition process restarted"
+        job.status = "failed"
+        job.ended_at = ended_at
+        job.progress_pct = 100
+        job.remaining_s = 0
+        job.version = job.state_version()
+        entry = _SnapshotEntry(version=job.version, base=job, slot_payload=[], snapshot=job)
+        rows.append(_archive_row(entry, archived.group_key, archived.folder_key))
+    JOB_ARCHIVE.store(rows)
+    if rows:
+        log.warning("Marked %d interrupted job(s) as failed", len(rows))
+
+
 def _request_controller_abort(ctrl: PotentiostatController) -> None:
     """Best effort attempt to stop a running measurement on the controller."""
     for attr in (
@@ -1275,6 +1842,133 @@ def _request_controller_abort(ctrl: PotentiostatController) -> None:
     except Exception:
         pass
 
+def _capture_kwargs() -> Dict[str, Any]:
+    """Return `apply_measurement` keyword arguments for the configured capture format.
+
+    The keyword is only sent for binary captures so the default CSV path keeps
+    working with pyBEEP builds that predate `capture_format`.
+    """
+    if CAPTURE_FORMAT == "binary":
+        return {"capture_format": "binary"}
+    return {}
+
+
+def _live_sink(ctrl, run_id: str, slot: str, mode: str) -> Optional[live_stream.LiveSink]:
+    """Return the `/runs/{run_id}/live` sink for one measurement, if the controller takes one.
+
+    pyBEEP builds that predate ``live_sink`` simply run without live output.
+    """
+    if not LIVE_STREAMS.enabled:
+        return None
+    try:
+        parameters = inspect.signature(ctrl.apply_measurement).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if not any(p.name == "live_sink" or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
+    return LIVE_STREAMS.sink(run_id, slot, mode)
+
+
+def _ensure_csv(csv_path: pathlib.Path) -> bool:
+    """Materialize a measurement CSV from its binary capture when only the capture exists.
+
+    Parameters
+    ----------
+    csv_path : pathlib.Path
+        Nominal CSV path of one measurement.
+
+    Returns
+    -------
+    bool
+        ``True`` when the CSV exists after the call.
+    """
+    if csv_path.is_file():
+        return True
+    if not csv_path.with_suffix(CAPTURE_SUFFIX).is_dir():
+        return False
+    try:
+        from pyBEEP.capture import ensure_csv
+    except ImportError:
+        log.warning("Binary capture found but pyBEEP.capture is unavailable: %s", csv_path)
+        return False
+    try:
+        return bool(ensure_csv(str(csv_path)))
+    except Exception:
+        log.exception("Failed to convert binary capture to CSV: %s", csv_path)
+        return False
+
+
+def _queue_plot(run_id: str, run_dir: pathlib.Path, slot_status: SlotStatus, csv_path: pathlib.Path, mode: str, cycles: Optional[int]) -> None:
+    """Queue the standard PNG of a measurement on `PLOT_POOL`.
+
+    The slot does not wait for it: `_plot_finished` adds the PNG to the slot's
+    files, and the run's archive and NAS upload wait until its plots are done.
+    """
+    source = preview.measurement_path(csv_path.parent)
+    if source is None:
+        return
+    with JOB_LOCK:
+        PENDING_PLOTS[run_id] = PENDING_PLOTS.get(run_id, 0) + 1
+    task = plot_pool.PlotTask(
+        run_id=run_id,
+        slot=slot_status.slot,
+        source=str(source),
+        png_path=str(csv_path.with_suffix(".png")),
+        mode=mode,
+        cycles=cycles,
+    )
+    PLOT_POOL.submit(task, partial(_plot_finished, run_dir, slot_status))
+
+
+def _plot_finished(
+    run_dir: pathlib.Path,
+    slot_status: SlotStatus,
+    task: "plot_pool.PlotTask",
+    written: Optional[Tuple[int, str]],
+) -> None:
+    """Attach a rendered PNG to its slot and release the run's pending outputs."""
+    run_id = task.run_id
+    rel_path: Optional[str] = None
+    if written:
+        png_path = pathlib.Path(task.png_path)
+        try:
+            RUN_MANIFESTS.record(run_dir, png_path.parent, digests={str(png_path): written})
+            rel_path = png_path.relative_to(run_dir).as_posix()
+        except Exception:
+            log.exception("Failed to record plot run_id=%s path=%s", run_id, png_path)
+    with JOB_LOCK:
+        remaining = PENDING_PLOTS.get(run_id, 1) - 1
+        if remaining > 0:
+            PENDING_PLOTS[run_id] = remaining
+        else:
+            PENDING_PLOTS.pop(run_id, None)
+        job = JOBS.get(run_id)
+        if rel_path and rel_path not in slot_status.files:
+            slot_status.files = sorted([*slot_status.files, rel_path])
+            if job:
+                _publish_job_locked(job)
+        if job and remaining <= 0 and job.status in TERMINAL_STATES:
+            _finish_run_outputs_locked(job, was_terminal=False)
+    if rel_path:
+        _publish_files(run_id, task.slot, [rel_path])
+
+
+def _mode_folder_files(
+    run_id: str,
+    folder: pathlib.Path,
+    run_dir: pathlib.Path,
+    digests: Optional[Dict[str, Tuple[int, str]]] = None,
+) -> List[str]:
+    """Record one mode folder in the run manifest and list its output files.
+
+    ``digests`` are the sizes and sha256 the measurement logger computed while
+    writing. Binary captures are reported under their CSV name because
+    `/runs/{run_id}/file` converts them on demand.
+    """
+    RUN_MANIFESTS.record(run_dir, folder, digests=digests)
+    return RUN_MANIFESTS.files(run_dir, folder)
+
+
 def _run_slot_sequence(
     run_id: str,
     run_dir: pathlib.Path,
@@ -1283,29 +1977,41 @@ def _run_slot_sequence(
     slot_status: SlotStatus,
     storage: RunStorageInfo,
 ):
-    """Runs the 'modes' list sequentially. Each measurement writes to its own mode subfolder."""
-    ctrl = DEVICES[slot]
+    """Runs the 'modes' list sequentially. Each measurement writes to its own mode subfolder.
+
+    Called by the slot's scheduler worker once the runs queued ahead have finished.
+    """
+    with JOB_LOCK:
+        if slot_status.status != "queued":
+            # Cancelled while waiting in the slot queue.
+            return
+        ctrl = DEVICES.get(slot)
+        if ctrl is None:
+            slot_status.status = "failed"
+            slot_status.message = "device unavailable"
+            slot_status.started_at = slot_status.started_at or utcnow_iso()
+            slot_status.ended_at = utcnow_iso()
+            _update_job_status_locked(JOBS.get(run_id))
+            return
+        cancel_event = CANCEL_FLAGS.setdefault(run_id, threading.Event())
+    with SLOT_STATE_LOCK:
+        SLOT_RUNS[slot] = run_id
     slot_segment = _sanitize_path_segment(slot, "slot")
-    cancel_event = CANCEL_FLAGS.setdefault(run_id, threading.Event())
 
-    def _eval_plot(csv_path: pathlib.Path, mode: str, params: Dict[str, Any]) -> List[str]:
-        """Generate optional plot artifact and return sorted relative output file list."""
+    def _eval_plot(
+        csv_path: pathlib.Path, mode: str, params: Dict[str, Any], digests: Dict[str, Tuple[int, str]]
+    ) -> List[str]:
+        """Queue the optional plot artifact and return sorted relative output file list."""
         files: List[str] = []
         try:
-            if req.make_plot:
-                png_path = csv_path.with_suffix(".png")
-                if (mode or "").upper() == "CV":
-                    plot_cv_cycles(str(csv_path), figpath=str(png_path), show=False, cycles=params.get("cycles"))
-                else:
-                    plot_time_series(str(csv_path), figpath=str(png_path), show=False)
-            folder = csv_path.parent
-            files = [str(p.relative_to(run_dir)) for p in folder.iterdir() if p.is_file()]
+            files = _mode_folder_files(run_id, csv_path.parent, run_dir, digests)
         except Exception:
+            files = []
+        if req.make_plot:
             try:
-                folder = csv_path.parent
-                files = [str(p.relative_to(run_dir)) for p in folder.iterdir() if p.is_file()]
+                _queue_plot(run_id, run_dir, slot_status, csv_path, mode, params.get("cycles"))
             except Exception:
-                files = []
+                log.exception("Failed to queue plot run_id=%s slot=%s mode=%s", run_id, slot, mode)
         return sorted(files)
 
     # Set slot to running initially (consistent)
@@ -1313,10 +2019,13 @@ def _run_slot_sequence(
         slot_status.status = "running"
         slot_status.started_at = slot_status.started_at or utcnow_iso()
         slot_status.message = None
+        slot_status.queue_position = None
+        slot_status.estimated_start_at = None
         job = JOBS.get(run_id)
         if job:
             job.status = "running"
             job.ended_at = None
+        _publish_job_locked(job)
 
     files_collected: List[str] = []
     error: Optional[str] = None
@@ -1335,6 +2044,7 @@ def _run_slot_sequence(
                     job.current_mode = mode
                     job.modes = list(req.modes or [])
                     job.remaining_modes = list(req.modes[idx + 1:])
+                    _publish_job_locked(job)
 
             # Per-mode folders/filenames
             mode_segment = _sanitize_path_segment(mode, "mode")
@@ -1347,20 +2057,31 @@ def _run_slot_sequence(
 
             # Measurement with abort window in background thread
             measurement_error: Optional[Exception] = None
+            digests: Dict[str, Tuple[int, str]] = {}
+            live_sink = _live_sink(ctrl, run_id, slot, mode)
+            try:
+                RUN_MANIFESTS.begin(run_dir, mode_dir / filename)
+            except Exception:
+                log.exception("Failed to mark run file run_id=%s slot=%s mode=%s", run_id, slot, mode)
             def _runner():
                 """Run one mode measurement and capture exceptions for outer thread."""
-                nonlocal measurement_error
+                nonlocal measurement_error, digests
                 try:
-                    ctrl.apply_measurement(
+                    digests = ctrl.apply_measurement(
                         mode=mode,
                         params=params,
                         tia_gain=req.tia_gain,
                         sampling_interval=req.sampling_interval,
                         filename=filename,
                         folder=str(mode_dir),
-                    )
+                        **_capture_kwargs(),
+                        **({"live_sink": live_sink} if live_sink is not None else {}),
+                    ) or {}
                 except Exception as exc:
                     measurement_error = exc
+                finally:
+                    if live_sink is not None:
+                        live_sink.flush()
 
             t = threading.Thread(target=_runner, name=f"{run_id}-{slot}-{mode}", daemon=True)
             t.start()
@@ -1382,11 +2103,21 @@ def _run_slot_sequence(
 
             # Collect files, advance status
             csv_path = mode_dir / filename
-            files_collected.extend(_eval_plot(csv_path, mode, params))
+            mode_files = _eval_plot(csv_path, mode, params, digests)
+            files_collected.extend(mode_files)
+            _publish_files(run_id, slot, mode_files)
 
     except Exception as exc:
         error = str(exc)
 
+    if error:
+        # Partial output of the interrupted mode still belongs in the manifest
+        # (and is no longer being written).
+        try:
+            RUN_MANIFESTS.record(run_dir, run_dir / "Wells" / slot_segment)
+        except Exception:
+            log.exception("Failed to record run files run_id=%s slot=%s", run_id, slot)
+
     # Slot/JOB finalisieren
     with JOB_LOCK:
         if error == "cancelled":
@@ -1400,7 +2131,8 @@ def _run_slot_sequence(
             slot_status.message = None
 
         slot_status.ended_at = utcnow_iso()
-        slot_status.files = sorted(files_collected)
+        # Plots that finished already were attached by `_plot_finished`.
+        slot_status.files = sorted(set(files_collected) | set(slot_status.files or []))
 
         job = JOBS.get(run_id)
         if job:
@@ -1409,10 +2141,14 @@ def _run_slot_sequence(
             if job.status in ("done", "failed", "cancelled"):
                 job.current_mode = None
                 job.remaining_modes = []
-                
+                _publish_job_locked(job)
+
+    LIVE_STREAMS.finish(run_id, slot)
     with SLOT_STATE_LOCK:
         if SLOT_RUNS.get(slot) == run_id:
             del SLOT_RUNS[slot]
+    # Deferred plots may start once no slot is acquiring.
+    PLOT_POOL.poke()
 
 
 def _run_one_slot(
@@ -1470,6 +2206,7 @@ def _run_one_slot(
                 sampling_interval=req.sampling_interval,
                 filename=filename,
                 folder=str(slot_dir),
+                **_capture_kwargs(),
             )
         except Exception as exc:
             measurement_error = exc
@@ -1500,26 +2237,19 @@ def _run_one_slot(
 
     if measurement_error is not None:
         error = measurement_error
+        try:
+            files = _mode_folder_files(run_id, slot_dir, run_dir)
+        except Exception:
+            files = []
     elif not cancelled:
         csv_path = slot_dir / filename
         if req.make_plot:
-            png_path = csv_path.with_suffix('.png')
-            if req.mode.upper() == "CV":
-                plot_cv_cycles(str(csv_path), figpath=str(png_path), show=False, cycles=req.params.get("cycles"))
-            else:
-                plot_time_series(str(csv_path), figpath=str(png_path), show=False)
-        files = [
-            str(p.relative_to(run_dir))
-            for p in slot_dir.iterdir()
-            if p.is_file()
-        ]
+            _queue_plot(run_id, run_dir, slot_status, csv_path, req.mode, req.params.get("cycles"))
+        files = _mode_folder_files(run_id, slot_dir, run_dir)
+        _publish_files(run_id, slot, files)
     else:
         try:
-            files = [
-                str(p.relative_to(run_dir))
-                for p in slot_dir.iterdir()
-                if p.is_file()
-            ]
+            files = _mode_folder_files(run_id, slot_dir, run_dir)
         except Exception:
             files = []
 
@@ -1538,10 +2268,7 @@ def _run_one_slot(
             slot_status.status = "failed"
             slot_status.message = str(error)
             slot_status.ended_at = utcnow_iso()
-            try:
-                slot_status.files = sorted([str(p.relative_to(run_dir)) for p in slot_dir.iterdir() if p.is_file()])
-            except Exception:
-                slot_status.files = []
+            slot_status.files = sorted(files)
         _update_job_status_locked(JOBS.get(run_id))
 
     with SLOT_STATE_LOCK:
@@ -1550,8 +2277,17 @@ def _run_one_slot(
 
 # ---------- Endpunkte: Jobs ----------
 @app.post("/jobs/status", response_model=List[JobStatus])
-def jobs_bulk_status(req: JobStatusBulkRequest, x_api_key: Optional[str] = Header(None)):
-    """Return snapshot data for multiple runs in a single call."""
+def jobs_bulk_status(
+    req: JobStatusBulkRequest,
+    x_api_key: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+):
+    """Return snapshot data for multiple runs in a single call.
+
+    With ``since_version`` only runs that changed after that version, plus all
+    queued or running runs, are returned. The response ``ETag`` covers the
+    returned snapshots; a matching ``If-None-Match`` yields ``304``.
+    """
     if auth_error := require_key(x_api_key):
         return auth_error
     run_ids = [rid for rid in (req.run_ids or []) if rid]
@@ -1562,186 +2298,366 @@ def jobs_bulk_status(req: JobStatusBulkRequest, x_api_key: Optional[str] = Heade
             message="No run_ids provided",
             hint="Fill in the run_ids field in the request.",
         )
-    with JOB_LOCK:
-        missing = [rid for rid in run_ids if rid not in JOBS]
-        if missing:
-            missing_str = ", ".join(sorted(missing))
-            return http_error(
-                status_code=404,
-                code="jobs.run_ids_unknown",
-                message=f"Unbekannte run_ids: {missing_str}",
-                hint="Nur bekannte run_ids anfragen.",
-            )
-        snapshots = [job_snapshot(JOBS[rid]) for rid in run_ids]
-    log.debug("jobs/status bulk request count=%d", len(run_ids))
-    return snapshots
+    statuses = _status_bodies(run_ids)
+    missing = {rid for rid in run_ids if rid not in statuses}
+    if missing:
+        missing_str = ", ".join(sorted(missing))
+        return http_error(
+            status_code=404,
+            code="jobs.run_ids_unknown",
+            message=f"Unbekannte run_ids: {missing_str}",
+            hint="Nur bekannte run_ids anfragen.",
+        )
+    entries = [statuses[rid] for rid in run_ids]
+    if req.since_version is not None:
+        entries = [entry for entry in entries if entry.version > req.since_version or not entry.terminal]
+    etag = '"%08x"' % zlib.crc32(" ".join(entry.etag for entry in entries).encode("ascii"))
+    if if_none_match is not None and etag in _etag_list(if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    body = b"[" + b",".join(entry.body for entry in entries) + b"]"
+    log.debug("jobs/status bulk request count=%d returned=%d", len(run_ids), len(entries))
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/jobs", response_model=List[JobOverview])
 def list_jobs(
+    response: Response,
     state: Optional[Literal["incomplete", "completed"]] = None,
     group_id: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=JOB_PAGE_MAX),
+    cursor: Optional[str] = None,
     x_api_key: Optional[str] = Header(None),
 ) -> List[JobOverview]:
-    """Return a lightweight job overview list with optional filtering."""
+    """Return a lightweight job overview list with optional filtering.
+
+    Jobs are listed newest first from the in-memory job table and the job
+    archive. With ``limit`` or ``cursor`` the list is paged (``limit`` defaults
+    to `JOB_PAGE_DEFAULT`): the ``X-Next-Cursor`` response header carries the
+    ``cursor`` of the next page and is absent on the last one. Without either,
+    the full list is returned.
+    """
     if auth_error := require_key(x_api_key):
         return auth_error
+    page_size = limit or (JOB_PAGE_DEFAULT if cursor else None)
     state_filter = state or None
     group_filter = _normalize_group_value(group_id)
     group_filter_lower = group_filter.lower() if group_filter else None
+    after: Optional[job_archive.Cursor] = None
+    if cursor:
+        try:
+            after = job_archive.decode_cursor(cursor)
+        except ValueError:
+            return http_error(
+                status_code=400,
+                code="jobs.invalid_cursor",
+                message="Invalid cursor",
+                hint="Pass the X-Next-Cursor value of the previous page.",
+            )
 
+    def _position(item: JobOverview) -> job_archive.Cursor:
+        return (item.started_at or "", item.run_id)
+
+    # The group index matches the group id or the storage group folder of a run.
+    group_runs = _runs_for_group(group_filter_lower) if group_filter_lower else None
     with JOB_LOCK:
-        run_ids = list(JOBS.keys())
-        job_entries = [(rid, JOBS[rid].model_copy(deep=True)) for rid in run_ids]
-        group_raw_map = {rid: JOB_GROUP_IDS.get(rid) for rid in run_ids}
-        group_folder_map = {rid: JOB_GROUP_FOLDERS.get(rid) for rid in run_ids}
+        if group_runs is None:
+            jobs = list(JOBS.values())
+        else:
+            jobs = [JOBS[run_id] for run_id in group_runs if run_id in JOBS]
+        memory_entries = [
+            JobOverview(
+                run_id=job.run_id,
+                mode=job.mode,
+                status=_job_overview_status(job),
+                started_at=job.started_at,
+                ended_at=job.ended_at,
+                devices=[slot.slot for slot in job.slots],
+            )
+            for job in jobs
+        ]
 
     results: List[JobOverview] = []
-    for run_id, job in job_entries:
-        overview_status = _job_overview_status(job)
-        if state_filter == "incomplete" and overview_status not in ("queued", "running"):
+    for overview in memory_entries:
+        if after is not None and _position(overview) >= after:
             continue
-        if state_filter == "completed" and overview_status not in ("done", "failed", "cancelled"):
+        if state_filter == "incomplete" and overview.status not in ("queued", "running"):
+            continue
+        if state_filter == "completed" and overview.status not in ("done", "failed", "cancelled"):
+            continue
+        results.append(overview)
+
+    known = {item.run_id for item in results}
+    statuses = {"incomplete": job_archive.ACTIVE_STATES, "completed": TERMINAL_STATES}.get(state_filter)
+    # Over-fetch by the in-memory hits: jobs being archived or mirrored show up in both.
+    fetch = None if page_size is None else page_size + 1 + len(results)
+    for archived in JOB_ARCHIVE.page(after, fetch, group_filter_lower, statuses):
+        if archived.run_id in known:
             continue
-
-        if group_filter_lower:
-            candidate_norms = set()
-            for candidate in (
-                group_raw_map.get(run_id),
-                group_folder_map.get(run_id),
-            ):
-                normalized_candidate = _normalize_group_value(candidate)
-                if normalized_candidate:
-                    candidate_norms.add(normalized_candidate.lower())
-            normalized_folder = _normalize_group_value(_derive_group_folder(run_id))
-            if normalized_folder:
-                candidate_norms.add(normalized_folder.lower())
-            if group_filter_lower not in candidate_norms:
-                continue
-
-        devices = [slot.slot for slot in job.slots]
         results.append(
             JobOverview(
-                run_id=run_id,
-                mode=job.mode,
-                status=overview_status,
-                started_at=job.started_at,
-                ended_at=job.ended_at,
-                devices=devices,
+                run_id=archived.run_id,
+                mode=archived.mode,
+                status=archived.status,
+                started_at=archived.started_at,
+                ended_at=archived.ended_at,
+                devices=archived.devices,
             )
         )
 
-    results.sort(key=lambda item: ((item.started_at or ""), item.run_id), reverse=True)
+    results.sort(key=_position, reverse=True)
+    if page_size is not None and len(results) > page_size:
+        results = results[:page_size]
+        response.headers["X-Next-Cursor"] = job_archive.encode_cursor(_position(results[-1]))
     return results
 
 
-@app.post("/jobs", response_model=JobStatus)
-def start_job(req: JobRequest, x_api_key: Optional[str] = Header(None)):
-    """Start a new job across selected slots and launch worker threads (multi-mode sequence)."""
-    if auth_error := require_key(x_api_key):
-        return auth_error
+@dataclass
+class _PreparedJob:
+    """A validated job request with its storage, ready to be registered."""
 
+    run_id: str
+    req: JobRequest
+    slots: List[str]
+    run_dir: pathlib.Path
+    storage_info: RunStorageInfo
+    group_id: Optional[str]
+    job: JobStatus
+
+
+def _job_request_error(req: JobRequest) -> Optional[Dict[str, Any]]:
+    """Return `http_error` arguments when ``req`` cannot be started, else ``None``."""
     if not req.modes:
-        return http_error(status_code=422, code="jobs.invalid_request", message="modes must not be empty")
+        return {"status_code": 422, "code": "jobs.invalid_request", "message": "modes must not be empty"}
     for m in req.modes:
         if m not in req.params_by_mode:
-            return http_error(status_code=422, code="jobs.invalid_request", message=f"missing params for mode {m}")
+            return {"status_code": 422, "code": "jobs.invalid_request", "message": f"missing params for mode {m}"}
+    return None
+
 
+def _job_slots(req: JobRequest) -> List[str]:
+    """Known slots addressed by ``req``."""
+    _wait_for_device_scan()
     with DEVICE_SCAN_LOCK:
         if req.devices == "all":
-            slots = sorted(DEVICES.keys())
-        else:
-            slots = [s for s in req.devices if s in DEVICES]
-    if not slots:
-        return http_error(status_code=400, code="jobs.invalid_devices", message="No valid devices specified", hint="Use slots from /devices or 'all'.")
+            return sorted(DEVICES.keys())
+        return [s for s in req.devices if s in DEVICES]
 
-    run_id = req.run_name or datetime.datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + "_" + uuid.uuid4().hex[:6]
 
+def _run_id_taken(run_id: str) -> bool:
+    """Whether ``run_id`` belongs to a job in memory or in `JOB_ARCHIVE`."""
     with JOB_LOCK:
         if run_id in JOBS:
-            return http_error(status_code=409, code="jobs.run_id_conflict", message="run_id already active", hint="Choose another run_id or wait for the running job.")
+            return True
+    return JOB_ARCHIVE.get(run_id) is not None
 
-    with SLOT_STATE_LOCK:
-        busy = sorted(s for s in slots if s in SLOT_RUNS)
-        if busy:
-            return http_error(status_code=409, code="jobs.slots_busy", message=f"Slots busy: {', '.join(busy)}", hint="Wait until the listed slots are free.")
-        for s in slots:
-            SLOT_RUNS[s] = run_id
 
-    slot_statuses = [SlotStatus(slot=s, status="queued") for s in slots]
-    started_at = utcnow_iso()
+def _new_run_id(req: JobRequest) -> str:
+    return req.run_name or datetime.datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + "_" + uuid.uuid4().hex[:6]
 
-    try:
-        storage_info = _build_run_storage_info(req)
-        path_parts = [p for p in (storage_info.experiment, storage_info.subdir) if p]
-        path_parts.append(storage_info.timestamp_dir)
-        run_dir = RUNS_ROOT.joinpath(*path_parts)
-        run_dir.mkdir(parents=True, exist_ok=True)
-        _record_run_directory(run_id, run_dir)
 
-        raw_group_id = (
-            _normalize_group_value(req.group_id)
-            or _normalize_group_value(req.folder_name)
-            or _normalize_group_value(req.subdir)
-        )
-        storage_folder = storage_info.subdir
-
-        # For compatibility: 'mode' = first mode, 'modes' full list
-        first_mode = (req.modes or [""])[0]
-        job = JobStatus(
-            run_id=run_id,
-            mode=first_mode,
-            started_at=started_at,
-            status="running",
-            ended_at=None,
-            slots=slot_statuses,
-            modes=list(req.modes or []),
-            current_mode=first_mode,
-            remaining_modes=list(req.modes[1:] if len(req.modes) > 1 else []),
-        )
+def _prepare_job(req: JobRequest, run_id: str, slots: List[str]) -> _PreparedJob:
+    """Resolve storage naming and build the initial `JobStatus` (nothing is registered yet)."""
+    storage_info = _build_run_storage_info(req)
+    path_parts = [p for p in (storage_info.experiment, storage_info.subdir) if p]
+    path_parts.append(storage_info.timestamp_dir)
+    raw_group_id = (
+        _normalize_group_value(req.group_id)
+        or _normalize_group_value(req.folder_name)
+        or _normalize_group_value(req.subdir)
+    )
+    # For compatibility: 'mode' = first mode, 'modes' full list
+    first_mode = (req.modes or [""])[0]
+    job = JobStatus(
+        run_id=run_id,
+        mode=first_mode,
+        started_at=utcnow_iso(),
+        status="queued",
+        ended_at=None,
+        slots=[SlotStatus(slot=s, status="queued") for s in slots],
+        modes=list(req.modes or []),
+        current_mode=first_mode,
+        remaining_modes=list(req.modes[1:] if len(req.modes) > 1 else []),
+    )
+    return _PreparedJob(
+        run_id=run_id,
+        req=req,
+        slots=slots,
+        run_dir=RUNS_ROOT.joinpath(*path_parts),
+        storage_info=storage_info,
+        group_id=raw_group_id,
+        job=job,
+    )
 
-        with JOB_LOCK:
-            JOBS[run_id] = job
+
+def _output_conflict(prepared: List[_PreparedJob]) -> Optional[Dict[str, Any]]:
+    """Error for the first prepared job whose output folder is owned by an active job.
+
+    Jobs writing to the same run directory (same experiment, subfolder and
+    client timestamp) and slot would overwrite each other's files, so the
+    slot's folder stays reserved while a job is queued or running there.
+    """
+    owners: Dict[tuple, str] = {}
+    with JOB_LOCK:
+        for run_id, job in JOBS.items():
+            run_dir = JOB_RUN_DIRS.get(run_id)
+            for s in job.slots:
+                if run_dir is not None and s.status in ("queued", "running"):
+                    owners[(run_dir, s.slot)] = run_id
+    for index, item in enumerate(prepared):
+        for slot in item.slots:
+            owner = owners.get((item.run_dir, slot))
+            if owner is not None:
+                prefix = f"jobs[{index}]: " if len(prepared) > 1 else ""
+                return {
+                    "status_code": 409,
+                    "code": "jobs.output_conflict",
+                    "message": f"{prefix}Output folder of {slot} is in use by run {owner}",
+                    "hint": "Use another experiment name, subdir or client_datetime, or wait for that run to finish.",
+                }
+            owners[(item.run_dir, slot)] = item.run_id
+    return None
+
+
+def _register_jobs(prepared: List[_PreparedJob]) -> None:
+    """Create run directories, index entries (one transaction) and job table entries."""
+    for run_dir in {item.run_dir for item in prepared}:
+        run_dir.mkdir(parents=True, exist_ok=True)
+    _record_run_directories([(item.run_id, item.run_dir, item.group_id) for item in prepared])
+    with JOB_LOCK:
+        for item in prepared:
+            run_id, req = item.run_id, item.req
+            JOBS[run_id] = item.job
             CANCEL_FLAGS[run_id] = threading.Event()
             # Progress estimate based on the first mode (KISS)
+            first_mode = item.job.mode
             record_job_meta(run_id, first_mode, dict(req.params_by_mode.get(first_mode, {}) or {}))
-            if raw_group_id:
-                JOB_GROUP_IDS[run_id] = raw_group_id
+            if item.group_id:
+                JOB_GROUP_IDS[run_id] = item.group_id
             else:
                 JOB_GROUP_IDS.pop(run_id, None)
-            if storage_folder:
-                JOB_GROUP_FOLDERS[run_id] = storage_folder
+            if item.storage_info.subdir:
+                JOB_GROUP_FOLDERS[run_id] = item.storage_info.subdir
             else:
                 JOB_GROUP_FOLDERS.pop(run_id, None)
+            JOB_RUN_DIRS[run_id] = item.run_dir
+            _publish_job_locked(item.job)
+    if SHARED_STATE:
+        # Front workers must know the runs before the start request returns.
+        _mirror_jobs()
+
+
+def _submit_job(item: _PreparedJob) -> None:
+    """Queue the job on each of its slots; busy slots keep it queued until their current runs finish."""
+    run_id, req = item.run_id, item.req
+    log.info("Job start run_id=%s modes=%s devices=%s slots=%s", run_id, req.modes, req.devices if req.devices != "all" else "all", item.slots)
+    log.debug("Job storage run_id=%s group_id=%s folder=%s experiment=%s", run_id, item.group_id or "-", item.storage_info.subdir or "-", item.storage_info.experiment)
+    planned_s = _planned_sequence_duration(req)
+    for slot_status in item.job.slots:
+        ahead = SLOT_SCHEDULER.submit(
+            slot_status.slot,
+            run_id,
+            partial(_run_slot_sequence, run_id, item.run_dir, slot_status.slot, req, slot_status, item.storage_info),
+            planned_s=planned_s,
+        )
+        if ahead:
+            log.info("Job queued run_id=%s slot=%s runs_ahead=%d", run_id, slot_status.slot, ahead)
 
-        log.info("Job start run_id=%s modes=%s devices=%s slots=%s", run_id, req.modes, req.devices if req.devices != "all" else "all", slots)
-        log.debug("Job storage run_id=%s group_id=%s folder=%s experiment=%s", run_id, raw_group_id or "-", storage_folder or "-", storage_info.experiment)
 
-        for slot_status in slot_statuses:
-            t = threading.Thread(
-                target=_run_slot_sequence,
-                args=(run_id, run_dir, slot_status.slot, req, slot_status, storage_info),
-                daemon=True,
-            )
-            t.start()
-    except Exception:
-        with SLOT_STATE_LOCK:
-            for s in slots:
-                if SLOT_RUNS.get(s) == run_id:
-                    del SLOT_RUNS[s]
+def _discard_jobs(prepared: List[_PreparedJob]) -> None:
+    """Undo `_register_jobs`/`_submit_job` after a failed start."""
+    for item in prepared:
+        run_id = item.run_id
+        for s in item.slots:
+            SLOT_SCHEDULER.remove(s, run_id)
         with JOB_LOCK:
             JOBS.pop(run_id, None)
+            JOB_SNAPSHOTS.pop(run_id, None)
             JOB_GROUP_IDS.pop(run_id, None)
             JOB_GROUP_FOLDERS.pop(run_id, None)
+            JOB_RUN_DIRS.pop(run_id, None)
         CANCEL_FLAGS.pop(run_id, None)
         JOB_META.pop(run_id, None)
         _forget_run_directory(run_id)
+
+
+@app.post("/jobs", response_model=JobStatus)
+def start_job(req: JobRequest, x_api_key: Optional[str] = Header(None)):
+    """Start a new job across selected slots (multi-mode sequence).
+
+    Each slot runs its jobs in submission order; slots that are still busy
+    report the job as ``queued`` with its queue position and estimated start.
+    """
+    if auth_error := require_key(x_api_key):
+        return auth_error
+
+    if error := _job_request_error(req):
+        return http_error(**error)
+    slots = _job_slots(req)
+    if not slots:
+        return http_error(status_code=400, code="jobs.invalid_devices", message="No valid devices specified", hint="Use slots from /devices or 'all'.")
+
+    run_id = _new_run_id(req)
+
+    if _run_id_taken(run_id):
+        return http_error(status_code=409, code="jobs.run_id_conflict", message="run_id already exists", hint="Choose another run_id; finished runs keep theirs.")
+
+    prepared = [_prepare_job(req, run_id, slots)]
+    if error := _output_conflict(prepared):
+        return http_error(**error)
+    try:
+        _register_jobs(prepared)
+        _submit_job(prepared[0])
+    except Exception:
+        _discard_jobs(prepared)
         raise
 
     with JOB_LOCK:
         return job_snapshot(JOBS[run_id])
 
 
+@app.post("/jobs/batch", response_model=List[JobStatus])
+def start_jobs_batch(req: JobBatchRequest, x_api_key: Optional[str] = Header(None)):
+    """Start many jobs (e.g. one per well of a plate) in one request.
+
+    All jobs are validated before anything is created; an invalid job rejects
+    the whole batch and the error message names its index. Run directories
+    and run-index entries are then created together and all slots are
+    queued in one pass, so the slots of a plate start at the same time.
+    """
+    if auth_error := require_key(x_api_key):
+        return auth_error
+    if not req.jobs:
+        return http_error(status_code=422, code="jobs.invalid_request", message="jobs must not be empty")
+
+    prepared: List[_PreparedJob] = []
+    run_ids: Set[str] = set()
+    for index, job_req in enumerate(req.jobs):
+        if error := _job_request_error(job_req):
+            error["message"] = f"jobs[{index}]: {error['message']}"
+            return http_error(**error)
+        slots = _job_slots(job_req)
+        if not slots:
+            return http_error(status_code=400, code="jobs.invalid_devices", message=f"jobs[{index}]: No valid devices specified", hint="Use slots from /devices or 'all'.")
+        run_id = _new_run_id(job_req)
+        if run_id in run_ids or _run_id_taken(run_id):
+            return http_error(status_code=409, code="jobs.run_id_conflict", message=f"jobs[{index}]: run_id already exists", hint="Choose another run_id; finished runs keep theirs.")
+        run_ids.add(run_id)
+        prepared.append(_prepare_job(job_req, run_id, slots))
+    if error := _output_conflict(prepared):
+        return http_error(**error)
+
+    try:
+        _register_jobs(prepared)
+        for item in prepared:
+            _submit_job(item)
+    except Exception:
+        _discard_jobs(prepared)
+        raise
+
+    log.info("Job batch started jobs=%d", len(prepared))
+    with JOB_LOCK:
+        return [job_snapshot(JOBS[item.run_id]) for item in prepared]
+
 
 @app.post("/jobs/{run_id}/cancel", status_code=202)
 def cancel_job(run_id: str, x_api_key: Optional[str] = Header(None)):
@@ -1750,14 +2666,18 @@ def cancel_job(run_id: str, x_api_key: Optional[str] = Header(None)):
         return auth_error
     with JOB_LOCK:
         job = JOBS.get(run_id)
-        if not job:
-            return http_error(
-                status_code=404,
-                code="jobs.not_found",
-                message="Unbekannte run_id",
-                hint="Check run_id or fetch the job list.",
-            )
-
+    if not job:
+        archived = JOB_ARCHIVE.get(run_id)
+        if archived is not None:
+            return {"run_id": run_id, "status": archived.status}
+        return http_error(
+            status_code=404,
+            code="jobs.not_found",
+            message="Unbekannte run_id",
+            hint="Check run_id or fetch the job list.",
+        )
+    with JOB_LOCK:
+        job = JOBS.get(run_id) or job
         event = CANCEL_FLAGS.get(run_id)
         if event is None:
             event = CANCEL_FLAGS[run_id] = threading.Event()
@@ -1779,41 +2699,318 @@ def cancel_job(run_id: str, x_api_key: Optional[str] = Header(None)):
 
         _update_job_status_locked(job)
 
-    if queued_slots:
-        with SLOT_STATE_LOCK:
-            for slot in queued_slots:
-                if SLOT_RUNS.get(slot) == run_id:
-                    del SLOT_RUNS[slot]
+    for slot in queued_slots:
+        SLOT_SCHEDULER.remove(slot, run_id)
 
     log.info("Job cancel requested run_id=%s queued_slots=%d", run_id, len(queued_slots))
     return {"run_id": run_id, "status": "cancelled"}
 
 
+@app.get("/jobs/events")
+async def job_events_stream(
+    request: Request,
+    group_id: Optional[str] = Query(None),
+    x_api_key: Optional[str] = Header(None),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Stream job changes as server-sent events.
+
+    Events: ``job`` (full snapshot after any job or slot change), ``files``
+    (outputs of a finished measurement step), ``progress`` (progress ticks of
+    active runs, without id), ``resync`` (followed by the current snapshots)
+    and ``ping``. ``Last-Event-ID`` resumes from the bounded event log; when
+    the id is unknown or too old the stream starts with a ``resync``.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request, used to detect disconnects.
+    group_id : Optional[str]
+        Only stream runs of this group (case-insensitive).
+    x_api_key : Optional[str]
+        Value supplied by the API caller or internal orchestration.
+    last_event_id : Optional[str]
+        Id of the last event the client received.
+
+    Returns
+    -------
+    Any
+        ``text/event-stream`` response.
+    """
+    if auth_error := require_key(x_api_key):
+        return auth_error
+    group_filter = _normalize_group_value(group_id)
+    group_key = group_filter.lower() if group_filter else None
+
+    def _matches(group: Optional[str]) -> bool:
+        return group_key is None or group == group_key
+
+    def _resync(seq: int) -> List[str]:
+        with JOB_LOCK:
+            jobs = [job for run_id, job in JOBS.items() if _matches(_job_group_key(run_id))]
+            bodies = [_snapshot_entry(job).body.decode("utf-8") for job in jobs]
+        payload = json.dumps({"run_ids": [job.run_id for job in jobs]}, separators=(",", ":"))
+        messages = [job_events.format_event("resync", payload, JOB_EVENTS.event_id(seq))]
+        messages.extend(job_events.format_event("job", body) for body in bodies)
+        return messages
+
+    def _progress_ticks(sent: Dict[str, tuple]) -> List[str]:
+        messages = []
+        with JOB_LOCK:
+            for run_id, job in JOBS.items():
+                if job.status in TERMINAL_STATES or not _matches(_job_group_key(run_id)):
+                    continue
+                entry = _snapshot_entry(job)
+                tick = (entry.version, entry.snapshot.progress_pct, entry.snapshot.remaining_s)
+                if sent.get(run_id) == tick:
+                    continue
+                sent[run_id] = tick
+                payload = {
+                    "run_id": run_id,
+                    "version": tick[0],
+                    "progress_pct": tick[1],
+                    "remaining_s": tick[2],
+                }
+                messages.append(job_events.format_event("progress", json.dumps(payload, separators=(",", ":"))))
+        return messages
+
+    async def gen():
+        """Yield backlog or resync, then live events, progress ticks and pings."""
+        wake = JOB_EVENTS.subscribe()
+        try:
+            seq = JOB_EVENTS.parse_id(last_event_id)
+            complete, backlog = JOB_EVENTS.after(seq) if seq is not None else (False, [])
+            if not complete:
+                # Take the head first: anything published meanwhile is replayed below.
+                seq = JOB_EVENTS.head()
+                backlog = []
+                for message in _resync(seq):
+                    yield message
+            sent_progress: Dict[str, tuple] = {}
+            last_tick = last_ping = time.monotonic()
+            while True:
+                for event in backlog:
+                    seq = event.seq
+                    if _matches(event.group):
+                        yield job_events.format_event(event.event, event.data, JOB_EVENTS.event_id(event.seq))
+                now = time.monotonic()
+                if now - last_tick >= JOB_EVENT_PROGRESS_TICK_S:
+                    last_tick = now
+                    for message in _progress_ticks(sent_progress):
+                        yield message
+                if now - last_ping >= JOB_EVENT_PING_S:
+                    last_ping = now
+                    yield sse_format("ping", {"ts": utcnow_iso()})
+                if await request.is_disconnected():
+                    break
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=JOB_EVENT_PROGRESS_TICK_S)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+                complete, backlog = JOB_EVENTS.after(seq)
+                if not complete:
+                    # This client fell behind the bounded log.
+                    seq = JOB_EVENTS.head()
+                    backlog = []
+                    for message in _resync(seq):
+                        yield message
+        finally:
+            JOB_EVENTS.unsubscribe(wake)
+
+    return StreamingResponse(gen(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.get("/jobs/{run_id}", response_model=JobStatus)
-def job_status(run_id: str, x_api_key: Optional[str] = Header(None)):
-    """Return the latest status snapshot for a single run."""
+def job_status(
+    run_id: str,
+    since_version: Optional[int] = Query(None),
+    x_api_key: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+):
+    """Return the latest status snapshot for a single run.
+
+    Answers ``304 Not Modified`` when ``If-None-Match`` carries the current
+    ``ETag``, or when ``since_version`` is given and a finished run has not
+    changed since that version.
+    """
     if auth_error := require_key(x_api_key):
         return auth_error
+    status = _status_bodies([run_id]).get(run_id)
+    if status is None:
+        return http_error(
+            status_code=404,
+            code="jobs.not_found",
+            message="Unbekannte run_id",
+            hint="Check run_id or fetch the job list.",
+        )
+    unchanged = (if_none_match is not None and status.etag in _etag_list(if_none_match)) or (
+        since_version is not None and status.version <= since_version and status.terminal
+    )
+    if unchanged:
+        return Response(status_code=304, headers={"ETag": status.etag})
+    return Response(content=status.body, media_type="application/json", headers={"ETag": status.etag})
+
+
+@dataclass(frozen=True)
+class _StatusBody:
+    """Serialized status of one run, from the job table or the job archive."""
+
+    version: int
+    terminal: bool
+    body: bytes
+    etag: str
+
+
+def _status_bodies(run_ids: List[str]) -> Dict[str, _StatusBody]:
+    """Status bodies of the known runs among ``run_ids``; archived runs are read from disk."""
+    found: Dict[str, _StatusBody] = {}
+    with JOB_LOCK:
+        for run_id in run_ids:
+            job = JOBS.get(run_id)
+            if job is not None:
+                entry = _snapshot_entry(job)
+                found[run_id] = _StatusBody(entry.version, entry.base.status in TERMINAL_STATES, entry.body, entry.etag)
+    missing = [run_id for run_id in run_ids if run_id not in found]
+    if missing:
+        for run_id, archived in JOB_ARCHIVE.get_many(missing).items():
+            etag = f'"{archived.version}-{zlib.crc32(archived.body):08x}"'
+            found[run_id] = _StatusBody(archived.version, archived.status in TERMINAL_STATES, archived.body, etag)
+    return found
+
+
+def _active_slots(run_id: str) -> Set[str]:
+    """Queued or running slots of a run, from the job table or (in `http_front` workers) the job store."""
     with JOB_LOCK:
         job = JOBS.get(run_id)
-        if not job:
-            return http_error(
-                status_code=404,
-                code="jobs.not_found",
-                message="Unbekannte run_id",
-                hint="Check run_id or fetch the job list.",
-            )
-        return job_snapshot(job)
+        if job is not None:
+            return {s.slot for s in job.slots if s.status in ("queued", "running")}
+    archived = JOB_ARCHIVE.get(run_id)
+    if archived is None or archived.status in TERMINAL_STATES:
+        return set()
+    job = JobStatus.model_validate_json(archived.body)
+    return {s.slot for s in job.slots if s.status in ("queued", "running")}
+
+
+def _etag_list(header: str) -> List[str]:
+    """Split an ``If-None-Match`` header into its entity tags."""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+@app.get("/runs/{run_id}/live")
+async def run_live_stream(
+    request: Request,
+    run_id: str,
+    slot: Optional[str] = Query(None),
+    format: str = Query("json", pattern="^(json|binary)$"),
+    x_api_key: Optional[str] = Header(None),
+):
+    """Stream decimated live potential/current blocks of a running run.
+
+    Blocks come from the per-slot ring buffers of `live_stream`: buffered
+    blocks are sent first, then new ones as acquisition publishes them. The
+    stream ends once the run is finished and every slot's buffer is drained.
+    ``format=json`` sends SSE ``block`` events (plus ``ping`` and ``end``),
+    ``format=binary`` the compact frames described in `live_stream`.
+
+    Parameters
+    ----------
+    request : Request
+        Incoming request, used to detect disconnects.
+    run_id : str
+        Run to stream.
+    slot : Optional[str]
+        Only stream this slot (``slot01`` or ``1``); all slots when omitted.
+    format : str
+        ``json`` or ``binary``.
+    x_api_key : Optional[str]
+        Value supplied by the API caller or internal orchestration.
+
+    Returns
+    -------
+    Any
+        ``text/event-stream`` or ``application/octet-stream`` response.
+    """
+    if auth_error := require_key(x_api_key):
+        return auth_error
+    with JOB_LOCK:
+        known = run_id in JOBS
+    if not known and not _resolve_run_directory(run_id).is_dir():
+        return http_error(
+            status_code=404,
+            code="runs.not_found",
+            message="Run not found",
+            hint="Check run_id or list existing runs.",
+        )
+    if slot is not None and slot.strip().isdigit():
+        slot = f"slot{int(slot):02d}"
+
+    def _run_finished() -> bool:
+        with JOB_LOCK:
+            job = JOBS.get(run_id)
+            return job is None or job.status in TERMINAL_STATES
+
+    async def gen():
+        """Yield buffered and new blocks until the run is finished and drained."""
+        wake = LIVE_STREAMS.subscribe()
+        sent: Dict[str, int] = {}
+        last_ping = time.monotonic()
+        try:
+            while True:
+                channels = LIVE_STREAMS.channels(run_id, slot)
+                drained = True
+                for channel in channels:
+                    blocks, finished = channel.after(sent.get(channel.slot, 0))
+                    for block in blocks:
+                        yield block.encode(format)
+                    if blocks:
+                        sent[channel.slot] = blocks[-1].seq
+                    drained = drained and finished
+                if drained and _run_finished():
+                    if format == "json":
+                        yield sse_format("end", {"run_id": run_id})
+                    break
+                if time.monotonic() - last_ping >= JOB_EVENT_PING_S:
+                    last_ping = time.monotonic()
+                    yield live_stream.keepalive_frame() if format == "binary" else sse_format("ping", {"ts": utcnow_iso()})
+                if await request.is_disconnected():
+                    break
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+        finally:
+            LIVE_STREAMS.unsubscribe(wake)
+
+    media_type = "application/octet-stream" if format == "binary" else "text/event-stream"
+    return StreamingResponse(gen(), media_type=media_type, headers={"Cache-Control": "no-cache"})
 
 
 @app.get("/runs/{run_id}/files")
-def list_run_files(run_id: str, x_api_key: Optional[str] = Header(None)):
+def list_run_files(
+    run_id: str,
+    since: Optional[int] = Query(None, ge=0),
+    x_api_key: Optional[str] = Header(None),
+):
     """List files available inside a run output directory.
+
+    Served from the run manifest (see `run_manifest`): ``files`` lists the
+    paths, ``entries`` adds size, mtime and sha256, and ``version`` can be
+    passed back as ``since`` to receive only entries added or changed later.
+    The listing covers the whole run directory (every well of a plate, as
+    in the ZIP); binary captures are listed under their CSV name
+    (``capture: true``). Hashes come from the writers once a step finished;
+    files still being written by a running measurement are included in every
+    response with their current size and ``sha256`` ``null``. The directory
+    is never walked per request.
     
     Parameters
     ----------
     run_id : str
         Value supplied by the API caller or internal orchestration.
+    since : Optional[int]
+        Manifest version from an earlier response.
     x_api_key : Optional[str]
         Value supplied by the API caller or internal orchestration.
     
@@ -1841,14 +3038,13 @@ def list_run_files(run_id: str, x_api_key: Optional[str] = Header(None)):
             message="Run not found",
             hint="Check run_id or list existing runs.",
         )
-    files = [
-        path.relative_to(run_dir).as_posix()
-        for path in run_dir.rglob("*")
-        if path.is_file()
-    ]
-    files.sort()
-    log.info("List files run_id=%s count=%d", run_id, len(files))
-    return {"files": files}
+    version, entries = RUN_MANIFESTS.entries(run_dir, since=since)
+    log.info("List files run_id=%s count=%d since=%s", run_id, len(entries), since)
+    return {
+        "files": [entry.path for entry in entries],
+        "entries": [asdict(entry) for entry in entries],
+        "version": version,
+    }
 
 
 @app.get("/runs/{run_id}/file")
@@ -1897,6 +3093,10 @@ def get_run_file(run_id: str, path: str, x_api_key: Optional[str] = Header(None)
         )
 
     run_root = run_dir.resolve()
+    requested = (run_dir / path).resolve()
+    if requested.suffix.lower() == ".csv" and requested.is_relative_to(run_root):
+        # Binary captures are converted to CSV on first request.
+        _ensure_csv(requested)
     try:
         target_path = (run_dir / path).resolve(strict=True)
     except FileNotFoundError:
@@ -1930,14 +3130,152 @@ def get_run_file(run_id: str, path: str, x_api_key: Optional[str] = Header(None)
     return FileResponse(path=target_path, filename=target_path.name)
 
 
+def _preview_choice(parent: pathlib.Path, requested: Optional[str], field_name: str) -> tuple:
+    """Pick the ``Wells`` sub-directory for a preview: the requested one, or the only one.
+
+    Returns ``(directory, None)`` or ``(None, error_response)``.
+    """
+    options = sorted(p.name for p in parent.iterdir() if p.is_dir()) if parent.is_dir() else []
+    if requested:
+        segment = _sanitize_path_segment(requested, field_name)
+        if segment in options:
+            return parent / segment, None
+        return None, http_error(
+            status_code=404,
+            code="runs.preview_not_found",
+            message=f"No measurement for {field_name} '{requested}'",
+            hint=f"Available: {', '.join(options) or 'none yet'}.",
+        )
+    if len(options) == 1:
+        return parent / options[0], None
+    return None, http_error(
+        status_code=422 if options else 404,
+        code="runs.preview_ambiguous" if options else "runs.preview_not_found",
+        message=f"{field_name} is required" if options else "No measurement yet",
+        hint=f"Available: {', '.join(options)}." if options else "Retry once the run has started writing data.",
+    )
+
+
+@app.get("/runs/{run_id}/preview")
+def get_run_preview(
+    run_id: str,
+    slot: Optional[str] = Query(None),
+    mode: Optional[str] = Query(None),
+    x: str = Query("Time (s)"),
+    y: str = Query("Current (A)"),
+    points: int = Query(preview.DEFAULT_POINTS, ge=10, le=preview.MAX_POINTS),
+    method: str = Query("lttb", pattern="^(lttb|minmax)$"),
+    x_api_key: Optional[str] = Header(None),
+):
+    """Return a downsampled curve of one measurement instead of the full file.
+
+    The preview is computed by `preview` while streaming over the slot's
+    capture or CSV (LTTB or min-max buckets, at most ``points`` points) and
+    cached per file state, columns, points and method. Files still being
+    written are previewed up to their last complete row; ``complete`` is
+    ``False`` while the slot is queued or running.
+    
+    Parameters
+    ----------
+    run_id : str
+        Value supplied by the API caller or internal orchestration.
+    slot : Optional[str]
+        Slot label; may be omitted when the run has a single slot.
+    mode : Optional[str]
+        Mode name; may be omitted when the slot ran a single mode.
+    x : str
+        Column on the horizontal axis (label or its name without unit).
+    y : str
+        Column on the vertical axis.
+    points : int
+        Maximum number of returned points.
+    method : str
+        ``lttb`` or ``minmax``.
+    x_api_key : Optional[str]
+        Value supplied by the API caller or internal orchestration.
+    
+    Returns
+    -------
+    Any
+        ``{"run_id", "slot", "mode", "file", "method", "x", "y", "columns",
+        "rows", "points", "complete", "data": {"x": [...], "y": [...]}}``.
+    
+    Notes
+    -----
+    Called by GUI adapter HTTP clients through the FastAPI router.
+    """
+    if auth_error := require_key(x_api_key):
+        return auth_error
+    run_dir = _resolve_run_directory(run_id)
+    if not run_dir.is_dir():
+        return http_error(
+            status_code=404,
+            code="runs.not_found",
+            message="Run not found",
+            hint="Check run_id or list existing runs.",
+        )
+    slot_dir, error = _preview_choice(run_dir / "Wells", slot, "slot")
+    if error is not None:
+        return error
+    mode_dir, error = _preview_choice(slot_dir, mode, "mode")
+    if error is not None:
+        return error
+    source = preview.measurement_path(mode_dir)
+    if source is None:
+        return http_error(
+            status_code=404,
+            code="runs.preview_not_found",
+            message="No measurement yet",
+            hint="Retry once the run has started writing data.",
+        )
+    try:
+        result = PREVIEWS.preview(source, x, y, points, method)
+    except preview.PreviewError as exc:
+        return http_error(
+            status_code=422,
+            code="runs.preview_invalid",
+            message=str(exc),
+            hint=f"Columns: {', '.join(exc.columns)}." if exc.columns else None,
+        )
+
+    active = slot_dir.name in _active_slots(run_id)
+    complete = result["complete"]
+    if active:
+        complete = False
+    elif complete is None:
+        complete = True
+    log.debug("Preview run_id=%s slot=%s mode=%s rows=%s points=%s", run_id, slot_dir.name, mode_dir.name, result["rows"], result["points"])
+    return {
+        "run_id": run_id,
+        "slot": slot_dir.name,
+        "mode": mode_dir.name,
+        "file": source.relative_to(run_dir).as_posix(),
+        "method": method,
+        **result,
+        "complete": complete,
+    }
+
+
 @app.get("/runs/{run_id}/zip")
-def get_run_zip(run_id: str, x_api_key: Optional[str] = Header(None)):
-    """Stream a ZIP archive of all files for one run.
+def get_run_zip(
+    run_id: str,
+    compression: Literal["deflate", "stored"] = Query("deflate"),
+    x_api_key: Optional[str] = Header(None),
+):
+    """Serve a ZIP archive of all files for one run.
+
+    Deflate archives of finished runs are served from the prebuilt cache
+    (see `run_archive`) with ``ETag``, ``Content-Length`` and ``Range``
+    support; otherwise the archive is streamed while it is compressed and,
+    with `BUILD_RUN_ARCHIVES`, rebuilt for the next download. The
+    archive covers the whole run directory, i.e. every well of a plate.
     
     Parameters
     ----------
     run_id : str
         Value supplied by the API caller or internal orchestration.
+    compression : Literal["deflate", "stored"]
+        Entry compression; ``stored`` skips deflate for CPU-bound boxes.
     x_api_key : Optional[str]
         Value supplied by the API caller or internal orchestration.
     
@@ -1965,20 +3303,67 @@ def get_run_zip(run_id: str, x_api_key: Optional[str] = Header(None)):
             message="Run not found",
             hint="Check run_id or list existing runs.",
         )
-    # Build ZIP in memory
-    buf = io.BytesIO()
-    file_count = 0
-    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for path in run_dir.rglob("*"):
-            if path.is_file():
-                zf.write(path, arcname=path.relative_to(run_dir))
-                file_count += 1
-    buf.seek(0)
-    content = buf.read()
-    log.info("Serve zip run_id=%s files=%d size=%d", run_id, file_count, len(content))
-    return Response(content=content,
-                    media_type="application/zip",
-                    headers={"Content-Disposition": f'attachment; filename="{run_id}.zip"'})
+    if compression == "deflate":
+        cached = RUN_ARCHIVES.lookup(run_dir)
+        if cached is not None:
+            log.info("Serve cached zip run_id=%s size=%d", run_id, cached.size)
+            # FileResponse answers Range / If-Range requests against our ETag.
+            return FileResponse(
+                path=cached.path,
+                media_type="application/zip",
+                filename=f"{run_id}.zip",
+                headers={"ETag": cached.etag},
+            )
+        if BUILD_RUN_ARCHIVES:
+            with JOB_LOCK:
+                writing = bool(_run_dir_writers_locked(run_dir))
+            if not writing:
+                # Missing or stale (run files changed): rebuild for the next download.
+                RUN_ARCHIVES.schedule(run_dir)
+    entries = _run_zip_entries(run_dir)
+    log.info("Serve zip run_id=%s files=%d compression=%s", run_id, len(entries), compression)
+    # Entries are compressed chunk by chunk while streaming, so memory does not grow with run size.
+    return StreamingResponse(
+        zip_stream.iter_zip(entries, compression=compression),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{run_id}.zip"'},
+    )
+
+
+def _run_zip_entries(run_dir: pathlib.Path) -> List[tuple]:
+    """List ``(arcname, source)`` entries of a run archive.
+
+    Raw capture columns are replaced by their CSV; captures without a CSV yet
+    are converted lazily when the archive reaches them.
+    """
+    entries: List[tuple] = []
+    seen = set()
+    for path in sorted(run_dir.rglob("*")):
+        if path.parent.suffix == CAPTURE_SUFFIX:
+            continue
+        if path.is_dir() and path.suffix == CAPTURE_SUFFIX:
+            csv_path = path.with_suffix(".csv")
+            arcname = str(csv_path.relative_to(run_dir))
+            if arcname not in seen:
+                seen.add(arcname)
+                entries.append((arcname, partial(_converted_csv, csv_path)))
+        elif path.is_file() and path.name not in run_archive.EXCLUDED_NAMES:
+            arcname = str(path.relative_to(run_dir))
+            if arcname not in seen:
+                seen.add(arcname)
+                entries.append((arcname, path))
+    return entries
+
+
+def _converted_csv(csv_path: pathlib.Path) -> Optional[pathlib.Path]:
+    """Return the CSV of a binary capture, converting it first if needed."""
+    return csv_path if _ensure_csv(csv_path) else None
+
+
+RUN_ARCHIVES = run_archive.RunArchiveCache(RUNS_ROOT, entries=_run_zip_entries)
+# Only the process that runs the jobs builds archives; `http_front` workers
+# clear this and stream on a cache miss.
+BUILD_RUN_ARCHIVES = True
 
 # ---------- NAS Storage Requests ----------
 
@@ -2366,14 +3751,39 @@ def sse_format(event: str, data_obj, event_id: Optional[str] = None) -> str:
     msg += "data: " + json.dumps(data_obj, separators=(",", ":")) + "\n\n"
     return msg
 
+def _telemetry_frame(seq: int) -> sse_broadcast.BroadcastFrame:
+    """Generate one telemetry tick for all devices (the broadcaster's producer)."""
+    items = []
+    for d in DEVICE_IDS:
+        s = source.generate_one(d)
+        if s:
+            latest_by_dev[d] = s
+            items.append((asdict(s), f"{d}:{s.seq}"))
+    return sse_broadcast.BroadcastFrame(seq=seq, event="temp", batch_event="temp_batch", items=items)
+
+
+TELEMETRY_BROADCASTER = sse_broadcast.SSEBroadcaster("telemetry.temperature", _telemetry_frame)
+
+
 @app.get("/api/telemetry/temperature/stream")
-async def temperature_stream(rate_hz: float = Query(2.0, ge=0.2, le=20.0)):
+async def temperature_stream(
+    rate_hz: float = Query(2.0, ge=0.2, le=20.0),
+    batch: bool = Query(False),
+):
     """Stream simulated telemetry samples over SSE.
+
+    All connections share one producer (`TELEMETRY_BROADCASTER`) that samples
+    the devices once per tick at the fastest requested rate and encodes each
+    tick once; every client receives the pre-encoded bytes at its own
+    ``rate_hz``. Slow clients are coalesced and eventually dropped.
     
     Parameters
     ----------
     rate_hz : float
-        Value supplied by the API caller or internal orchestration.
+        Events per second for this client.
+    batch : bool
+        Send one ``temp_batch`` event with all devices' samples per tick
+        instead of one ``temp`` event per sample.
     
     Returns
     -------
@@ -2392,30 +3802,20 @@ async def temperature_stream(rate_hz: float = Query(2.0, ge=0.2, le=20.0)):
     interval = 1.0 / rate_hz
 
     async def gen():
-        """Yield SSE payloads for temperature samples and periodic ping keepalives."""
-        last_ping = time.time()
-
-        # optional initial burst
-        for d in DEVICE_IDS:
-            s = source.generate_one(d)
-            if s:
-                latest_by_dev[d] = s
-                yield sse_format("temp", asdict(s), event_id=f"{d}:{s.seq}")
-
-        while True:
-            start = time.time()
-
-            for d in DEVICE_IDS:
-                s = source.generate_one(d)
-                if s:
-                    latest_by_dev[d] = s
-                    yield sse_format("temp", asdict(s), event_id=f"{d}:{s.seq}")
-
-            if time.time() - last_ping >= 15:
-                last_ping = time.time()
-                yield sse_format("ping", {"ts": datetime.datetime.now(timezone.utc).isoformat()})
-
-            elapsed = time.time() - start
-            await asyncio.sleep(max(0.0, interval - elapsed))
+        """Yield broadcast frames and periodic ping keepalives until disconnect or drop."""
+        subscriber = TELEMETRY_BROADCASTER.subscribe(interval, batch=batch)
+        last_ping = time.monotonic()
+        try:
+            while True:
+                data = await subscriber.get(timeout=JOB_EVENT_PING_S)
+                if data is None:
+                    break
+                if data:
+                    yield data
+                if time.monotonic() - last_ping >= JOB_EVENT_PING_S:
+                    last_ping = time.monotonic()
+                    yield sse_format("ping", {"ts": datetime.datetime.now(timezone.utc).isoformat()})
+        finally:
+            TELEMETRY_BROADCASTER.unsubscribe(subscriber)
 
     return StreamingResponse(gen(), media_type="text/event-stream")
@@ -0,0 +1,166 @@
+"""Stateless HTTP front of the box API for multi-worker deployments.
+
+In the split deployment the acquisition daemon (`rest_api.app`, started with
+``BOX_SHARED_STATE=1`` on the Unix socket ``BOX_DAEMON_SOCKET``) owns the
+potentiostats and all job and slot state. This module is the public HTTP app
+and may run with several uvicorn workers, so one slow download no longer
+delays status calls:
+
+- job status reads (`GET /jobs`, `GET /jobs/{run_id}`, `POST /jobs/status`)
+  are answered from the job store that the daemon mirrors its jobs into;
+- run files, previews and ZIP downloads are read from disk;
+- every other route is forwarded to the daemon and its response relayed as it
+  arrives (server-sent event streams included).
+
+The local routes are the daemon's own handlers. Nothing runs in this process
+besides the request handlers: its in-memory job table stays empty, so they
+fall back to the job store and the run index. Since the front cannot tell
+whether a run is still being written, it never builds ZIP archives: it serves
+the daemon's cached archive or streams the run.
+"""
+
+from __future__ import annotations
+
+import http.client
+import logging
+import os
+import socket
+from typing import Dict, Iterator, Tuple
+
+from fastapi import FastAPI, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+import app as box_app
+
+# The daemon builds run archives; every front worker would otherwise race it.
+box_app.BUILD_RUN_ARCHIVES = False
+# Likewise for run manifests: the front only reads the daemon's files.
+box_app.RUN_MANIFESTS.writable = False
+
+log = logging.getLogger("rest_api.http_front")
+
+DAEMON_SOCKET = os.getenv("BOX_DAEMON_SOCKET", "/run/box/acquisition.sock")
+DAEMON_TIMEOUT_S = float(os.getenv("BOX_DAEMON_TIMEOUT_S", "300"))
+RELAY_CHUNK_BYTES = 64 * 1024
+
+# (method, path) of the daemon routes this front answers itself.
+LOCAL_ROUTES = {
+    ("GET", "/jobs"),
+    ("GET", "/jobs/{run_id}"),
+    ("POST", "/jobs/status"),
+    ("GET", "/runs/{run_id}/files"),
+    ("GET", "/runs/{run_id}/file"),
+    ("GET", "/runs/{run_id}/preview"),
+    ("GET", "/runs/{run_id}/zip"),
+}
+
+# Connection-level headers that are not forwarded in either direction.
+_HOP_HEADERS = {
+    "connection",
+    "content-length",
+    "host",
+    "keep-alive",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to the daemon's Unix socket."""
+
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+def _open(
+    method: str, target: str, body: bytes, headers: Dict[str, str]
+) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    conn = _UnixHTTPConnection(DAEMON_SOCKET, DAEMON_TIMEOUT_S)
+    try:
+        conn.request(method, target, body=body or None, headers=headers)
+        return conn, conn.getresponse()
+    except Exception:
+        conn.close()
+        raise
+
+
+def _relay(conn: http.client.HTTPConnection, upstream: http.client.HTTPResponse) -> Iterator[bytes]:
+    """Yield the daemon's response body as it arrives."""
+    try:
+        while True:
+            chunk = upstream.read1(RELAY_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        conn.close()
+
+
+async def forward(request: Request) -> Response:
+    """Forward a request to the acquisition daemon and relay its response.
+
+    Bodies with a ``Content-Length`` are returned in one piece; streamed
+    responses (server-sent events, chunked downloads) are relayed chunk by
+    chunk.
+    """
+    target = request.url.path + (f"?{request.url.query}" if request.url.query else "")
+    headers = {key: value for key, value in request.headers.items() if key.lower() not in _HOP_HEADERS}
+    if request.client is not None:
+        headers["X-Forwarded-For"] = request.client.host
+    body = await request.body()
+    try:
+        conn, upstream = await run_in_threadpool(_open, request.method, target, body, headers)
+    except OSError as exc:
+        log.warning("Acquisition daemon unreachable at %s: %s", DAEMON_SOCKET, exc)
+        return box_app.http_error(
+            status_code=503,
+            code="daemon.unavailable",
+            message="Acquisition daemon is not reachable",
+            hint=f"Check that the daemon listens on {DAEMON_SOCKET}.",
+        )
+    response_headers = {
+        key: value for key, value in upstream.getheaders() if key.lower() not in _HOP_HEADERS
+    }
+    streamed = upstream.getheader("Content-Length") is None or (
+        upstream.getheader("Content-Type", "").startswith("text/event-stream")
+    )
+    if not streamed:
+        try:
+            content = await run_in_threadpool(upstream.read)
+        finally:
+            conn.close()
+        return Response(content=content, status_code=upstream.status, headers=response_headers)
+    return StreamingResponse(_relay(conn, upstream), status_code=upstream.status, headers=response_headers)
+
+
+app = FastAPI(title="Potentiostat Box API", version=box_app.API_VERSION)
+app.add_exception_handler(RequestValidationError, box_app.handle_request_validation)
+# Same contract as the daemon; /docs documents the full API.
+app.openapi = box_app.app.openapi
+
+# Mirror the daemon's routes in their order, so static paths such as
+# /jobs/events still win over /jobs/{run_id}.
+for route in box_app.app.routes:
+    if not isinstance(route, APIRoute):
+        continue
+    if all((method, route.path) in LOCAL_ROUTES for method in route.methods):
+        app.router.routes.append(route)
+    else:
+        app.add_api_route(route.path, forward, methods=sorted(route.methods), include_in_schema=False)
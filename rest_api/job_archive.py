@@ -0,0 +1,249 @@
+"""Disk archive of finished jobs behind `/jobs` and `/jobs/{run_id}`.
+
+`rest_api.app` keeps queued, running and recently finished jobs in its
+in-memory job table. Terminal jobs older than ``BOX_JOB_MEMORY_AGE_S``, or
+beyond the newest ``BOX_JOB_MEMORY_MAX``, are moved here and served from disk,
+so the table stays bounded and the job history survives restarts.
+
+The archive is the SQLite database `<RUNS_ROOT>/_job_archive.sqlite3` (WAL
+mode, one connection per thread like the run index in `storage`). Each row
+holds the final status snapshot as JSON plus the columns the job list needs.
+Rows are indexed by run id, by group and by ``(started_at, run_id)``, so a
+`/jobs` page is one index range scan whatever the size of the history.
+
+With ``BOX_SHARED_STATE=1`` the acquisition process also mirrors queued and
+running jobs into the same table, and the stateless front workers of
+`http_front` answer job status reads from it.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    " run_id TEXT PRIMARY KEY,"
+    " mode TEXT NOT NULL,"
+    " status TEXT NOT NULL,"
+    " started_at TEXT NOT NULL,"
+    " ended_at TEXT,"
+    " devices TEXT NOT NULL,"
+    " group_key TEXT,"
+    " folder_key TEXT,"
+    " version INTEGER NOT NULL,"
+    " body BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS jobs_started ON jobs (started_at, run_id)",
+    "CREATE INDEX IF NOT EXISTS jobs_group ON jobs (group_key, started_at, run_id)",
+    "CREATE INDEX IF NOT EXISTS jobs_folder ON jobs (folder_key, started_at, run_id)",
+    "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, started_at, run_id)",
+)
+
+SHARED_STATE_ENV = "BOX_SHARED_STATE"
+ACTIVE_STATES = ("queued", "running")
+
+_LIST_COLUMNS = "run_id, mode, status, started_at, ended_at, devices, group_key, folder_key, version"
+
+# Position in the job list: ``(started_at, run_id)`` of the last item returned.
+Cursor = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class ArchivedJob:
+    """One archived job.
+
+    Attributes
+    ----------
+    run_id, mode, status, started_at, ended_at : str
+        Overview fields as listed by `/jobs`.
+    devices : List[str]
+        Slots of the run.
+    group_key, folder_key : Optional[str]
+        Lower-cased client group id and storage group folder, for
+        ``/jobs?group_id=`` filtering.
+    version : int
+        State version of the final snapshot (used for ETags and
+        ``since_version``).
+    body : bytes
+        Final `JobStatus` snapshot as JSON; empty in list results.
+    """
+
+    run_id: str
+    mode: str
+    status: str
+    started_at: str
+    ended_at: Optional[str]
+    devices: List[str]
+    group_key: Optional[str]
+    folder_key: Optional[str]
+    version: int
+    body: bytes = b""
+
+
+def shared_state_from_env() -> bool:
+    """Whether ``BOX_SHARED_STATE`` asks to mirror active jobs into the store."""
+    return os.getenv(SHARED_STATE_ENV, "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def encode_cursor(position: Cursor) -> str:
+    """Opaque cursor string for a list position."""
+    return base64.urlsafe_b64encode(json.dumps(list(position)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Inverse of `encode_cursor`; raises ``ValueError`` for malformed input."""
+    try:
+        started_at, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+    if not isinstance(started_at, str) or not isinstance(run_id, str):
+        raise ValueError("invalid cursor")
+    return started_at, run_id
+
+
+class JobArchive:
+    """SQLite store of terminal (and, when shared, active) jobs.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Database file; created with its schema on first use.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self._local = threading.local()
+        conn = self._connection()
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def store(self, jobs: Iterable[ArchivedJob]) -> None:
+        """Insert or replace jobs in one transaction."""
+        rows = [
+            (
+                job.run_id,
+                job.mode,
+                job.status,
+                job.started_at,
+                job.ended_at,
+                json.dumps(job.devices),
+                job.group_key,
+                job.folder_key,
+                job.version,
+                job.body,
+            )
+            for job in jobs
+        ]
+        if not rows:
+            return
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO jobs ({_LIST_COLUMNS}, body) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def get(self, run_id: str) -> Optional[ArchivedJob]:
+        """Archived job with its snapshot, or ``None``."""
+        return self.get_many([run_id]).get(run_id)
+
+    def get_many(self, run_ids: Sequence[str]) -> Dict[str, ArchivedJob]:
+        """Archived jobs (with snapshots) among ``run_ids``, keyed by run id."""
+        found: Dict[str, ArchivedJob] = {}
+        unique = list(dict.fromkeys(run_ids))
+        conn = self._connection()
+        # Stay below SQLite's bound-parameter limit.
+        for start in range(0, len(unique), 500):
+            chunk = unique[start : start + 500]
+            rows = conn.execute(
+                f"SELECT {_LIST_COLUMNS}, body FROM jobs WHERE run_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                found[row[0]] = _job_from_row(row)
+        return found
+
+    def page(
+        self,
+        before: Optional[Cursor] = None,
+        limit: Optional[int] = None,
+        group_key: Optional[str] = None,
+        statuses: Optional[Sequence[str]] = None,
+    ) -> List[ArchivedJob]:
+        """Jobs newest first (by ``started_at``, then ``run_id``), without snapshots.
+
+        Parameters
+        ----------
+        before : Optional[Cursor]
+            Only jobs strictly after this list position.
+        limit : Optional[int]
+            Maximum number of jobs (all when ``None``).
+        group_key : Optional[str]
+            Lower-cased group; matches the group id or the storage folder.
+        statuses : Optional[Sequence[str]]
+            Only jobs in one of these list states.
+        """
+        clauses: List[str] = []
+        params: List[object] = []
+        if group_key:
+            clauses.append("(group_key = ? OR folder_key = ?)")
+            params.extend((group_key, group_key))
+        if statuses is not None:
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if before is not None:
+            clauses.append("(started_at, run_id) < (?, ?)")
+            params.extend(before)
+        sql = f"SELECT {_LIST_COLUMNS} FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY started_at DESC, run_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [_job_from_row(row) for row in self._connection().execute(sql, params).fetchall()]
+
+    def active(self) -> List[ArchivedJob]:
+        """Queued or running jobs with their snapshots."""
+        rows = self._connection().execute(
+            f"SELECT {_LIST_COLUMNS}, body FROM jobs WHERE status IN ({', '.join('?' * len(ACTIVE_STATES))})",
+            ACTIVE_STATES,
+        ).fetchall()
+        return [_job_from_row(row) for row in rows]
+
+    def max_version(self) -> int:
+        """Highest archived state version (``0`` when empty)."""
+        row = self._connection().execute("SELECT MAX(version) FROM jobs").fetchone()
+        return int(row[0] or 0)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+
+def _job_from_row(row: Tuple) -> ArchivedJob:
+    return ArchivedJob(
+        run_id=row[0],
+        mode=row[1],
+        status=row[2],
+        started_at=row[3],
+        ended_at=row[4],
+        devices=json.loads(row[5]),
+        group_key=row[6],
+        folder_key=row[7],
+        version=int(row[8]),
+        body=bytes(row[9]) if len(row) > 9 else b"",
+    )
@@ -0,0 +1,135 @@
+"""Bounded in-memory job event log behind `/jobs/events`.
+
+`rest_api.app` publishes an event whenever a job snapshot changes (slot and
+job transitions, mode switches) and when a finished measurement step has
+written its files. Each event gets an id ``<epoch>-<n>``; the epoch is drawn
+at startup so ids from before a restart are recognised as unknown.
+
+SSE clients resume with ``Last-Event-ID``: `JobEventLog.after(...)` returns the
+events after that id while it is still retained, or reports a gap (unknown
+epoch or id older than the oldest retained event) so the stream can send a
+``resync`` with fresh snapshots instead.
+
+Subscribers are asyncio events set from publishing threads through
+``loop.call_soon_threadsafe``, so streams wake up as soon as something happens
+without polling the log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Set, Tuple
+
+DEFAULT_MAX_EVENTS = 2048
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """One published event; ``data`` is serialized JSON."""
+
+    seq: int
+    event: str
+    run_id: str
+    group: Optional[str]
+    data: str
+
+
+class JobEventLog:
+    """Thread-safe ring buffer of job events with asyncio wake-ups."""
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.epoch = secrets.token_hex(4)
+        self._lock = threading.Lock()
+        self._events: Deque[JobEvent] = deque(maxlen=max_events)
+        self._seq = 0
+        self._subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def event_id(self, seq: int) -> str:
+        """Return the SSE id of sequence number ``seq``."""
+        return f"{self.epoch}-{seq}"
+
+    def head(self) -> int:
+        """Sequence number of the newest event (0 before the first one)."""
+        with self._lock:
+            return self._seq
+
+    def publish(self, event: str, run_id: str, group: Optional[str], data: str) -> int:
+        """Append an event and wake all subscribers.
+
+        Parameters
+        ----------
+        event : str
+            SSE event name.
+        run_id : str
+            Run the event belongs to.
+        group : Optional[str]
+            Lower-cased group id of the run, used for stream filters.
+        data : str
+            JSON payload.
+
+        Returns
+        -------
+        int
+            Sequence number of the new event.
+        """
+        with self._lock:
+            self._seq += 1
+            self._events.append(JobEvent(self._seq, event, run_id, group, data))
+            subscribers = list(self._subscribers)
+            seq = self._seq
+        for loop, wake in subscribers:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                # Loop already closed; the stream is gone.
+                pass
+        return seq
+
+    def parse_id(self, last_event_id: Optional[str]) -> Optional[int]:
+        """Sequence number of a ``Last-Event-ID`` from this epoch, else ``None``."""
+        if not last_event_id:
+            return None
+        epoch, _, seq = last_event_id.strip().partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def after(self, seq: int) -> Tuple[bool, List[JobEvent]]:
+        """Events newer than ``seq``.
+
+        Returns
+        -------
+        Tuple[bool, List[JobEvent]]
+            ``(complete, events)``; ``complete`` is ``False`` when events after
+            ``seq`` were already dropped from the buffer.
+        """
+        with self._lock:
+            if seq > self._seq:
+                return False, []
+            if seq == self._seq:
+                return True, []
+            oldest = self._events[0].seq if self._events else self._seq + 1
+            events = [event for event in self._events if event.seq > seq]
+        return seq >= oldest - 1, events
+
+    def subscribe(self) -> asyncio.Event:
+        """Register the running loop for wake-ups; pair with `unsubscribe`."""
+        wake = asyncio.Event()
+        with self._lock:
+            self._subscribers.add((asyncio.get_running_loop(), wake))
+        return wake
+
+    def unsubscribe(self, wake: asyncio.Event) -> None:
+        """Remove a subscriber registered by `subscribe`."""
+        with self._lock:
+            self._subscribers = {item for item in self._subscribers if item[1] is not wake}
+
+
+def format_event(event: str, data: str, event_id: Optional[str] = None) -> str:
+    """Serialize an SSE message whose ``data`` is already JSON."""
+    message = f"id: {event_id}\n" if event_id is not None else ""
+    return message + f"event: {event}\ndata: {data}\n\n"
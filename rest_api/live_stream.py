@@ -0,0 +1,265 @@
+"""Per-slot live measurement blocks behind `/runs/{run_id}/live`.
+
+`rest_api.app` passes a `LiveSink` as ``live_sink`` to
+`PotentiostatController.apply_measurement`. pyBEEP's `DataLogger` calls it with
+every batch it writes (time, potential, current); the sink decimates the rows
+to a configured number of points per second and publishes them roughly every
+`DEFAULT_BLOCK_INTERVAL_S` as a `LiveBlock` into the ring buffer of the run's
+slot (`LiveChannel`).
+
+Subscribers never hold a queue of their own: each one reads from the shared
+ring buffer by sequence number, so a slow client only falls behind (and skips
+blocks that were overwritten) while acquisition and other clients carry on.
+Blocks encode themselves once per wire format:
+
+- ``json``: an SSE ``block`` event ``{"seq","slot","mode","t","E","I"}``.
+- ``binary``: little-endian frames ``uint32 seq, uint32 rows, uint8 len(slot),
+  uint8 len(mode)``, the ASCII slot and mode, then ``rows * 3`` float32 values
+  (time, potential, current per row). A frame with zero rows and empty slot
+  and mode is a keepalive.
+
+With process slot workers (`slot_workers`), the worker decimates with its own
+`Decimator` and forwards the reduced rows to the parent's sink.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+DEFAULT_POINTS_PER_S = 50.0
+DEFAULT_BLOCK_INTERVAL_S = 0.25
+DEFAULT_BUFFER_BLOCKS = 480  # ~2 minutes at the default block interval
+DEFAULT_MAX_CHANNELS = 64
+
+_FRAME_HEADER = struct.Struct("<IIBB")
+
+
+def keepalive_frame() -> bytes:
+    """Binary keepalive frame (zero rows, empty slot and mode)."""
+    return _FRAME_HEADER.pack(0, 0, 0, 0)
+
+
+class Decimator:
+    """Keeps the first row of every ``1 / points_per_s`` time bucket."""
+
+    def __init__(self, points_per_s: float) -> None:
+        self.points_per_s = float(points_per_s)
+        self._last_bucket: Optional[float] = None
+
+    def feed(self, rows: np.ndarray) -> np.ndarray:
+        """Return the rows of ``rows`` (time in column 0) that start a new bucket."""
+        if not len(rows):
+            return rows
+        buckets = np.floor(rows[:, 0] * self.points_per_s)
+        previous = np.empty_like(buckets)
+        previous[0] = np.nan if self._last_bucket is None else self._last_bucket
+        previous[1:] = buckets[:-1]
+        self._last_bucket = float(buckets[-1])
+        return rows[buckets != previous]
+
+
+@dataclass
+class LiveBlock:
+    """Decimated rows of one slot and mode, encoded lazily per format."""
+
+    seq: int
+    slot: str
+    mode: str
+    rows: np.ndarray
+    _encoded: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    def encode(self, fmt: str) -> bytes:
+        """Wire representation of the block in ``fmt`` (cached)."""
+        data = self._encoded.get(fmt)
+        if data is None:
+            if fmt == "binary":
+                slot, mode = self.slot.encode("ascii", "replace"), self.mode.encode("ascii", "replace")
+                data = (
+                    _FRAME_HEADER.pack(self.seq, len(self.rows), len(slot), len(mode))
+                    + slot
+                    + mode
+                    + np.ascontiguousarray(self.rows, dtype="<f4").tobytes()
+                )
+            else:
+                payload = {
+                    "seq": self.seq,
+                    "slot": self.slot,
+                    "mode": self.mode,
+                    "t": self.rows[:, 0].tolist(),
+                    "E": self.rows[:, 1].tolist(),
+                    "I": self.rows[:, 2].tolist(),
+                }
+                data = f"id: {self.seq}\nevent: block\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n".encode()
+            self._encoded[fmt] = data
+        return data
+
+
+class LiveChannel:
+    """Ring buffer of the live blocks of one run slot."""
+
+    def __init__(self, hub: "LiveStreamHub", run_id: str, slot: str, max_blocks: int) -> None:
+        self.run_id = run_id
+        self.slot = slot
+        self.finished = False
+        self._hub = hub
+        self._lock = threading.Lock()
+        self._blocks: Deque[LiveBlock] = deque(maxlen=max_blocks)
+        self._seq = 0
+
+    def publish(self, mode: str, rows: np.ndarray) -> None:
+        """Append a block and wake subscribers."""
+        with self._lock:
+            self._seq += 1
+            self._blocks.append(LiveBlock(self._seq, self.slot, mode, rows))
+        self._hub.notify()
+
+    def finish(self) -> None:
+        """Mark the slot's acquisition as finished."""
+        self.finished = True
+        self._hub.notify()
+
+    def after(self, seq: int) -> Tuple[List[LiveBlock], bool]:
+        """Retained blocks newer than ``seq`` and whether the channel is finished."""
+        with self._lock:
+            finished = self.finished
+            blocks = [block for block in self._blocks if block.seq > seq]
+        return blocks, finished
+
+
+class LiveSink:
+    """Callable handed to pyBEEP as ``live_sink`` for one slot and mode.
+
+    Decimates incoming rows and publishes a block whenever
+    ``block_interval_s`` has passed since the previous one; `flush` publishes
+    the remainder when the measurement ends.
+    """
+
+    def __init__(self, channel: LiveChannel, mode: str, points_per_s: float, block_interval_s: float) -> None:
+        self.channel = channel
+        self.mode = mode
+        self.points_per_s = points_per_s
+        self.block_interval_s = block_interval_s
+        self._decimator = Decimator(points_per_s)
+        self._pending: List[np.ndarray] = []
+        self._last_publish = time.monotonic()
+
+    def __call__(self, rows: np.ndarray) -> None:
+        reduced = self._decimator.feed(np.asarray(rows, dtype=np.float64))
+        if len(reduced):
+            self._pending.append(reduced)
+        if self._pending and time.monotonic() - self._last_publish >= self.block_interval_s:
+            self.flush()
+
+    def flush(self) -> None:
+        """Publish rows that have not been published yet."""
+        self._last_publish = time.monotonic()
+        if not self._pending:
+            return
+        rows = self._pending[0] if len(self._pending) == 1 else np.concatenate(self._pending)
+        self._pending = []
+        self.channel.publish(self.mode, rows)
+
+
+class LiveStreamHub:
+    """Live channels of recent runs plus asyncio wake-ups for subscribers.
+
+    Parameters
+    ----------
+    points_per_s : float
+        Decimated rate per slot; ``0`` disables live output.
+    block_interval_s : float
+        Minimum time between published blocks of one slot.
+    max_blocks : int
+        Blocks retained per slot.
+    max_channels : int
+        Channels kept in memory; the oldest finished ones are evicted first.
+    """
+
+    def __init__(
+        self,
+        points_per_s: float = DEFAULT_POINTS_PER_S,
+        block_interval_s: float = DEFAULT_BLOCK_INTERVAL_S,
+        max_blocks: int = DEFAULT_BUFFER_BLOCKS,
+        max_channels: int = DEFAULT_MAX_CHANNELS,
+    ) -> None:
+        self.points_per_s = points_per_s if math.isfinite(points_per_s) else 0.0
+        self.block_interval_s = block_interval_s
+        self.max_blocks = max_blocks
+        self.max_channels = max_channels
+        self._lock = threading.Lock()
+        self._channels: "OrderedDict[Tuple[str, str], LiveChannel]" = OrderedDict()
+        self._subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.points_per_s > 0
+
+    def sink(self, run_id: str, slot: str, mode: str) -> LiveSink:
+        """Sink for one measurement of ``slot``; creates the slot's channel on first use."""
+        with self._lock:
+            key = (run_id, slot)
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._channels[key] = LiveChannel(self, run_id, slot, self.max_blocks)
+                self._evict_locked()
+            channel.finished = False
+        self.notify()
+        return LiveSink(channel, mode, self.points_per_s, self.block_interval_s)
+
+    def finish(self, run_id: str, slot: str) -> None:
+        """Mark the acquisition of ``slot`` in ``run_id`` as finished (if it streamed)."""
+        with self._lock:
+            channel = self._channels.get((run_id, slot))
+        if channel is not None:
+            channel.finish()
+
+    def channels(self, run_id: str, slot: Optional[str] = None) -> List[LiveChannel]:
+        """Channels of ``run_id``, optionally only the one of ``slot``."""
+        with self._lock:
+            return [
+                channel
+                for (channel_run, channel_slot), channel in self._channels.items()
+                if channel_run == run_id and (slot is None or channel_slot == slot)
+            ]
+
+    def _evict_locked(self) -> None:
+        excess = len(self._channels) - self.max_channels
+        if excess <= 0:
+            return
+        finished = [key for key, channel in self._channels.items() if channel.finished]
+        for key in (finished + list(self._channels))[:excess]:
+            self._channels.pop(key, None)
+
+    # ----- subscriber wake-ups -----
+    def subscribe(self) -> asyncio.Event:
+        """Register the running loop for wake-ups; pair with `unsubscribe`."""
+        wake = asyncio.Event()
+        with self._lock:
+            self._subscribers.add((asyncio.get_running_loop(), wake))
+        return wake
+
+    def unsubscribe(self, wake: asyncio.Event) -> None:
+        """Remove a subscriber registered by `subscribe`."""
+        with self._lock:
+            self._subscribers = {item for item in self._subscribers if item[1] is not wake}
+
+    def notify(self) -> None:
+        """Wake all subscribers from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, wake in subscribers:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                # Loop already closed; the stream is gone.
+                pass
@@ -0,0 +1,271 @@
+"""Out-of-band rendering of measurement PNGs for ``make_plot`` runs.
+
+`rest_api.app` submits one `PlotTask` per finished measurement to the
+module-level `PlotPool` and marks the slot ``done`` right away; the PNG is
+attached to the slot's files by the completion callback once it exists.
+
+- Rendering runs in a bounded process pool (``BOX_PLOT_WORKERS``, default 1;
+  ``0`` renders in one background thread of the API process). Tasks wait in a
+  FIFO queue until a worker is free.
+- Workers do not parse the full file: `preview.decimate` streams the capture
+  or CSV and keeps a few rows per plotted point (first/last/min/max per
+  bucket), which matplotlib draws like the full series.
+- With ``BOX_DEFER_PLOTS=1`` no task is dispatched while any slot is
+  acquiring; `PlotPool.poke` re-checks after each slot sequence ends.
+
+PNGs are written to a temporary name and renamed, so file listings never see a
+partial image. The worker hashes the bytes as matplotlib writes them and
+returns size and sha256, which the callback records in the run manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Deque, Optional, Tuple
+
+log = logging.getLogger("rest_api.plot_pool")
+
+PLOT_WORKERS_ENV = "BOX_PLOT_WORKERS"
+DEFER_PLOTS_ENV = "BOX_DEFER_PLOTS"
+DEFAULT_WORKERS = 1
+# Plotted points per line; the figures are 800-1000 px wide.
+PLOT_POINTS = 4000
+
+
+@dataclass(frozen=True)
+class PlotTask:
+    """One PNG to render.
+
+    Attributes
+    ----------
+    run_id, slot : str
+        Owner of the measurement, used by the completion callback.
+    source : str
+        Capture directory or CSV of the measurement.
+    png_path : str
+        Output path (next to the nominal CSV).
+    mode : str
+        Measurement mode; ``CV`` plots current vs potential per cycle.
+    cycles : Optional[int]
+        Number of CV cycles to draw (all when ``None``).
+    """
+
+    run_id: str
+    slot: str
+    source: str
+    png_path: str
+    mode: str
+    cycles: Optional[int] = None
+
+
+class _HashingWriter:
+    """Binary file object that hashes everything written through it."""
+
+    def __init__(self, handle) -> None:
+        self._handle = handle
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self._handle.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+
+def render_png(
+    source: str, png_path: str, mode: str, cycles: Optional[int] = None, points: int = PLOT_POINTS
+) -> Optional[Tuple[int, str]]:
+    """Render the standard measurement figure from decimated data.
+
+    Same layout as pyBEEP's ``plot_cv_cycles``/``plot_time_series``. Runs in a
+    pool worker.
+
+    Returns
+    -------
+    Optional[Tuple[int, str]]
+        Size and sha256 (hex) of the written PNG, ``None`` when there was no data.
+    """
+    import pathlib
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    from preview import CAPTURE_SUFFIX, decimate
+
+    path = pathlib.Path(source)
+    if not path.exists():
+        return None
+    label = path.name[: -len(CAPTURE_SUFFIX)] + ".csv" if path.suffix == CAPTURE_SUFFIX else path.name
+    if (mode or "").upper() == "CV":
+        data = decimate(path, ["Potential (V)", "Current (A)", "Cycle"], points, rank=(0, 1))
+        fig, ax = plt.subplots(figsize=(8, 6))
+        fig.suptitle("Cyclic Voltammetry (CV) - Individual Cycles")
+        color_map = plt.get_cmap("tab10")
+        cycle_ids = np.unique(data["Cycle"])
+        if cycles is not None:
+            cycle_ids = cycle_ids[: max(int(cycles), 0)]
+        for color_idx, cycle in enumerate(cycle_ids):
+            mask = data["Cycle"] == cycle
+            ax.plot(
+                data["Potential (V)"][mask],
+                data["Current (A)"][mask],
+                label=f"{label} - Cycle {int(cycle)}" if len(cycle_ids) > 1 else label,
+                color=color_map(color_idx % 10),
+            )
+        ax.set_xlabel("Potential (V)")
+        ax.set_ylabel("Current (A)")
+        if len(cycle_ids):
+            ax.legend()
+    else:
+        data = decimate(path, ["Time (s)", "Current (A)", "Potential (V)"], points, rank=(1, 2))
+        fig, axs = plt.subplots(2, 1, sharex=True, figsize=(10, 6))
+        fig.suptitle("Current & Potential vs Time")
+        axs[0].plot(data["Time (s)"], data["Current (A)"], label=label)
+        axs[1].plot(data["Time (s)"], data["Potential (V)"], label=label)
+        axs[0].set_ylabel("Current (A)", color="tab:red")
+        axs[1].set_ylabel("Potential (V)", color="tab:blue")
+        axs[1].set_xlabel("Time (s)")
+    plt.tight_layout(rect=(0, 0, 1, 0.96))
+    tmp_path = png_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as handle:
+            writer = _HashingWriter(handle)
+            fig.savefig(writer, format="png")
+    finally:
+        plt.close(fig)
+    os.replace(tmp_path, png_path)
+    return writer.size, writer.digest.hexdigest()
+
+
+# ``on_done(task, written)``: ``written`` is the PNG's (size, sha256), ``None`` on failure.
+DoneCallback = Callable[[PlotTask, Optional[Tuple[int, str]]], None]
+
+
+class PlotPool:
+    """Bounded worker pool with a FIFO queue of `PlotTask`s.
+
+    Parameters
+    ----------
+    workers : int
+        Worker processes; ``0`` renders in a single thread instead.
+    defer_while_busy : bool
+        Hold all tasks while ``is_busy()`` returns ``True``.
+    is_busy : Optional[Callable[[], bool]]
+        Whether any slot is acquiring; only used with ``defer_while_busy``.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        defer_while_busy: bool = False,
+        is_busy: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.workers = max(int(workers), 0)
+        self.defer_while_busy = defer_while_busy
+        self._is_busy = is_busy
+        self._lock = threading.Lock()
+        self._queue: Deque[Tuple[PlotTask, DoneCallback]] = deque()
+        self._running = 0
+        self._executor: Optional[Executor] = None
+
+    @property
+    def pending(self) -> int:
+        """Queued plus running tasks."""
+        with self._lock:
+            return len(self._queue) + self._running
+
+    def submit(self, task: PlotTask, on_done: DoneCallback) -> None:
+        """Queue ``task``; ``on_done(task, written)`` runs on a pool thread afterwards."""
+        with self._lock:
+            self._queue.append((task, on_done))
+        self.poke()
+
+    def poke(self) -> None:
+        """Dispatch queued tasks to free workers (unless deferred)."""
+        while True:
+            with self._lock:
+                if not self._queue or self._running >= max(self.workers, 1):
+                    return
+                if self.defer_while_busy and self._is_busy is not None and self._is_busy():
+                    return
+                task, on_done = self._queue.popleft()
+                self._running += 1
+                executor = self._ensure_executor_locked()
+            try:
+                future = executor.submit(render_png, task.source, task.png_path, task.mode, task.cycles)
+            except Exception:
+                log.exception("Plot dispatch failed run_id=%s slot=%s", task.run_id, task.slot)
+                with self._lock:
+                    self._running -= 1
+                    self._executor = None
+                self._complete(task, on_done, None)
+                continue
+            future.add_done_callback(lambda f, task=task, on_done=on_done: self._finished(f, task, on_done))
+
+    def shutdown(self) -> None:
+        """Stop the workers; queued tasks are dropped."""
+        with self._lock:
+            self._queue.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_executor_locked(self) -> Executor:
+        if self._executor is None:
+            if self.workers:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plot")
+        return self._executor
+
+    def _finished(self, future: Future, task: PlotTask, on_done: DoneCallback) -> None:
+        written: Optional[Tuple[int, str]] = None
+        try:
+            written = future.result()
+        except BrokenProcessPool:
+            log.error("Plot worker died run_id=%s slot=%s; restarting pool", task.run_id, task.slot)
+            with self._lock:
+                self._executor = None
+        except Exception:
+            log.exception("Plot failed run_id=%s slot=%s source=%s", task.run_id, task.slot, task.source)
+        with self._lock:
+            self._running -= 1
+        self._complete(task, on_done, written)
+        self.poke()
+
+    @staticmethod
+    def _complete(task: PlotTask, on_done: DoneCallback, written: Optional[Tuple[int, str]]) -> None:
+        try:
+            on_done(task, written)
+        except Exception:
+            log.exception("Plot callback failed run_id=%s slot=%s", task.run_id, task.slot)
+
+
+def workers_from_env() -> int:
+    """Worker count from ``BOX_PLOT_WORKERS``."""
+    try:
+        return max(int(os.getenv(PLOT_WORKERS_ENV, str(DEFAULT_WORKERS))), 0)
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def defer_from_env() -> bool:
+    """Whether ``BOX_DEFER_PLOTS`` asks to plot only while no slot is acquiring."""
+    return os.getenv(DEFER_PLOTS_ENV, "0").strip().lower() in ("1", "true", "yes", "on")
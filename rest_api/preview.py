@@ -0,0 +1,399 @@
+"""Downsampled previews of measurement files behind `/runs/{run_id}/preview`.
+
+`rest_api.app` resolves the measurement of one run slot and mode (binary
+capture or CSV) and asks the module-level `PreviewCache` for a preview of two
+of its columns. Files are never loaded as a whole:
+
+- CSV files are parsed in blocks of `CSV_CHUNK_BYTES`; only complete lines are
+  used, so files that are still being written can be previewed.
+- Binary captures (``*.beepcap``) are read through their memory-mapped
+  columns, limited to the rows present in every column file.
+
+While reading, `StreamingReducer` keeps first/last/min/max per row bucket (M4)
+and doubles the bucket width whenever the candidate budget is exceeded. The
+final preview is computed from those candidates with LTTB (largest triangle
+three buckets) or plain min-max bucketing.
+
+Results are cached per file (inode, size, mtime), columns, points and method.
+The reducer state is kept as well: when a file grows while the run is in
+progress, the next request only reads the appended part. `plot_pool` uses
+`decimate` to render PNGs from the same reduced rows.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import pathlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+CAPTURE_SUFFIX = ".beepcap"
+CAPTURE_HEADER = "header.json"
+CSV_CHUNK_BYTES = 4 * 1024 * 1024
+CAPTURE_CHUNK_ROWS = 262144
+DEFAULT_POINTS = 2000
+MAX_POINTS = 20000
+DEFAULT_CACHE_ENTRIES = 64
+# Candidates kept by the streaming reducer per requested output point.
+CANDIDATES_PER_POINT = 8
+METHODS = ("lttb", "minmax")
+
+
+class PreviewError(ValueError):
+    """Raised when a preview cannot be built for the requested columns."""
+
+    def __init__(self, message: str, columns: Optional[List[str]] = None) -> None:
+        super().__init__(message)
+        self.columns = list(columns or [])
+
+
+def resolve_column(columns: List[str], name: str) -> int:
+    """Index of ``name`` in ``columns``.
+
+    Matches the exact label first, then case-insensitively on the label or on
+    its part before the unit (``"current"`` -> ``"Current (A)"``).
+
+    Raises
+    ------
+    PreviewError
+        If no column matches.
+    """
+    if name in columns:
+        return columns.index(name)
+    wanted = name.strip().lower()
+    for index, label in enumerate(columns):
+        if label.lower() == wanted or label.split(" (", 1)[0].strip().lower() == wanted:
+            return index
+    raise PreviewError(f"Unknown column '{name}'", columns)
+
+
+def _m4_indices(buckets: np.ndarray, ranked: np.ndarray) -> np.ndarray:
+    """Sorted indices of the first and last row of every bucket plus the min
+    and max row of every column of ``ranked`` (shape ``(n, k)``).
+
+    ``buckets`` must be non-decreasing.
+    """
+    if len(buckets) == 0:
+        return np.empty(0, dtype=np.int64)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    keep = [starts, ends]
+    for column in range(ranked.shape[1]):
+        order = np.lexsort((ranked[:, column], buckets))
+        sorted_buckets = buckets[order]
+        low = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+        high = np.r_[low[1:], len(sorted_buckets)] - 1
+        keep.extend((order[low], order[high]))
+    return np.unique(np.concatenate(keep))
+
+
+@dataclass
+class StreamingReducer:
+    """Bounded M4 candidates of a growing multi-column series.
+
+    Column 0 is the x axis; the min and max of every column in ``rank`` are
+    kept per bucket, the remaining columns are carried along.
+
+    Attributes
+    ----------
+    budget : int
+        Maximum number of candidates kept.
+    rank : Tuple[int, ...]
+        Columns whose extremes are kept.
+    rows : int
+        Rows consumed so far.
+    offset : int
+        Source position after the last consumed row (bytes for CSV, rows for
+        captures).
+    """
+
+    budget: int
+    rank: Tuple[int, ...] = (1,)
+    rows: int = 0
+    offset: int = 0
+    width: int = 1
+    idx: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    values: Optional[np.ndarray] = None
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.values[:, 0] if self.values is not None else np.empty(0)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.values[:, 1] if self.values is not None else np.empty(0)
+
+    def feed(self, values: np.ndarray) -> None:
+        """Consume the next rows of the series (shape ``(n, columns)``)."""
+        count = len(values)
+        if not count:
+            return
+        idx = np.arange(self.rows, self.rows + count, dtype=np.int64)
+        self.rows += count
+        rank = list(self.rank)
+        if self.width > 1:
+            keep = _m4_indices(idx // self.width, values[:, rank])
+            idx, values = idx[keep], values[keep]
+        self.idx = np.concatenate([self.idx, idx])
+        self.values = values if self.values is None else np.concatenate([self.values, values])
+        while len(self.idx) > self.budget:
+            self.width *= 2
+            keep = _m4_indices(self.idx // self.width, self.values[:, rank])
+            self.idx, self.values = self.idx[keep], self.values[keep]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Indices selected by largest-triangle-three-buckets, first and last included."""
+    count = len(x)
+    if points >= count:
+        return np.arange(count)
+    if points < 3:
+        return np.array([0, count - 1])
+    every = (count - 2) / (points - 2)
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start = int(bucket * every) + 1
+        stop = int((bucket + 1) * every) + 1
+        next_stop = min(int((bucket + 2) * every) + 1, count)
+        if next_stop <= stop:
+            stop, next_stop = min(stop, count - 1), count
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + (int(np.nanargmax(area)) if np.isfinite(area).any() else 0)
+        selected[bucket + 1] = previous
+    return selected
+
+
+def minmax(idx: np.ndarray, y: np.ndarray, rows: int, points: int) -> np.ndarray:
+    """Indices of the first and last row and the min and max of ``(points - 2) // 2`` row buckets."""
+    count = len(idx)
+    if count <= points:
+        return np.arange(count)
+    buckets = idx * max((points - 2) // 2, 1) // max(rows, 1)
+    order = np.lexsort((y, buckets))
+    sorted_buckets = buckets[order]
+    low = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    high = np.r_[low[1:], len(sorted_buckets)] - 1
+    return np.unique(np.concatenate([[0, count - 1], order[low], order[high]]))
+
+
+# ----- sources -----
+
+def _csv_columns(path: pathlib.Path) -> List[str]:
+    with path.open("r", newline="") as handle:
+        first = handle.readline()
+    if not first.endswith("\n"):
+        return []
+    return [label.strip() for label in first.rstrip("\r\n").split(",")]
+
+
+def _read_csv(path: pathlib.Path, start: int, end: int, cols: Tuple[int, ...]) -> Iterator[Tuple[np.ndarray, int]]:
+    """Yield ``(values, next_offset)`` for complete lines between ``start`` and ``end``."""
+    with path.open("rb") as handle:
+        if start == 0:
+            header = handle.readline()
+            start = len(header)
+        handle.seek(start)
+        position = start
+        carry = b""
+        while position < end:
+            block = handle.read(min(CSV_CHUNK_BYTES, end - position))
+            if not block:
+                break
+            position += len(block)
+            data = carry + block
+            cut = data.rfind(b"\n")
+            if cut < 0:
+                carry = data
+                continue
+            carry = data[cut + 1:]
+            values = np.loadtxt(io.BytesIO(data[: cut + 1]), delimiter=",", usecols=cols, ndmin=2, dtype=np.float64)
+            yield values, position - len(carry)
+
+
+def _capture_state(path: pathlib.Path) -> Tuple[dict, Dict[str, np.ndarray], int]:
+    with (path / CAPTURE_HEADER).open(encoding="utf-8") as handle:
+        header = json.load(handle)
+    columns: Dict[str, np.ndarray] = {}
+    for name, spec in (header.get("columns") or {}).items():
+        col_path = path / spec["file"]
+        dtype = np.dtype(spec["dtype"])
+        size = col_path.stat().st_size if col_path.exists() else 0
+        rows = size // dtype.itemsize
+        columns[name] = np.memmap(col_path, dtype=dtype, mode="r", shape=(rows,)) if rows else np.empty(0, dtype=dtype)
+    rows = min((len(col) for col in columns.values()), default=0)
+    return header, columns, rows
+
+
+def _capture_column(header: dict, columns: Dict[str, np.ndarray], name: str, start: int, stop: int) -> np.ndarray:
+    if name == "Time (s)":
+        factor = int(header.get("reducing_factor", 1) or 1)
+        interval = float(header.get("point_interval", 0.0) or 0.0)
+        return np.arange(start, stop, dtype=np.float64) * factor * interval
+    if name == "Exp":
+        return np.ones(stop - start)
+    return np.asarray(columns[name][start:stop], dtype=np.float64)
+
+
+def _signature(path: pathlib.Path) -> Tuple[int, int, int]:
+    """``(inode, size, mtime)`` of a CSV, ``(inode, rows, header mtime)`` of a capture."""
+    stat = path.stat()
+    if path.suffix == CAPTURE_SUFFIX:
+        # The header is replaced atomically on every write, so its mtime tracks completion.
+        return stat.st_ino, _capture_state(path)[2], (path / CAPTURE_HEADER).stat().st_mtime_ns
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _stream(path: pathlib.Path, reducer: StreamingReducer, names: List[str], end: int) -> Tuple[List[str], List[str], Optional[bool]]:
+    """Feed ``reducer`` with columns ``names`` from ``reducer.offset`` up to ``end``.
+
+    Returns
+    -------
+    Tuple[List[str], List[str], Optional[bool]]
+        File columns, resolved labels of ``names`` and the capture's
+        ``complete`` flag (``None`` for CSV files).
+    """
+    if path.suffix == CAPTURE_SUFFIX:
+        header, columns, total = _capture_state(path)
+        labels = list(header.get("csv_columns") or [])
+        resolved = [labels[resolve_column(labels, name)] for name in names]
+        end = min(end, total)
+        for start in range(reducer.offset, end, CAPTURE_CHUNK_ROWS):
+            stop = min(start + CAPTURE_CHUNK_ROWS, end)
+            reducer.feed(np.column_stack([_capture_column(header, columns, name, start, stop) for name in resolved]))
+            reducer.offset = stop
+        return labels, resolved, bool(header.get("complete"))
+    labels = _csv_columns(path)
+    if not labels:
+        raise PreviewError("Measurement file has no header yet")
+    cols = tuple(resolve_column(labels, name) for name in names)
+    for values, offset in _read_csv(path, reducer.offset, end, cols):
+        reducer.feed(values)
+        reducer.offset = offset
+    return labels, [labels[col] for col in cols], None
+
+
+def decimate(path: pathlib.Path, names: List[str], points: int, rank: Tuple[int, ...] = (1,)) -> Dict[str, np.ndarray]:
+    """Read columns ``names`` of a measurement, reduced to a few rows per point.
+
+    Keeps the first/last row and the extremes of the ``rank`` columns per row
+    bucket, so plotted lines keep their envelope. Not cached.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Column label -> values, in file order.
+    """
+    reducer = StreamingReducer(budget=max(points * CANDIDATES_PER_POINT, 4096), rank=rank)
+    _, resolved, _ = _stream(path, reducer, list(names), _signature(path)[1])
+    if reducer.values is None:
+        return {label: np.empty(0) for label in resolved}
+    return {label: reducer.values[:, index] for index, label in enumerate(resolved)}
+
+
+# ----- cache -----
+
+@dataclass
+class _Entry:
+    signature: Tuple[int, int, int]
+    reducer: StreamingReducer
+    result: Dict[str, object]
+
+
+class PreviewCache:
+    """LRU cache of previews and their reducer state.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of (file, columns, points, method) entries kept.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        self.max_entries = max(int(max_entries), 1)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+
+    def preview(self, path: pathlib.Path, x: str, y: str, points: int, method: str) -> Dict[str, object]:
+        """Preview of columns ``x``/``y`` of the measurement at ``path``.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            CSV file or capture directory.
+        x, y : str
+            Column names (see `resolve_column`).
+        points : int
+            Maximum number of returned points.
+        method : str
+            ``"lttb"`` or ``"minmax"``.
+
+        Returns
+        -------
+        Dict[str, object]
+            ``{"x", "y", "columns", "rows", "points", "complete", "data": {"x", "y"}}``.
+
+        Raises
+        ------
+        PreviewError
+            For unknown columns or an unreadable file header.
+        """
+        key = (str(path), x, y, points, method)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        signature = _signature(path)
+        if entry is not None and entry.signature == signature:
+            return entry.result
+
+        if entry is not None and entry.signature[0] == signature[0] and entry.reducer.offset <= signature[1]:
+            # Same file, grown: continue where the last read stopped. Arrays are
+            # replaced rather than mutated, so a shallow copy leaves the cached state intact.
+            reducer = replace(entry.reducer)
+        else:
+            reducer = StreamingReducer(budget=max(points * CANDIDATES_PER_POINT, 4096))
+        labels, (x_name, y_name), complete = _stream(path, reducer, [x, y], signature[1])
+
+        if method == "minmax":
+            keep = minmax(reducer.idx, reducer.y, reducer.rows, points)
+        else:
+            keep = lttb(reducer.x, reducer.y, points)
+        result: Dict[str, object] = {
+            "x": x_name,
+            "y": y_name,
+            "columns": labels,
+            "rows": reducer.rows,
+            "points": int(len(keep)),
+            "complete": complete,
+            "data": {"x": reducer.x[keep].tolist(), "y": reducer.y[keep].tolist()},
+        }
+        with self._lock:
+            self._entries[key] = _Entry(signature, reducer, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+def measurement_path(mode_dir: pathlib.Path) -> Optional[pathlib.Path]:
+    """Capture directory or CSV of the measurement in ``mode_dir`` (captures first)."""
+    if not mode_dir.is_dir():
+        return None
+    captures = sorted(p for p in mode_dir.glob(f"*{CAPTURE_SUFFIX}") if (p / CAPTURE_HEADER).is_file())
+    if captures:
+        return captures[0]
+    csvs = sorted(p for p in mode_dir.glob("*.csv") if p.is_file())
+    return csvs[0] if csvs else None
+
@@ -0,0 +1,208 @@
+"""Prebuilt, cached ZIP archives of finished runs.
+
+`rest_api.app` schedules a build once no job writes into a run directory any
+more and serves `/runs/{run_id}/zip` from the cached file whenever it is still
+current, so the run is compressed once instead of on every download. Cached archives are plain
+files, which lets the route answer with ``ETag``, ``Content-Length`` and HTTP
+``Range`` (resumable downloads).
+
+Archives are keyed by run directory, not by run id: all wells of a plate share
+one run directory and therefore one archive. They live in
+``<RUNS_ROOT>/.archives`` rather than inside the run directory, so NAS uploads
+and file listings never see them. Each archive has a JSON
+sidecar with the sha256 of its content (used as ETag) and a fingerprint of the
+run directory (relative path, size and mtime of every file); an archive whose
+fingerprint no longer matches the run directory is treated as missing.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import zip_stream
+
+log = logging.getLogger("rest_api.run_archive")
+
+ARCHIVE_DIR_NAME = ".archives"
+# Box-local bookkeeping files that are neither archived nor fingerprinted, so
+# e.g. the NAS upload marker does not invalidate a finished run's archive.
+EXCLUDED_NAMES = frozenset({"UPLOAD_DONE"})
+
+# Builds the ``(arcname, source)`` entry list of a run directory.
+EntryBuilder = Callable[[pathlib.Path], List[Tuple[str, zip_stream.EntrySource]]]
+
+
+def temp_path(target: pathlib.Path) -> pathlib.Path:
+    """Sibling temp file of ``target``, unique per process and thread, for atomic replaces."""
+    return target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+@dataclass
+class CachedArchive:
+    """A current archive on disk and its content hash."""
+
+    path: pathlib.Path
+    sha256: str
+    size: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256}"'
+
+
+def run_fingerprint(run_dir: pathlib.Path) -> str:
+    """Hash the relative path, size and mtime of every file below ``run_dir``."""
+    digest = hashlib.sha256()
+    for path in sorted(run_dir.rglob("*")):
+        try:
+            if not path.is_file() or path.name in EXCLUDED_NAMES:
+                continue
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.relative_to(run_dir).as_posix()}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class RunArchiveCache:
+    """Builds archives in background threads and looks up current ones."""
+
+    def __init__(self, runs_root: pathlib.Path, entries: EntryBuilder) -> None:
+        self.root = runs_root / ARCHIVE_DIR_NAME
+        self._entries = entries
+        self._lock = threading.Lock()
+        self._building: Dict[str, threading.Thread] = {}
+
+    @staticmethod
+    def _key(run_dir: pathlib.Path) -> str:
+        return hashlib.sha256(str(run_dir).encode("utf-8")).hexdigest()[:32]
+
+    def _paths(self, run_dir: pathlib.Path) -> Tuple[pathlib.Path, pathlib.Path]:
+        name = self._key(run_dir)
+        return self.root / f"{name}.zip", self.root / f"{name}.json"
+
+    def lookup(self, run_dir: pathlib.Path) -> Optional[CachedArchive]:
+        """Return the cached archive of ``run_dir`` if it is still current.
+
+        Returns
+        -------
+        Optional[CachedArchive]
+            ``None`` when no archive exists or the run directory changed since
+            it was built.
+        """
+        archive_path, meta_path = self._paths(run_dir)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            size = archive_path.stat().st_size
+        except (OSError, ValueError):
+            return None
+        if (
+            meta.get("run_dir") != str(run_dir)
+            or meta.get("size") != size
+            or meta.get("fingerprint") != run_fingerprint(run_dir)
+        ):
+            return None
+        return CachedArchive(path=archive_path, sha256=meta["sha256"], size=size)
+
+    def schedule(self, run_dir: pathlib.Path) -> None:
+        """Build the archive of ``run_dir`` in a background thread (once at a time)."""
+        key = self._key(run_dir)
+        with self._lock:
+            running = self._building.get(key)
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._build_quietly, args=(run_dir,), name=f"run-archive-{run_dir.name}", daemon=True
+            )
+            self._building[key] = thread
+            thread.start()
+
+    def _build_quietly(self, run_dir: pathlib.Path) -> None:
+        key = self._key(run_dir)
+        try:
+            self.build(run_dir)
+        except Exception:
+            log.exception("Archive build failed run_dir=%s", run_dir)
+        finally:
+            with self._lock:
+                if self._building.get(key) is threading.current_thread():
+                    self._building.pop(key, None)
+
+    def build(self, run_dir: pathlib.Path) -> Optional[CachedArchive]:
+        """Build and store the archive of ``run_dir``.
+
+        Returns
+        -------
+        Optional[CachedArchive]
+            The stored archive, or ``None`` when the run directory is missing or
+            changed while the archive was written.
+        """
+        if not run_dir.is_dir():
+            return None
+        cached = self.lookup(run_dir)
+        if cached is not None:
+            return cached
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.prune()
+        entries = self._entries(run_dir)
+        # Resolve lazy sources (capture conversion writes CSVs into the run
+        # directory) before taking the fingerprint the archive is tied to.
+        entries = [(arcname, source() if callable(source) else source) for arcname, source in entries]
+        fingerprint = run_fingerprint(run_dir)
+
+        archive_path, meta_path = self._paths(run_dir)
+        tmp_path = temp_path(archive_path)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with tmp_path.open("wb") as out:
+                for chunk in zip_stream.iter_zip(entries):
+                    out.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            if run_fingerprint(run_dir) != fingerprint:
+                log.info("Run changed during archive build run_dir=%s", run_dir)
+                return None
+            os.replace(tmp_path, archive_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        meta = {
+            "run_dir": str(run_dir),
+            "fingerprint": fingerprint,
+            "sha256": digest.hexdigest(),
+            "size": size,
+            "built_at": datetime.datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        }
+        meta_tmp = temp_path(meta_path)
+        meta_tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(meta_tmp, meta_path)
+        log.info("Archive built run_dir=%s size=%d", run_dir, size)
+        return CachedArchive(path=archive_path, sha256=meta["sha256"], size=size)
+
+    def prune(self) -> None:
+        """Remove archives whose run directory no longer exists (e.g. after retention).
+
+        Archives stored under another name than their run directory's key
+        (older per-run-id archives) are removed as well.
+        """
+        if not self.root.is_dir():
+            return
+        for meta_path in self.root.glob("*.json"):
+            try:
+                run_dir = json.loads(meta_path.read_text(encoding="utf-8")).get("run_dir")
+            except (OSError, ValueError):
+                run_dir = None
+            if run_dir and pathlib.Path(run_dir).is_dir() and meta_path.stem == self._key(pathlib.Path(run_dir)):
+                continue
+            meta_path.with_suffix(".zip").unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
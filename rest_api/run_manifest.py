@@ -0,0 +1,449 @@
+"""Per-run-directory file manifests with sizes and content hashes.
+
+`rest_api.app` records the output folder of every measurement and plot step
+here once the step has finished writing, and answers `/runs/{run_id}/files`
+from the manifest instead of walking the run directory on every request.
+
+Each manifest maps the relative path of a file to its size, mtime and sha256
+plus the manifest version in which the entry last changed. The version grows
+by one per update that changed anything, so clients can pass it back as
+``?since=`` and fetch only new or modified entries. Binary captures
+(``<name>.beepcap/`` column folders) are listed as one entry under their
+nominal ``<name>.csv``, like in the run archive, since `/runs/{run_id}/file`
+converts them on demand; the size, mtime and hash of such an entry describe the
+raw capture files.
+
+Hashes come from the writers: the measurement logger and the plot workers
+hash the bytes as they write them and pass size and sha256 to `record`, which
+only stats the finished step's folder and adopts digests whose size matches.
+Files without such a digest (other writers, runs interrupted by an error) are
+hashed by one background thread (``sha256`` is ``null`` until then). The hash
+of a binary capture is `capture_sha256` over its column files.
+
+Listings never walk the directory: `begin` marks the file a measurement is
+about to write, and `entries` serves the manifest plus a stat of those marked
+files only.
+
+Manifests are keyed by run directory (all wells of a plate share one), kept in
+memory and persisted as JSON in ``<RUNS_ROOT>/.manifests`` (outside the run
+directory, so NAS uploads and the archives of `run_archive` never include
+them). Runs without a manifest, e.g. from before this module existed, are
+stat-scanned on first access and hashed in the background. A read-only store
+(``writable = False``, the HTTP front processes) never saves or hashes and
+reloads a manifest when the daemon replaced its file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import run_archive
+
+log = logging.getLogger("rest_api.run_manifest")
+
+MANIFEST_DIR_NAME = ".manifests"
+HASH_CHUNK_SIZE = 1024 * 1024
+CAPTURE_SUFFIX = ".beepcap"
+# Bumped when the listed file set or a hash definition changes; older manifests are rescanned.
+MANIFEST_FORMAT = 4
+
+
+@dataclass
+class ManifestEntry:
+    """One file of a run directory."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: Optional[str]
+    version: int
+    capture: bool = False
+
+
+@dataclass
+class _Manifest:
+    run_dir: str
+    version: int
+    entries: Dict[str, ManifestEntry]
+    stored: bool = False
+    # Entries waiting for the hash thread.
+    pending: Set[str] = field(default_factory=set)
+    # Files a running measurement writes (see `RunManifestStore.begin`).
+    writing: Set[str] = field(default_factory=set)
+    # `_file_signature` of the manifest file when it was loaded or saved.
+    signature: Optional[Tuple[int, int, int]] = None
+
+
+def file_sha256(*paths: pathlib.Path) -> str:
+    """Hash the concatenated content of ``paths`` in fixed-size chunks."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with path.open("rb") as handle:
+            while True:
+                block = handle.read(HASH_CHUNK_SIZE)
+                if not block:
+                    break
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def capture_sha256(digests: Iterable[Tuple[str, str]]) -> str:
+    """Hash of a binary capture from the ``(file name, sha256)`` of its files."""
+    lines = "".join(f"{name} {sha}\n" for name, sha in sorted(digests))
+    return hashlib.sha256(lines.encode("utf-8")).hexdigest()
+
+
+# Relative path -> (source files, size, mtime_ns) of one listed file.
+_Scan = Dict[str, Tuple[List[pathlib.Path], int, int]]
+
+
+def scan_files(run_dir: pathlib.Path, folder: pathlib.Path) -> _Scan:
+    """Stat the files below ``folder``, folding binary captures into their CSV name.
+
+    A capture is skipped when its CSV already exists next to it. Box-local
+    bookkeeping files (`run_archive.EXCLUDED_NAMES`) are not listed.
+    """
+    files: _Scan = {}
+    captures: _Scan = {}
+    if not folder.is_dir():
+        return files
+    for path in sorted(folder.rglob("*")):
+        try:
+            if path.name in run_archive.EXCLUDED_NAMES or not path.is_file():
+                continue
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.parent.suffix == CAPTURE_SUFFIX:
+            rel = path.parent.with_suffix(".csv").relative_to(run_dir).as_posix()
+            sources, size, mtime_ns = captures.get(rel, ([], 0, 0))
+            captures[rel] = ([*sources, path], size + stat.st_size, max(mtime_ns, stat.st_mtime_ns))
+        else:
+            files[path.relative_to(run_dir).as_posix()] = ([path], stat.st_size, stat.st_mtime_ns)
+    for rel, info in captures.items():
+        files.setdefault(rel, info)
+    return files
+
+
+class RunManifestStore:
+    """In-memory manifests backed by one JSON file per run directory."""
+
+    def __init__(self, runs_root: pathlib.Path) -> None:
+        self.root = runs_root / MANIFEST_DIR_NAME
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._manifests: Dict[str, _Manifest] = {}
+        # Run directories with work for the hash thread; ``True`` asks for a
+        # full stat scan first.
+        self._queue: Deque[pathlib.Path] = deque()
+        self._queued: Dict[str, bool] = {}
+        self._worker: Optional[threading.Thread] = None
+        # ``False`` in processes that only read the daemon's manifests.
+        self.writable = True
+
+    @staticmethod
+    def _key(run_dir: pathlib.Path) -> str:
+        return hashlib.sha256(str(run_dir).encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, run_dir: pathlib.Path) -> pathlib.Path:
+        return self.root / f"{self._key(run_dir)}.json"
+
+    def begin(self, run_dir: pathlib.Path, path: pathlib.Path) -> None:
+        """Mark ``path`` as being written so listings include it before it is recorded."""
+        rel = path.relative_to(run_dir).as_posix()
+        with self._lock:
+            manifest = self._load_locked(run_dir)
+            if rel not in manifest.writing:
+                manifest.writing.add(rel)
+                self._save_locked(run_dir, manifest)
+
+    def record(
+        self,
+        run_dir: pathlib.Path,
+        folder: Optional[pathlib.Path] = None,
+        digests: Optional[Mapping[str, Tuple[int, str]]] = None,
+    ) -> int:
+        """Stat the files below ``folder`` and queue the ones without a digest for hashing.
+
+        Parameters
+        ----------
+        run_dir : pathlib.Path
+            Run output directory; manifest paths are relative to it.
+        folder : Optional[pathlib.Path]
+            Folder written by the finished step. Defaults to the whole run.
+            Files marked by `begin` below it are no longer being written.
+        digests : Optional[Mapping[str, Tuple[int, str]]]
+            Size and sha256 of files hashed by their writer, keyed by path.
+            A digest is used when its size matches the file on disk.
+
+        Returns
+        -------
+        int
+            Manifest version after the update.
+        """
+        known = {os.path.abspath(path): digest for path, digest in (digests or {}).items()}
+        return self._update(run_dir, folder or run_dir, known)
+
+    def schedule(self, run_dir: pathlib.Path) -> None:
+        """Rescan and hash the whole run directory in the background (e.g. once its jobs finished)."""
+        with self._lock:
+            self._enqueue_locked(run_dir, rescan=True)
+
+    def entries(self, run_dir: pathlib.Path, since: Optional[int] = None) -> Tuple[int, List[ManifestEntry]]:
+        """Manifest version and entries changed after version ``since``, sorted by path.
+
+        Files that are still being written (see `begin`) are always included,
+        with their current size and ``sha256`` ``null``.
+
+        Parameters
+        ----------
+        run_dir : pathlib.Path
+            Run output directory.
+        since : Optional[int]
+            Only entries changed after this manifest version.
+        """
+        with self._lock:
+            manifest = self._load_locked(run_dir)
+            unscanned = not manifest.stored and manifest.version == 0
+            unhashed = any(entry.sha256 is None for entry in manifest.entries.values())
+            if manifest.stored and unhashed and not manifest.pending and not manifest.writing:
+                # Interrupted hashing, e.g. a restart.
+                self._enqueue_locked(run_dir, rescan=True)
+        if unscanned:
+            # No manifest yet (e.g. a run from an older version): stat it once,
+            # the hashes follow in the background.
+            self.record(run_dir)
+        with self._lock:
+            manifest = self._load_locked(run_dir)
+            selected = {
+                entry.path: entry
+                for entry in manifest.entries.values()
+                if since is None or entry.version > since
+            }
+            writing = sorted(manifest.writing)
+            version = manifest.version
+        for rel in writing:
+            sources = _sources(run_dir, rel)
+            try:
+                stats = [path.stat() for path in sources]
+            except OSError:
+                continue
+            selected[rel] = ManifestEntry(
+                rel,
+                sum(stat.st_size for stat in stats),
+                max((stat.st_mtime_ns for stat in stats), default=0),
+                None,
+                version,
+                capture=_is_capture(sources),
+            )
+        return version, sorted(selected.values(), key=lambda entry: entry.path)
+
+    def files(self, run_dir: pathlib.Path, folder: Optional[pathlib.Path] = None) -> List[str]:
+        """Sorted manifest paths, optionally limited to ``folder``."""
+        prefix = "" if folder is None or folder == run_dir else folder.relative_to(run_dir).as_posix() + "/"
+        with self._lock:
+            manifest = self._load_locked(run_dir)
+            return sorted(path for path in manifest.entries if path.startswith(prefix))
+
+    def _update(
+        self, run_dir: pathlib.Path, folder: pathlib.Path, digests: Dict[str, Tuple[int, str]]
+    ) -> int:
+        current = scan_files(run_dir, folder)
+        streamed = {rel: _streamed_sha256(sources, digests) for rel, (sources, _, _) in current.items()}
+        prefix = "" if folder == run_dir else folder.relative_to(run_dir).as_posix() + "/"
+        with self._lock:
+            manifest = self._load_locked(run_dir)
+            changed = [
+                rel
+                for rel, (sources, size, mtime_ns) in current.items()
+                if (entry := manifest.entries.get(rel)) is None
+                or (entry.size, entry.mtime_ns, entry.capture) != (size, mtime_ns, _is_capture(sources))
+                or (entry.sha256 is None and streamed.get(rel) is not None)
+            ]
+            removed = [rel for rel in manifest.entries if rel.startswith(prefix) and rel not in current]
+            # Only a step's own folder ends its writes; whole-run rescans may overlap a running step.
+            finished = {rel for rel in manifest.writing if rel.startswith(prefix)} if prefix else set()
+            if changed or removed or finished or not manifest.stored:
+                manifest.version += 1
+                for rel in changed:
+                    sources, size, mtime_ns = current[rel]
+                    manifest.entries[rel] = ManifestEntry(
+                        rel,
+                        size,
+                        mtime_ns,
+                        streamed.get(rel),
+                        manifest.version,
+                        capture=_is_capture(sources),
+                    )
+                    manifest.pending.discard(rel)
+                for rel in removed:
+                    del manifest.entries[rel]
+                    manifest.pending.discard(rel)
+                manifest.writing -= finished
+                self._save_locked(run_dir, manifest)
+            unhashed = {rel for rel in current if manifest.entries[rel].sha256 is None}
+            if unhashed - manifest.pending:
+                manifest.pending |= unhashed
+                self._enqueue_locked(run_dir, rescan=False)
+            return manifest.version
+
+    # ----- hash thread -----
+    def _enqueue_locked(self, run_dir: pathlib.Path, rescan: bool) -> None:
+        if not self.writable:
+            return
+        key = str(run_dir)
+        if key in self._queued:
+            self._queued[key] = self._queued[key] or rescan
+        else:
+            self._queued[key] = rescan
+            self._queue.append(run_dir)
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._hash_loop, name="run-manifest-hash", daemon=True)
+            self._worker.start()
+        self._wake.notify()
+
+    def _hash_loop(self) -> None:
+        while True:
+            with self._wake:
+                while not self._queue:
+                    self._wake.wait()
+                run_dir = self._queue.popleft()
+                rescan = self._queued.pop(str(run_dir))
+            try:
+                if rescan:
+                    self.record(run_dir)
+                self._hash_pending(run_dir)
+            except Exception:
+                log.exception("Hashing run files failed run_dir=%s", run_dir)
+
+    def _hash_pending(self, run_dir: pathlib.Path) -> None:
+        with self._lock:
+            pending = sorted(self._load_locked(run_dir).pending)
+        hashed = 0
+        for rel in pending:
+            sources = _sources(run_dir, rel)
+            try:
+                stats = [path.stat() for path in sources]
+                if _is_capture(sources):
+                    digest = capture_sha256((path.name, file_sha256(path)) for path in sources)
+                else:
+                    digest = file_sha256(*sources)
+            except OSError:
+                log.warning("Could not hash run file run_dir=%s path=%s", run_dir, rel)
+                digest = None
+            with self._lock:
+                manifest = self._load_locked(run_dir)
+                manifest.pending.discard(rel)
+                entry = manifest.entries.get(rel)
+                # Skip files that changed while they were hashed; the next record queues them again.
+                if (
+                    digest is None
+                    or entry is None
+                    or entry.size != sum(stat.st_size for stat in stats)
+                    or entry.mtime_ns != max((stat.st_mtime_ns for stat in stats), default=0)
+                ):
+                    continue
+                manifest.version += 1
+                entry.sha256 = digest
+                entry.version = manifest.version
+                hashed += 1
+        if hashed:
+            with self._lock:
+                self._save_locked(run_dir, self._load_locked(run_dir))
+
+    # ----- persistence -----
+    def _load_locked(self, run_dir: pathlib.Path) -> _Manifest:
+        key = str(run_dir)
+        path = self._path(run_dir)
+        manifest = self._manifests.get(key)
+        if manifest is not None:
+            if self.writable or _file_signature(path) == manifest.signature:
+                return manifest
+        manifest = _Manifest(run_dir=key, version=0, entries={}, signature=_file_signature(path))
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("run_dir") == key and data.get("format") == MANIFEST_FORMAT:
+                manifest.stored = True
+                manifest.version = int(data.get("version", 0))
+                for item in data.get("files", []):
+                    entry = ManifestEntry(**item)
+                    manifest.entries[entry.path] = entry
+                if not self.writable:
+                    manifest.writing = set(data.get("writing", []))
+                elif data.get("writing"):
+                    # Left by a previous daemon process: nothing writes them any
+                    # more. Rescan to list what they left and save without them.
+                    manifest.stored = False
+                    self._enqueue_locked(run_dir, rescan=True)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError):
+            log.warning("Ignoring unreadable manifest run_dir=%s", run_dir)
+        self._manifests[key] = manifest
+        return manifest
+
+    def _save_locked(self, run_dir: pathlib.Path, manifest: _Manifest) -> None:
+        if not self.writable:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        target = self._path(run_dir)
+        tmp = run_archive.temp_path(target)
+        payload = {
+            "format": MANIFEST_FORMAT,
+            "run_dir": manifest.run_dir,
+            "version": manifest.version,
+            "writing": sorted(manifest.writing),
+            "files": [asdict(entry) for entry in sorted(manifest.entries.values(), key=lambda e: e.path)],
+        }
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, target)
+        manifest.stored = True
+        manifest.signature = _file_signature(target)
+
+
+def _is_capture(sources: List[pathlib.Path]) -> bool:
+    return bool(sources) and sources[0].parent.suffix == CAPTURE_SUFFIX
+
+
+def _file_signature(path: pathlib.Path) -> Optional[Tuple[int, int, int]]:
+    """Inode, size and mtime; every save replaces the file, so the inode changes too."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _streamed_sha256(sources: List[pathlib.Path], digests: Dict[str, Tuple[int, str]]) -> Optional[str]:
+    """Hash of a listed file from its writers' digests, ``None`` unless all sources match."""
+    found = []
+    for path in sources:
+        digest = digests.get(os.path.abspath(path))
+        try:
+            if digest is None or digest[0] != path.stat().st_size:
+                return None
+        except OSError:
+            return None
+        found.append((path.name, digest[1]))
+    if not found:
+        return None
+    return capture_sha256(found) if _is_capture(sources) else found[0][1]
+
+
+def _sources(run_dir: pathlib.Path, rel: str) -> List[pathlib.Path]:
+    """Files behind a manifest path: the file itself or the columns of its capture."""
+    path = run_dir / rel
+    if path.is_file() or path.suffix != ".csv":
+        return [path]
+    capture = path.with_suffix(CAPTURE_SUFFIX)
+    if not capture.is_dir():
+        return [path]
+    return sorted(child for child in capture.iterdir() if child.is_file())
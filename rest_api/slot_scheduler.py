@@ -0,0 +1,174 @@
+"""Per-slot FIFO job queues for the REST API.
+
+`rest_api.app` submits one task per slot when `/jobs` starts a run. Each slot
+has a fixed worker thread that runs its tasks one after another, so a run for
+a busy slot is accepted as ``queued`` and starts the moment the slot frees
+instead of being rejected with ``jobs.slots_busy``.
+
+The scheduler also reports the queue position of a run and its estimated start
+time, derived from the planned durations given at submission (see
+`progress_utils.estimate_planned_duration`).
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timezone
+from typing import Callable, Deque, Dict, List, Optional
+
+log = logging.getLogger("rest_api.slot_scheduler")
+
+
+@dataclass
+class SlotTask:
+    """One run waiting for, or running on, a slot."""
+
+    run_id: str
+    func: Callable[[], None]
+    planned_s: Optional[float] = None
+    started_monotonic: Optional[float] = None
+
+
+@dataclass
+class QueueEstimate:
+    """Queue position (1 = next) and estimated start of a waiting run."""
+
+    position: int
+    estimated_start_at: Optional[str]
+
+
+@dataclass
+class _SlotQueue:
+    pending: Deque[SlotTask] = field(default_factory=deque)
+    current: Optional[SlotTask] = None
+    worker: Optional[threading.Thread] = None
+
+
+class SlotScheduler:
+    """FIFO queue plus one worker thread per slot."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._slots: Dict[str, _SlotQueue] = {}
+
+    def submit(
+        self,
+        slot: str,
+        run_id: str,
+        func: Callable[[], None],
+        planned_s: Optional[float] = None,
+    ) -> int:
+        """Queue ``func`` for ``slot``.
+
+        Parameters
+        ----------
+        slot : str
+            Slot identifier.
+        run_id : str
+            Run the task belongs to.
+        func : Callable[[], None]
+            Blocking callable executed by the slot worker.
+        planned_s : Optional[float]
+            Planned run duration in seconds, used for start-time estimates.
+
+        Returns
+        -------
+        int
+            Number of tasks ahead of this one (running task included).
+        """
+        with self._cond:
+            queue = self._slots.setdefault(slot, _SlotQueue())
+            ahead = len(queue.pending) + (1 if queue.current else 0)
+            queue.pending.append(SlotTask(run_id=run_id, func=func, planned_s=planned_s))
+            if queue.worker is None:
+                queue.worker = threading.Thread(
+                    target=self._work, args=(slot,), name=f"slot-queue-{slot}", daemon=True
+                )
+                queue.worker.start()
+            self._cond.notify_all()
+        return ahead
+
+    def remove(self, slot: str, run_id: str) -> bool:
+        """Drop a waiting task of ``run_id`` from the slot queue.
+
+        Returns
+        -------
+        bool
+            ``True`` when a waiting task was removed (running tasks are not touched).
+        """
+        with self._cond:
+            queue = self._slots.get(slot)
+            if queue is None:
+                return False
+            for task in list(queue.pending):
+                if task.run_id == run_id:
+                    queue.pending.remove(task)
+                    return True
+        return False
+
+    def running(self, slot: str) -> Optional[str]:
+        """Run id currently executing on ``slot``."""
+        with self._cond:
+            queue = self._slots.get(slot)
+            return queue.current.run_id if queue and queue.current else None
+
+    def waiting(self, slot: str) -> List[str]:
+        """Run ids waiting for ``slot`` in start order."""
+        with self._cond:
+            queue = self._slots.get(slot)
+            return [task.run_id for task in queue.pending] if queue else []
+
+    def estimate(self, slot: str, run_id: str) -> Optional[QueueEstimate]:
+        """Queue position and estimated start time of a waiting run.
+
+        The estimate adds the remaining planned time of the running task and
+        the planned durations of every task ahead; it is ``None`` when any of
+        them is unknown.
+        """
+        now = time.monotonic()
+        with self._cond:
+            queue = self._slots.get(slot)
+            if queue is None:
+                return None
+            wait_s: Optional[float] = 0.0
+            current = queue.current
+            if current is not None:
+                if current.planned_s is None or current.started_monotonic is None:
+                    wait_s = None
+                else:
+                    wait_s = max(current.planned_s - (now - current.started_monotonic), 0.0)
+            for position, task in enumerate(queue.pending, start=1):
+                if task.run_id == run_id:
+                    start_at = None
+                    if wait_s is not None:
+                        start = datetime.datetime.now(timezone.utc) + datetime.timedelta(seconds=wait_s)
+                        start_at = start.isoformat(timespec="seconds").replace("+00:00", "Z")
+                    return QueueEstimate(position=position, estimated_start_at=start_at)
+                if wait_s is not None and task.planned_s is not None:
+                    wait_s += task.planned_s
+                else:
+                    wait_s = None
+        return None
+
+    def _work(self, slot: str) -> None:
+        while True:
+            with self._cond:
+                queue = self._slots[slot]
+                while not queue.pending:
+                    self._cond.wait()
+                task = queue.pending.popleft()
+                task.started_monotonic = time.monotonic()
+                queue.current = task
+            try:
+                task.func()
+            except Exception:
+                log.exception("Slot task failed slot=%s run_id=%s", slot, task.run_id)
+            finally:
+                with self._cond:
+                    queue.current = None
@@ -0,0 +1,440 @@
+"""Process-per-slot acquisition workers for the REST API.
+
+With ``BOX_SLOT_WORKERS=process`` every discovered slot runs its
+`PotentiostatController` in a dedicated child process that owns the serial
+port. Acquisition loops and CSV formatting then no longer share the GIL with
+the HTTP handlers of the uvicorn process (plots are rendered by `plot_pool`).
+
+`rest_api.app` stores a `SlotWorker` in `DEVICES` instead of the controller.
+The proxy exposes the controller calls the routes and slot threads use
+(`apply_measurement`, `get_available_modes`, `get_mode_params`,
+`get_queue_stats`) plus `abort_measurement`, so
+`_run_slot_sequence` and the `CANCEL_FLAGS` polling keep their semantics.
+
+IPC is one duplex `multiprocessing.Pipe` per slot carrying small tuples:
+
+- parent -> worker: ``("measure", call_id, kwargs)``,
+  ``("call", call_id, method, args)``, ``("abort",)``, ``("stop",)``
+- worker -> parent: ``("ready", pid)``, ``("failed", message)``,
+  ``("result", call_id, ok, value)``, ``("stats", queue_stats)``,
+  ``("live", call_id, rows)``
+
+A ``live_sink`` passed to `SlotWorker.apply_measurement` stays in the parent;
+the worker decimates the logger batches with `live_stream.Decimator` and sends
+the reduced rows as ``live`` messages, which the reader thread hands to the sink.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger("rest_api.slot_workers")
+
+SLOT_WORKERS_ENV = "BOX_SLOT_WORKERS"
+STATS_INTERVAL_S = 1.0
+START_TIMEOUT_S = 30.0
+CALL_TIMEOUT_S = 30.0
+STOP_TIMEOUT_S = 5.0
+
+# Controller methods the parent may call synchronously while a measurement runs.
+_CALLABLE_METHODS = ("get_available_modes", "get_mode_params", "get_queue_stats")
+
+
+class SlotWorkerError(RuntimeError):
+    """Raised when a slot worker cannot be started or stops responding."""
+
+
+def process_workers_enabled() -> bool:
+    """Return ``True`` when slots should run in dedicated worker processes."""
+    return os.getenv(SLOT_WORKERS_ENV, "thread").strip().lower() in ("process", "processes", "1")
+
+
+# ---------- Worker process ----------
+def _open_controller(port: str, options: Dict[str, Any]):
+    """Create the controller for ``port`` inside the worker process.
+
+    ``options`` are extra `PotentiostatController` keyword arguments.
+    """
+    from pyBEEP.controller import PotentiostatController
+
+    if port.startswith("sim://"):
+        from pyBEEP.simulator import simulated_devices_from_env
+
+        for device in simulated_devices_from_env():
+            if device.device.serial.port == port:
+                return PotentiostatController(device=device, **options)
+        raise SlotWorkerError(f"Simulated device {port} is not configured")
+
+    from pyBEEP.device import PotentiostatDevice
+
+    return PotentiostatController(device=PotentiostatDevice(port=port, address=1), **options)
+
+
+def _serial_port(ctrl):
+    device = getattr(ctrl, "device", None)
+    device = getattr(device, "device", device)
+    return getattr(device, "serial", None)
+
+
+def _abort_controller(ctrl) -> None:
+    """Stop a running measurement by closing the port, as the threaded mode does."""
+    port = _serial_port(ctrl)
+    if port is not None:
+        try:
+            port.close()
+        except Exception:
+            log.debug("Closing serial port during abort failed", exc_info=True)
+
+
+def _reopen_port(ctrl) -> None:
+    """Reopen the port after an abort so the slot stays usable without a rescan."""
+    port = _serial_port(ctrl)
+    if port is not None and not getattr(port, "is_open", True):
+        port.open()
+
+
+def _worker_main(slot: str, port: str, conn, stats_interval: float, options: Dict[str, Any]) -> None:
+    """Entry point of one slot worker process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f"%(asctime)s [{slot}] %(name)s %(levelname)s: %(message)s",
+    )
+    try:
+        ctrl = _open_controller(port, options)
+    except Exception as exc:
+        conn.send(("failed", f"{type(exc).__name__}: {exc}"))
+        conn.close()
+        return
+    conn.send(("ready", os.getpid()))
+
+    send_lock = threading.Lock()
+    measuring = threading.Event()
+
+    def send(message) -> None:
+        with send_lock:
+            conn.send(message)
+
+    def live_forwarder(call_id: int, points_per_s: float):
+        import live_stream
+
+        decimator = live_stream.Decimator(points_per_s)
+
+        def forward(rows) -> None:
+            reduced = decimator.feed(rows)
+            if len(reduced):
+                send(("live", call_id, reduced))
+
+        return forward
+
+    def run_call(call_id: int, func, kwargs: Dict[str, Any], is_measurement: bool) -> None:
+        try:
+            value = func(**kwargs)
+            send(("result", call_id, True, value))
+        except Exception as exc:
+            send(("result", call_id, False, str(exc)))
+        finally:
+            if is_measurement:
+                measuring.clear()
+                send(("stats", ctrl.get_queue_stats()))
+
+    while True:
+        try:
+            ready = conn.poll(stats_interval)
+            message = conn.recv() if ready else None
+        except (EOFError, OSError):
+            break
+        if message is not None:
+            kind = message[0]
+            if kind == "measure":
+                _, call_id, kwargs = message
+                try:
+                    _reopen_port(ctrl)
+                except Exception as exc:
+                    send(("result", call_id, False, f"Serial port unavailable: {exc}"))
+                    continue
+                live_points_per_s = kwargs.pop("live_points_per_s", None)
+                if live_points_per_s:
+                    kwargs["live_sink"] = live_forwarder(call_id, live_points_per_s)
+                measuring.set()
+                threading.Thread(
+                    target=run_call,
+                    args=(call_id, ctrl.apply_measurement, kwargs, True),
+                    name=f"{slot}-measurement",
+                    daemon=True,
+                ).start()
+            elif kind == "call":
+                _, call_id, method, args = message
+                try:
+                    if method not in _CALLABLE_METHODS:
+                        raise AttributeError(f"Method {method!r} is not available on slot workers")
+                    value = getattr(ctrl, method)(*args)
+                    if method == "get_mode_params":
+                        # Parameter types are not picklable across versions; the API serves str(type).
+                        value = {name: str(kind_) for name, kind_ in value.items()}
+                    send(("result", call_id, True, value))
+                except Exception as exc:
+                    send(("result", call_id, False, str(exc)))
+            elif kind == "abort":
+                _abort_controller(ctrl)
+            elif kind == "stop":
+                break
+        if measuring.is_set():
+            try:
+                send(("stats", ctrl.get_queue_stats()))
+            except Exception:
+                log.debug("Queue stats unavailable", exc_info=True)
+
+    _abort_controller(ctrl)
+    conn.close()
+
+
+# ---------- Parent-side proxy ----------
+class _PendingCall:
+    """Result slot for one request sent to the worker."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.ok = False
+        self.value: Any = None
+
+
+class SlotWorker:
+    """Parent-side proxy of one slot's controller running in a worker process.
+
+    Parameters
+    ----------
+    slot : str
+        Slot identifier (``slot01``...), used for process and log names.
+    port : str
+        Serial port (or ``sim://N`` simulated device) the worker opens.
+    stats_interval : float
+        Seconds between queue-stat updates while a measurement runs.
+    controller_options : Optional[Dict[str, Any]]
+        Extra `PotentiostatController` keyword arguments (spill settings).
+    """
+
+    def __init__(
+        self,
+        slot: str,
+        port: str,
+        stats_interval: float = STATS_INTERVAL_S,
+        controller_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.slot = slot
+        self.port = port
+        self.stats_interval = stats_interval
+        self.controller_options = dict(controller_options or {})
+        self.pid: Optional[int] = None
+        self._ctx = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._send_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._pending: Dict[int, _PendingCall] = {}
+        self._live_sinks: Dict[int, Any] = {}
+        self._call_ids = itertools.count(1)
+        self._queue_stats: Optional[Dict[str, int]] = None
+        self._reader: Optional[threading.Thread] = None
+
+    # ----- lifecycle -----
+    def start(self) -> "SlotWorker":
+        """Spawn the worker process and wait until it opened its port."""
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.slot, self.port, child_conn, self.stats_interval, self.controller_options),
+            name=f"slot-worker-{self.slot}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        if not parent_conn.poll(START_TIMEOUT_S):
+            process.kill()
+            raise SlotWorkerError(f"Worker for {self.slot} did not start within {START_TIMEOUT_S}s")
+        message = parent_conn.recv()
+        if message[0] != "ready":
+            process.join(STOP_TIMEOUT_S)
+            raise SlotWorkerError(f"Worker for {self.slot} failed to open {self.port}: {message[1]}")
+        self.pid = message[1]
+        self._process = process
+        self._conn = parent_conn
+        self._reader = threading.Thread(
+            target=self._read_events, name=f"slot-worker-{self.slot}-events", daemon=True
+        )
+        self._reader.start()
+        log.info("Slot worker %s started (pid=%s, port=%s)", self.slot, self.pid, self.port)
+        return self
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def stop(self) -> None:
+        """Ask the worker to release its port and exit; kill it if it does not."""
+        process = self._process
+        if process is None:
+            return
+        try:
+            self._send(("stop",))
+        except SlotWorkerError:
+            pass
+        process.join(STOP_TIMEOUT_S)
+        if process.is_alive():
+            process.kill()
+            process.join(STOP_TIMEOUT_S)
+        self._process = None
+        if self._conn is not None:
+            self._conn.close()
+        log.info("Slot worker %s stopped", self.slot)
+
+    def _ensure_running(self) -> None:
+        if not self.is_alive():
+            log.warning("Slot worker %s is not running, restarting", self.slot)
+            self._process = None
+            self.start()
+
+    # ----- IPC -----
+    def _send(self, message) -> None:
+        if self._conn is None:
+            raise SlotWorkerError(f"Worker for {self.slot} is not running")
+        try:
+            with self._send_lock:
+                self._conn.send(message)
+        except (OSError, ValueError) as exc:
+            raise SlotWorkerError(f"Worker for {self.slot} is not reachable: {exc}") from exc
+
+    def _read_events(self) -> None:
+        conn = self._conn
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            kind = message[0]
+            if kind == "result":
+                _, call_id, ok, value = message
+                with self._state_lock:
+                    pending = self._pending.pop(call_id, None)
+                if pending is not None:
+                    pending.ok, pending.value = ok, value
+                    pending.done.set()
+            elif kind == "stats":
+                self._queue_stats = message[1]
+            elif kind == "live":
+                _, call_id, rows = message
+                sink = self._live_sinks.get(call_id)
+                if sink is not None:
+                    try:
+                        sink(rows)
+                    except Exception:
+                        log.exception("Live sink of %s failed", self.slot)
+                        self._live_sinks.pop(call_id, None)
+        # Worker gone: fail whatever is still waiting for it.
+        with self._state_lock:
+            pending_calls, self._pending = list(self._pending.values()), {}
+        for pending in pending_calls:
+            pending.ok, pending.value = False, f"Slot worker {self.slot} exited"
+            pending.done.set()
+
+    def _request(
+        self, message_kind: str, *payload, timeout: Optional[float] = None, live_sink=None
+    ) -> Any:
+        call_id = next(self._call_ids)
+        if live_sink is not None:
+            self._live_sinks[call_id] = live_sink
+        try:
+            return self._request_call(call_id, message_kind, *payload, timeout=timeout)
+        finally:
+            self._live_sinks.pop(call_id, None)
+
+    def _request_call(self, call_id: int, message_kind: str, *payload, timeout: Optional[float] = None) -> Any:
+        pending = _PendingCall()
+        with self._state_lock:
+            self._pending[call_id] = pending
+        try:
+            self._send((message_kind, call_id, *payload))
+        except SlotWorkerError:
+            with self._state_lock:
+                self._pending.pop(call_id, None)
+            raise
+        if not pending.done.wait(timeout):
+            with self._state_lock:
+                self._pending.pop(call_id, None)
+            raise SlotWorkerError(f"Worker for {self.slot} did not answer {message_kind!r}")
+        if not pending.ok:
+            raise RuntimeError(pending.value)
+        return pending.value
+
+    # ----- controller interface -----
+    def apply_measurement(self, **kwargs) -> Any:
+        """Run one measurement in the worker; blocks like `PotentiostatController.apply_measurement`.
+
+        Returns the controller's result (the size and sha256 of the written files).
+        """
+        self._ensure_running()
+        self._queue_stats = None
+        live_sink = kwargs.pop("live_sink", None)
+        if live_sink is not None:
+            kwargs["live_points_per_s"] = getattr(live_sink, "points_per_s", None)
+        return self._request("measure", kwargs, live_sink=live_sink)
+
+    def abort_measurement(self) -> None:
+        """Abort the running measurement (mapped from the run's cancel flag)."""
+        if self.is_alive():
+            self._send(("abort",))
+
+    def get_available_modes(self) -> List[str]:
+        self._ensure_running()
+        return self._request("call", "get_available_modes", (), timeout=CALL_TIMEOUT_S)
+
+    def get_mode_params(self, mode: str) -> Dict[str, str]:
+        self._ensure_running()
+        return self._request("call", "get_mode_params", (mode,), timeout=CALL_TIMEOUT_S)
+
+    def get_queue_stats(self) -> Optional[Dict[str, int]]:
+        """Latest queue stats pushed by the worker (no round trip)."""
+        return self._queue_stats
+
+
+def start_workers(
+    ports: Dict[str, str], controller_options: Optional[Dict[str, Any]] = None
+) -> Dict[str, SlotWorker]:
+    """Start one worker per slot in parallel.
+
+    Parameters
+    ----------
+    ports : Dict[str, str]
+        Mapping ``slot -> port``.
+    controller_options : Optional[Dict[str, Any]]
+        Extra `PotentiostatController` keyword arguments for every worker.
+
+    Returns
+    -------
+    Dict[str, SlotWorker]
+        Started workers; slots whose worker failed to start are logged and omitted.
+    """
+    workers: Dict[str, SlotWorker] = {}
+    lock = threading.Lock()
+
+    def _start(slot: str, port: str) -> None:
+        try:
+            worker = SlotWorker(slot, port, controller_options=controller_options).start()
+        except Exception:
+            log.exception("Failed to start slot worker for %s (%s)", slot, port)
+            return
+        with lock:
+            workers[slot] = worker
+
+    threads = [
+        threading.Thread(target=_start, args=(slot, port), name=f"start-{slot}")
+        for slot, port in ports.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return workers
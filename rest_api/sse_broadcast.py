@@ -0,0 +1,187 @@
+"""Shared producer and fan-out for SSE streams with many clients.
+
+`rest_api.app` uses one `SSEBroadcaster` per stream type (the telemetry demo
+stream today). A single producer task calls the stream's ``produce`` function
+once per tick, at the fastest rate any subscriber asked for, and encodes the
+resulting `BroadcastFrame` once per wire shape (one event per item, or one
+batch event per tick). Subscribers only receive pre-encoded bytes:
+
+- Each subscriber gets frames no faster than its own interval (time-based
+  decimation of the shared tick).
+- Each subscriber has a small bounded queue. When it is full the oldest frame
+  is replaced by the newest (coalescing); a client that stays behind for
+  `DEFAULT_MAX_COALESCED` frames in a row is dropped.
+
+The producer task starts with the first subscriber and stops after the last
+one left.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+log = logging.getLogger("rest_api.sse_broadcast")
+
+DEFAULT_MAX_PENDING = 4
+DEFAULT_MAX_COALESCED = 64
+
+
+def encode_event(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    """Serialize one SSE message (compact JSON data)."""
+    message = f"id: {event_id}\n" if event_id is not None else ""
+    return message + f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+@dataclass
+class BroadcastFrame:
+    """Items produced in one tick, encoded lazily once per shape.
+
+    Attributes:
+        seq: Tick number, used as id of the batch event.
+        event: Event name of single items.
+        batch_event: Event name of the batch event.
+        items: ``(payload, event_id)`` pairs.
+    """
+
+    seq: int
+    event: str
+    batch_event: str
+    items: List[Tuple[Dict[str, Any], Optional[str]]]
+    _encoded: Dict[bool, bytes] = field(default_factory=dict, repr=False)
+
+    def encoded(self, batch: bool) -> bytes:
+        data = self._encoded.get(batch)
+        if data is None:
+            if batch:
+                payload = {"seq": self.seq, "samples": [item for item, _ in self.items]}
+                data = encode_event(self.batch_event, payload, str(self.seq)).encode()
+            else:
+                data = "".join(encode_event(self.event, item, item_id) for item, item_id in self.items).encode()
+            self._encoded[batch] = data
+        return data
+
+
+class Subscriber:
+    """One client of a broadcaster."""
+
+    def __init__(self, interval_s: float, batch: bool, max_pending: int) -> None:
+        self.interval_s = interval_s
+        self.batch = batch
+        self.queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=max_pending)
+        self.next_due = 0.0
+        self.coalesced = 0
+        self.dropped = False
+
+    async def get(self, timeout: float) -> Optional[bytes]:
+        """Next encoded frame, ``b""`` after ``timeout`` idle seconds, ``None`` once dropped."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return b""
+
+    def _offer(self, data: bytes, max_coalesced: int) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.coalesced += 1
+            if self.coalesced >= max_coalesced:
+                self.dropped = True
+                self.queue.put_nowait(None)
+                return
+        else:
+            self.coalesced = 0
+        self.queue.put_nowait(data)
+
+
+class SSEBroadcaster:
+    """Runs ``produce`` once per tick and fans the frame out to subscribers.
+
+    Parameters
+    ----------
+    name : str
+        Stream name used in logs.
+    produce : Callable[[int], BroadcastFrame]
+        Builds the frame of tick ``seq``; runs on the event loop and must be quick.
+    max_pending : int
+        Frames queued per subscriber before coalescing starts.
+    max_coalesced : int
+        Consecutive coalesced frames after which a subscriber is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        produce: Callable[[int], BroadcastFrame],
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_coalesced: int = DEFAULT_MAX_COALESCED,
+    ) -> None:
+        self.name = name
+        self._produce = produce
+        self._max_pending = max_pending
+        self._max_coalesced = max_coalesced
+        self._subscribers: Set[Subscriber] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._seq = 0
+        self.last_frame: Optional[BroadcastFrame] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, interval_s: float, batch: bool = False) -> Subscriber:
+        """Register a client and start the producer if needed (call on the event loop)."""
+        subscriber = Subscriber(interval_s, batch, self._max_pending)
+        if self.last_frame is not None:
+            subscriber.queue.put_nowait(self.last_frame.encoded(batch))
+            subscriber.next_due = time.monotonic() + interval_s
+        self._subscribers.add(subscriber)
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        else:
+            # Let the producer pick up a faster rate right away.
+            self._wake.set()
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a client; the producer stops after the last one."""
+        self._subscribers.discard(subscriber)
+        if not self._subscribers and self._wake is not None:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        log.info("Broadcaster %s started", self.name)
+        try:
+            while self._subscribers:
+                started = time.monotonic()
+                self._seq += 1
+                frame = self._produce(self._seq)
+                self.last_frame = frame
+                for subscriber in list(self._subscribers):
+                    # Small tolerance so timer jitter does not skip a due frame.
+                    if subscriber.dropped or started < subscriber.next_due - 0.1 * subscriber.interval_s:
+                        continue
+                    # Stay on the subscriber's grid so decimation does not drift.
+                    subscriber.next_due += subscriber.interval_s
+                    if subscriber.next_due <= started:
+                        subscriber.next_due = started + subscriber.interval_s
+                    subscriber._offer(frame.encoded(subscriber.batch), self._max_coalesced)
+                    if subscriber.dropped:
+                        log.info("Broadcaster %s dropped a slow subscriber", self.name)
+                if not self._subscribers:
+                    break
+                interval = min(subscriber.interval_s for subscriber in self._subscribers)
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(), timeout=max(0.0, interval - (time.monotonic() - started))
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            log.info("Broadcaster %s stopped", self.name)
@@ -3,16 +3,24 @@
 This module centralizes path normalization for experiment storage. `rest_api.app`
 uses it while handling `/jobs`, `/runs/{run_id}/*`, and retention workflows.
 
-The module maintains an in-memory mapping of `run_id -> run directory` and mirrors
-it to `<RUNS_ROOT>/_run_paths.json` so the API can recover run locations across
-process restarts.
+The module keeps `run_id -> run directory` (and the run's group) in an indexed
+SQLite database `<RUNS_ROOT>/_run_index.sqlite3` so the API can recover run
+locations across process restarts. Inserts and lookups touch a single row, and
+the database runs in WAL mode so lookups from request threads never wait for a
+job start. Resolved directories are cached in memory, and an in-memory group
+index (rebuilt from the database on startup) answers group lookups without
+touching the disk. A legacy `<RUNS_ROOT>/_run_paths.json` is imported once and
+renamed to `_run_paths.json.migrated`.
 """
 
 import json
+import logging
 import pathlib
 import re
+import sqlite3
 import threading
-from typing import Dict, NamedTuple, Optional
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from fastapi import HTTPException
 
@@ -46,11 +54,26 @@ class RunStorageInfo(NamedTuple):
 
 RUN_DIRECTORY_LOCK = threading.Lock()
 RUN_DIRECTORIES: Dict[str, pathlib.Path] = {}
+# group key (lower-cased group id or storage group folder) -> run ids, oldest first
+GROUP_RUNS: Dict[str, Dict[str, None]] = {}
+_RUN_GROUP_KEYS: Dict[str, Tuple[str, ...]] = {}  # reverse of GROUP_RUNS
 _RUNS_ROOT: Optional[pathlib.Path] = None
+_CONNECTIONS = threading.local()
+
+log = logging.getLogger("rest_api.storage")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS runs ("
+    " run_id TEXT PRIMARY KEY,"
+    " rel_path TEXT NOT NULL,"
+    " group_key TEXT,"
+    " created_at TEXT)",
+    "CREATE INDEX IF NOT EXISTS runs_group_key ON runs (group_key)",
+)
 
 
 def configure_runs_root(root: pathlib.Path) -> None:
-    """Set the root output directory and warm the run-id cache.
+    """Set the root output directory and open the run index.
 
     Parameters
     ----------
@@ -59,26 +82,45 @@ def configure_runs_root(root: pathlib.Path) -> None:
 
     Side Effects
     ------------
-    Clears and repopulates :data:`RUN_DIRECTORIES` from persisted index data.
+    Clears :data:`RUN_DIRECTORIES`, creates the index database if needed,
+    migrates a legacy `_run_paths.json` into it and rebuilds
+    :data:`GROUP_RUNS` from it.
     """
     global _RUNS_ROOT
     _RUNS_ROOT = root
     with RUN_DIRECTORY_LOCK:
         RUN_DIRECTORIES.clear()
-        stored = _load_run_index_unlocked()
-        for rid, rel in stored.items():
-            candidate = root / pathlib.Path(rel)
-            if candidate.is_dir():
-                RUN_DIRECTORIES[rid] = candidate
+        GROUP_RUNS.clear()
+        _RUN_GROUP_KEYS.clear()
+        conn = _connection()
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        _migrate_legacy_index_unlocked(conn)
+        rows = conn.execute("SELECT run_id, rel_path, group_key FROM runs ORDER BY created_at, run_id")
+        for run_id, rel_path, group_key in rows:
+            _index_group_unlocked(run_id, group_key, pathlib.PurePosixPath(rel_path))
 
 
 def run_index_path() -> pathlib.Path:
-    """Return `<RUNS_ROOT>/_run_paths.json`.
+    """Return `<RUNS_ROOT>/_run_index.sqlite3`.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the SQLite database that persists run-id directory mappings.
+    """
+    root = _require_root()
+    return root / "_run_index.sqlite3"
+
+
+def legacy_run_index_path() -> pathlib.Path:
+    """Return `<RUNS_ROOT>/_run_paths.json`, the index format before SQLite.
 
     Returns
     -------
     pathlib.Path
-        Path to the JSON file that persists run-id directory mappings.
+        Path of the JSON index that is migrated on startup.
     """
     root = _require_root()
     return root / "_run_paths.json"
@@ -191,7 +233,7 @@ def sanitize_client_datetime(raw: str) -> str:
     return sanitized
 
 
-def record_run_directory(run_id: str, run_dir: pathlib.Path) -> None:
+def record_run_directory(run_id: str, run_dir: pathlib.Path, group_id: Optional[str] = None) -> None:
     """Persist a run-id to directory mapping in memory and on disk.
 
     Parameters
@@ -200,21 +242,50 @@ def record_run_directory(run_id: str, run_dir: pathlib.Path) -> None:
         Server-assigned run identifier.
     run_dir : pathlib.Path
         Absolute path to the run output directory.
+    group_id : Optional[str]
+        Client group of the run, indexed for :func:`runs_for_group`.
 
     Side Effects
     ------------
-    Updates :data:`RUN_DIRECTORIES` and `_run_paths.json` atomically.
+    Updates :data:`RUN_DIRECTORIES` and inserts or replaces one index row.
     """
-    try:
-        rel = run_dir.relative_to(_require_root())
-    except ValueError:
-        rel = run_dir
-    rel_str = rel.as_posix()
+    record_run_directories([(run_id, run_dir, group_id)])
+
+
+def record_run_directories(entries: Iterable[Tuple[str, pathlib.Path, Optional[str]]]) -> None:
+    """Persist several run mappings in one index transaction.
+
+    Parameters
+    ----------
+    entries : Iterable[Tuple[str, pathlib.Path, Optional[str]]]
+        ``(run_id, run_dir, group_id)`` triples as for :func:`record_run_directory`.
+
+    Side Effects
+    ------------
+    Updates :data:`RUN_DIRECTORIES` and :data:`GROUP_RUNS` and inserts or
+    replaces all index rows at once; either every row is written or none is.
+    """
+    root = _require_root()
+    created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    rows = []
+    for run_id, run_dir, group_id in entries:
+        try:
+            rel = run_dir.relative_to(root)
+        except ValueError:
+            rel = run_dir
+        group_key = group_id.strip().lower() if group_id and group_id.strip() else None
+        rows.append((run_id, run_dir, (run_id, rel.as_posix(), group_key, created_at), rel))
     with RUN_DIRECTORY_LOCK:
-        RUN_DIRECTORIES[run_id] = run_dir
-        data = _load_run_index_unlocked()
-        data[run_id] = rel_str
-        _write_run_index_unlocked(data)
+        conn = _connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO runs (run_id, rel_path, group_key, created_at) VALUES (?, ?, ?, ?)",
+                [row for _, _, row, _ in rows],
+            )
+        for run_id, run_dir, row, rel in rows:
+            RUN_DIRECTORIES[run_id] = run_dir
+            _unindex_group_unlocked(run_id)
+            _index_group_unlocked(run_id, row[2], rel)
 
 
 def forget_run_directory(run_id: str) -> None:
@@ -227,21 +298,28 @@ def forget_run_directory(run_id: str) -> None:
 
     Side Effects
     ------------
-    Deletes the run-id entry from memory and `_run_paths.json`.
+    Deletes the run-id entry from memory, the group index and the index database.
     """
     with RUN_DIRECTORY_LOCK:
         RUN_DIRECTORIES.pop(run_id, None)
-        data = _load_run_index_unlocked()
-        if run_id in data:
-            data.pop(run_id, None)
-            if data:
-                _write_run_index_unlocked(data)
-            else:
-                path = run_index_path()
-                try:
-                    path.unlink()
-                except FileNotFoundError:
-                    pass
+        _unindex_group_unlocked(run_id)
+        conn = _connection()
+        with conn:
+            conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+
+def release_cached_directories(run_ids: Iterable[str]) -> None:
+    """Drop in-memory mappings of runs that are no longer active.
+
+    Parameters
+    ----------
+    run_ids : Iterable[str]
+        Identifiers whose cache entries are dropped; the index keeps them, so
+        :func:`resolve_run_directory` still finds the directories.
+    """
+    with RUN_DIRECTORY_LOCK:
+        for run_id in run_ids:
+            RUN_DIRECTORIES.pop(run_id, None)
 
 
 def resolve_run_directory(run_id: str) -> pathlib.Path:
@@ -250,7 +328,7 @@ def resolve_run_directory(run_id: str) -> pathlib.Path:
     Resolution order is:
 
     1. In-memory mapping in :data:`RUN_DIRECTORIES`
-    2. Persisted JSON index (`_run_paths.json`)
+    2. Run index database (`_run_index.sqlite3`)
     3. Legacy fallback `<RUNS_ROOT>/<run_id>`
 
     Parameters
@@ -273,10 +351,9 @@ def resolve_run_directory(run_id: str) -> pathlib.Path:
     if candidate and candidate.is_dir():
         return candidate
 
-    data = _load_run_index_unlocked()
-    rel = data.get(run_id)
-    if rel:
-        run_dir = _require_root() / pathlib.Path(rel)
+    row = _connection().execute("SELECT rel_path FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    if row:
+        run_dir = _require_root() / pathlib.Path(row[0])
         if run_dir.is_dir():
             with RUN_DIRECTORY_LOCK:
                 RUN_DIRECTORIES[run_id] = run_dir
@@ -291,6 +368,65 @@ def resolve_run_directory(run_id: str) -> pathlib.Path:
     raise HTTPException(404, "Run not found")
 
 
+def runs_for_group(group_id: str) -> List[str]:
+    """Return run ids of a group (case-insensitive), oldest first.
+
+    A run belongs to a group when the group matches its client group id or
+    its storage group folder. Served from :data:`GROUP_RUNS`, so the cost
+    grows with the size of the group only.
+
+    Parameters
+    ----------
+    group_id : str
+        Group identifier as sent by clients.
+
+    Returns
+    -------
+    List[str]
+        Matching run ids in the order they were recorded.
+    """
+    group_key = (group_id or "").strip().lower()
+    if not group_key:
+        return []
+    with RUN_DIRECTORY_LOCK:
+        return list(GROUP_RUNS.get(group_key, ()))
+
+
+def group_folder(rel: pathlib.PurePath) -> Optional[str]:
+    """Return the storage group folder of a run path relative to the runs root.
+
+    Run directories are `<experiment>/<group folder>/<timestamp>`; runs
+    without a group folder have two parts and yield ``None``.
+    """
+    parts = rel.parts
+    if len(parts) >= 3:
+        return parts[-2]
+    return None
+
+
+def _index_group_unlocked(run_id: str, group_key: Optional[str], rel: pathlib.PurePath) -> None:
+    """Add a run to :data:`GROUP_RUNS` under its group id and group folder."""
+    folder = group_folder(rel)
+    keys = tuple(
+        key for key in dict.fromkeys((group_key, folder.strip().lower() if folder and folder.strip() else None)) if key
+    )
+    for key in keys:
+        GROUP_RUNS.setdefault(key, {})[run_id] = None
+    if keys:
+        _RUN_GROUP_KEYS[run_id] = keys
+
+
+def _unindex_group_unlocked(run_id: str) -> None:
+    """Remove a run from :data:`GROUP_RUNS` (used on re-record and forget)."""
+    for key in _RUN_GROUP_KEYS.pop(run_id, ()):
+        runs = GROUP_RUNS.get(key)
+        if runs is None:
+            continue
+        runs.pop(run_id, None)
+        if not runs:
+            del GROUP_RUNS[key]
+
+
 def _require_root() -> pathlib.Path:
     """Return configured runs root.
 
@@ -309,46 +445,59 @@ def _require_root() -> pathlib.Path:
     return _RUNS_ROOT
 
 
-def _load_run_index_unlocked() -> Dict[str, str]:
-    """Load run mappings from disk without acquiring the lock.
+def _connection() -> sqlite3.Connection:
+    """Return this thread's connection to the run index.
 
     Returns
     -------
-    Dict[str, str]
-        Mapping of run id to relative directory path. Invalid or unreadable
-        content degrades to an empty mapping.
+    sqlite3.Connection
+        Connection in WAL mode; one per thread and database path so readers
+        never share a cursor with writers.
     """
-    try:
-        raw = run_index_path().read_text(encoding="utf-8")
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
-    try:
-        data = json.loads(raw)
-    except Exception:
-        return {}
-    return {
-        run_id: rel
-        for run_id, rel in data.items()
-        if isinstance(run_id, str) and isinstance(rel, str)
-    }
-
-
-def _write_run_index_unlocked(data: Dict[str, str]) -> None:
-    """Write the run index atomically without acquiring the lock.
+    path = run_index_path()
+    connections = getattr(_CONNECTIONS, "by_path", None)
+    if connections is None:
+        connections = _CONNECTIONS.by_path = {}
+    conn = connections.get(path)
+    if conn is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        connections[path] = conn
+    return conn
+
+
+def _migrate_legacy_index_unlocked(conn: sqlite3.Connection) -> None:
+    """Import `_run_paths.json` into the index database once.
 
     Parameters
     ----------
-    data : Dict[str, str]
-        Mapping to persist.
+    conn : sqlite3.Connection
+        Connection to the index database.
 
     Side Effects
     ------------
-    Writes a temporary file and atomically replaces `_run_paths.json`.
+    Inserts the legacy mappings (existing rows win) and renames the JSON file
+    to `_run_paths.json.migrated`. Unreadable content is left in place.
     """
-    path = run_index_path()
-    tmp = path.with_suffix(".tmp")
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
-    tmp.replace(path)
+    path = legacy_run_index_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return
+    except Exception:
+        log.warning("Legacy run index is unreadable, not migrating: %s", path)
+        return
+    if not isinstance(data, dict):
+        log.warning("Legacy run index has unexpected content, not migrating: %s", path)
+        return
+    rows = [
+        (run_id, rel)
+        for run_id, rel in data.items()
+        if isinstance(run_id, str) and isinstance(rel, str)
+    ]
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO runs (run_id, rel_path) VALUES (?, ?)", rows)
+    path.replace(path.with_name(path.name + ".migrated"))
+    log.info("Migrated %d runs from %s", len(rows), path)
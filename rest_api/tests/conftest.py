@@ -0,0 +1,55 @@
+"""Shared fixtures for the box API tests."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+def _install_stub_modules(monkeypatch: pytest.MonkeyPatch) -> None:
+    serial_mod = types.ModuleType("serial")
+    serial_tools = types.ModuleType("serial.tools")
+    serial_list_ports = types.ModuleType("serial.tools.list_ports")
+    serial_list_ports.comports = lambda: []
+    serial_tools.list_ports = serial_list_ports
+    serial_mod.tools = serial_tools
+    monkeypatch.setitem(sys.modules, "serial", serial_mod)
+    monkeypatch.setitem(sys.modules, "serial.tools", serial_tools)
+    monkeypatch.setitem(sys.modules, "serial.tools.list_ports", serial_list_ports)
+
+    pybeep = types.ModuleType("pyBEEP")
+    controller = types.ModuleType("pyBEEP.controller")
+    plotter = types.ModuleType("pyBEEP.plotter")
+
+    class DummyController:
+        pass
+
+    controller.connect_to_potentiostats = lambda *args, **kwargs: []
+    controller.PotentiostatController = DummyController
+    plotter.plot_cv_cycles = lambda *args, **kwargs: None
+    plotter.plot_time_series = lambda *args, **kwargs: None
+    pybeep.controller = controller
+    pybeep.plotter = plotter
+    monkeypatch.setitem(sys.modules, "pyBEEP", pybeep)
+    monkeypatch.setitem(sys.modules, "pyBEEP.controller", controller)
+    monkeypatch.setitem(sys.modules, "pyBEEP.plotter", plotter)
+
+
+@pytest.fixture()
+def api_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("RUNS_ROOT", str(tmp_path / "runs"))
+    monkeypatch.setenv("NAS_CONFIG_PATH", str(tmp_path / "nas.json"))
+    monkeypatch.setenv("UPDATES_ROOT", str(tmp_path / "updates"))
+
+    # Restored after the test, so tests of the real pyBEEP still import it.
+    _install_stub_modules(monkeypatch)
+    rest_api_dir = Path(__file__).resolve().parents[1]
+    monkeypatch.syspath_prepend(str(rest_api_dir))
+
+    monkeypatch.delitem(sys.modules, "app", raising=False)
+    module = importlib.import_module("app")
+    yield module
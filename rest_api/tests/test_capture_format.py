@@ -0,0 +1,74 @@
+"""Tests for pyBEEP's binary capture format against the text CSV logger."""
+
+from __future__ import annotations
+
+import hashlib
+import queue
+import sys
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "vendor" / "pyBEEP" / "src"))
+
+from pyBEEP.capture import capture_path_for, capture_to_csv, ensure_csv  # noqa: E402
+from pyBEEP.logger import DataLogger  # noqa: E402
+from pyBEEP.measurement_modes.waveform_outputs import PotenOutput, Segment  # noqa: E402
+from pyBEEP.utils.constants import POINT_INTERVAL  # noqa: E402
+
+N_POINTS = 5000
+
+
+def _blocks() -> List[np.ndarray]:
+    rng = np.random.default_rng(0)
+    samples = rng.random((N_POINTS, 2)).astype(np.float32)
+    return [samples[start : start + 256] for start in range(0, N_POINTS, 256)]
+
+
+def _log(path: Path, capture_format: str, factor: int) -> DataLogger:
+    data: queue.Queue = queue.Queue()
+    for block in _blocks():
+        data.put(block)
+    data.put(None)
+    waveform = PotenOutput(segments=[Segment(length=N_POINTS, start=-1.0, end=1.0)])
+    logger = DataLogger(data, waveform, str(path), factor * POINT_INTERVAL, capture_format=capture_format)
+    logger.run()
+    return logger
+
+
+@pytest.mark.parametrize("factor", [1, 7])
+def test_capture_converts_to_the_text_logger_csv(tmp_path: Path, factor: int) -> None:
+    text = tmp_path / "text" / "ca.csv"
+    binary = tmp_path / "binary" / "ca.csv"
+    text.parent.mkdir()
+    binary.parent.mkdir()
+
+    _log(text, "csv", factor)
+    _log(binary, "binary", factor)
+
+    assert not binary.exists()
+    assert capture_to_csv(capture_path_for(str(binary))) == str(binary)
+    assert binary.read_bytes() == text.read_bytes()
+
+
+def test_ensure_csv_converts_once(tmp_path: Path) -> None:
+    binary = tmp_path / "ca.csv"
+    _log(binary, "binary", 1)
+
+    assert ensure_csv(str(binary))
+    first = binary.stat().st_mtime_ns
+    assert ensure_csv(str(binary))
+    assert binary.stat().st_mtime_ns == first
+    assert not ensure_csv(str(tmp_path / "missing.csv"))
+
+
+@pytest.mark.parametrize("capture_format", ["csv", "binary"])
+def test_logger_digests_match_the_written_files(tmp_path: Path, capture_format: str) -> None:
+    logger = _log(tmp_path / "ca.csv", capture_format, 1)
+
+    assert logger.digests
+    for path, (size, sha) in logger.digests.items():
+        data = Path(path).read_bytes()
+        assert (size, sha) == (len(data), hashlib.sha256(data).hexdigest())
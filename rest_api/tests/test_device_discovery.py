@@ -0,0 +1,43 @@
+"""Tests for the background device scan at startup."""
+
+from __future__ import annotations
+
+import types
+from typing import Any, Dict, List
+
+from fastapi.testclient import TestClient
+
+
+def _controller(port: str):
+    serial = types.SimpleNamespace(port=port, close=lambda: None)
+    return types.SimpleNamespace(device=types.SimpleNamespace(device=types.SimpleNamespace(serial=serial)))
+
+
+def test_devices_are_listed_after_the_background_scan(api_module, monkeypatch) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    def connect(*args, **kwargs):
+        calls.append(kwargs)
+        return [_controller("/dev/ttyUSB0"), _controller("/dev/ttyUSB1")]
+
+    monkeypatch.setattr(api_module, "connect_to_potentiostats", connect)
+
+    with TestClient(api_module.app) as client:
+        devices = client.get("/devices").json()
+        health = client.get("/health").json()
+
+    assert devices["slots"] == ["slot01", "slot02"]
+    assert [device["port"] for device in devices["devices"]] == ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+    assert health["scanning"] is False
+    assert api_module.DEVICE_SCAN_STATE["error"] is None
+    assert calls == [{"skip_ports": set(), **api_module.CONTROLLER_OPTIONS}]
+
+
+def test_scan_without_devices_serves_an_empty_registry(api_module, caplog) -> None:
+    with TestClient(api_module.app) as client:
+        devices = client.get("/devices").json()
+
+    assert devices == {"devices": [], "slots": [], "count": 0}
+    assert "Startup device scan failed" not in caplog.text
+    assert api_module.DEVICE_SCAN_STATE["error"] is None
+    assert api_module.DEVICE_SCAN_DONE.is_set()
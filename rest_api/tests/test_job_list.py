@@ -0,0 +1,126 @@
+"""Tests for `/jobs` paging across the in-memory job table and the job archive."""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from fastapi.testclient import TestClient
+
+
+def _add_job(module, run_id: str, minute: int, status: str = "done") -> None:
+    started_at = f"2026-01-01T10:{minute:02d}:00Z"
+    ended_at = None if status == "running" else f"2026-01-01T10:{minute:02d}:30Z"
+    module.JOBS[run_id] = module.JobStatus(
+        run_id=run_id,
+        mode="CV",
+        started_at=started_at,
+        status=status,
+        ended_at=ended_at,
+        slots=[module.SlotStatus(slot="slot01", status=status, started_at=started_at, ended_at=ended_at)],
+    )
+
+
+def _pages(client: TestClient, limit: Optional[int] = None) -> List[List[str]]:
+    pages: List[List[str]] = []
+    params = {} if limit is None else {"limit": limit}
+    while True:
+        response = client.get("/jobs", params=params)
+        assert response.status_code == 200
+        pages.append([item["run_id"] for item in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+        params = {**params, "cursor": cursor}
+
+
+def _history(module) -> List[str]:
+    """Archive runs r00..r04, then keep r05..r07 in memory; newest first."""
+    for minute in range(5):
+        _add_job(module, f"r{minute:02d}", minute)
+    assert module._archive_jobs(flush=True) == 5
+    _add_job(module, "r05", 5)
+    _add_job(module, "r06", 6, status="failed")
+    _add_job(module, "r07", 7, status="running")
+    assert sorted(module.JOBS) == ["r05", "r06", "r07"]
+    return [f"r{minute:02d}" for minute in range(7, -1, -1)]
+
+
+def test_cursor_pages_cross_memory_and_archive(api_module) -> None:
+    expected = _history(api_module)
+    client = TestClient(api_module.app)
+
+    pages = _pages(client, limit=3)
+
+    assert pages == [expected[0:3], expected[3:6], expected[6:8]]
+
+
+def test_jobs_in_memory_and_archive_are_listed_once(api_module) -> None:
+    expected = _history(api_module)
+    # Jobs mirrored for the front workers are in both places.
+    with api_module.JOB_LOCK:
+        rows = [
+            api_module._archive_row(api_module._snapshot_entry(api_module.JOBS[run_id]), None, None)
+            for run_id in ("r05", "r07")
+        ]
+    api_module.JOB_ARCHIVE.store(rows)
+    client = TestClient(api_module.app)
+
+    pages = _pages(client, limit=2)
+
+    assert [run_id for page in pages for run_id in page] == expected
+    assert all(len(page) == 2 for page in pages)
+
+
+def test_list_without_limit_or_cursor_is_not_paged(api_module) -> None:
+    expected = _history(api_module)
+    api_module.JOB_PAGE_DEFAULT = 2
+    client = TestClient(api_module.app)
+
+    response = client.get("/jobs")
+
+    assert [item["run_id"] for item in response.json()] == expected
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_cursor_without_limit_uses_default_page_size(api_module) -> None:
+    expected = _history(api_module)
+    api_module.JOB_PAGE_DEFAULT = 4
+    client = TestClient(api_module.app)
+
+    first = client.get("/jobs", params={"limit": 1})
+    rest = client.get("/jobs", params={"cursor": first.headers["X-Next-Cursor"]})
+
+    assert [item["run_id"] for item in rest.json()] == expected[1:5]
+    assert "X-Next-Cursor" in rest.headers
+
+
+def test_invalid_cursor_is_rejected(api_module) -> None:
+    client = TestClient(api_module.app)
+
+    response = client.get("/jobs", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "jobs.invalid_cursor"
+
+
+def test_run_id_of_archived_job_is_not_reused(api_module) -> None:
+    _history(api_module)
+    api_module.DEVICES["slot01"] = object()
+    api_module.DEVICE_SCAN_DONE.set()
+    request = {
+        "devices": ["slot01"],
+        "modes": ["CA"],
+        "params_by_mode": {"CA": {}},
+        "experiment_name": "exp",
+        "client_datetime": "2026-01-01T10-00-00",
+        "run_name": "r00",
+    }
+    client = TestClient(api_module.app)
+
+    single = client.post("/jobs", json=request)
+    batch = client.post("/jobs/batch", json={"jobs": [dict(request, run_name="r01")]})
+
+    assert single.status_code == 409 and single.json()["code"] == "jobs.run_id_conflict"
+    assert batch.status_code == 409 and batch.json()["code"] == "jobs.run_id_conflict"
+    assert api_module.JOB_ARCHIVE.get("r00").status == "done"
+    assert "r00" not in api_module.JOBS
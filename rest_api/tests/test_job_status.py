@@ -0,0 +1,86 @@
+"""Tests for job state versions and the `/jobs/{run_id}` 304 paths."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def _add_job(module, run_id: str, status: str = "done"):
+    ended_at = None if status in ("queued", "running") else "2026-01-01T10:00:30Z"
+    job = module.JobStatus(
+        run_id=run_id,
+        mode="CA",
+        started_at="2026-01-01T10:00:00Z",
+        status=status,
+        ended_at=ended_at,
+        slots=[module.SlotStatus(slot="slot01", status=status, ended_at=ended_at)],
+    )
+    module.JOBS[run_id] = job
+    return job
+
+
+def test_assigning_the_current_value_keeps_the_version(api_module) -> None:
+    job = _add_job(api_module, "run-a", status="running")
+    version = job.state_version()
+
+    job.status = "running"
+    job.slots[0].status = "running"
+    assert job.state_version() == version
+
+    job.slots[0].status = "done"
+    assert job.state_version() > version
+
+
+def test_recomputing_a_terminal_job_keeps_ended_at_and_etag(api_module) -> None:
+    job = _add_job(api_module, "run-a")
+    client = TestClient(api_module.app)
+    etag = client.get("/jobs/run-a").headers["ETag"]
+
+    with api_module.JOB_LOCK:
+        api_module._update_job_status_locked(job)
+
+    assert job.ended_at == "2026-01-01T10:00:30Z"
+    response = client.get("/jobs/run-a", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_if_none_match_answers_304_until_the_job_changes(api_module) -> None:
+    job = _add_job(api_module, "run-a", status="running")
+    client = TestClient(api_module.app)
+    etag = client.get("/jobs/run-a").headers["ETag"]
+
+    assert client.get("/jobs/run-a", headers={"If-None-Match": etag}).status_code == 304
+
+    with api_module.JOB_LOCK:
+        job.slots[0].status = "done"
+        api_module._update_job_status_locked(job)
+    changed = client.get("/jobs/run-a", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["status"] == "done"
+
+
+def test_since_version_answers_304_for_unchanged_finished_jobs(api_module) -> None:
+    _add_job(api_module, "run-done")
+    _add_job(api_module, "run-active", status="running")
+    client = TestClient(api_module.app)
+    done_version = client.get("/jobs/run-done").json()["version"]
+    active_version = client.get("/jobs/run-active").json()["version"]
+
+    assert client.get("/jobs/run-done", params={"since_version": done_version}).status_code == 304
+    assert client.get("/jobs/run-done", params={"since_version": done_version - 1}).status_code == 200
+    # Active jobs are always returned: progress advances without a new version.
+    assert client.get("/jobs/run-active", params={"since_version": active_version}).status_code == 200
+
+
+def test_archived_jobs_keep_their_etag(api_module) -> None:
+    _add_job(api_module, "run-a")
+    client = TestClient(api_module.app)
+    before = client.get("/jobs/run-a")
+
+    assert api_module._archive_jobs(flush=True) == 1
+    after = client.get("/jobs/run-a", params={"since_version": before.json()["version"]})
+
+    assert "run-a" not in api_module.JOBS
+    assert after.status_code == 304
@@ -0,0 +1,85 @@
+"""Tests for the downsampled measurement previews."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import preview  # noqa: E402
+
+
+def _signal(rows: int):
+    x = np.arange(rows, dtype=np.float64)
+    y = np.sin(x / 50.0) + np.random.default_rng(0).normal(0, 0.1, rows)
+    return x, y
+
+
+def _write_csv(path: Path, start: int, stop: int, header: bool = True) -> None:
+    x, y = _signal(stop)
+    with path.open("a", newline="") as handle:
+        if header:
+            handle.write("Time (s),Potential (V),Current (A)\r\n")
+        for row in range(start, stop):
+            handle.write(f"{x[row]},{y[row]},{-y[row]}\r\n")
+
+
+@pytest.mark.parametrize("points", [3, 100, 999])
+def test_lttb_returns_the_requested_points_with_both_endpoints(points: int) -> None:
+    x, y = _signal(10_000)
+
+    keep = preview.lttb(x, y, points)
+
+    assert len(keep) == points
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_keeps_short_series() -> None:
+    x, y = _signal(50)
+
+    assert preview.lttb(x, y, 100).tolist() == list(range(50))
+
+
+@pytest.mark.parametrize("points", [4, 200, 999])
+def test_minmax_keeps_endpoints_and_extremes_within_budget(points: int) -> None:
+    x, y = _signal(10_000)
+    idx = np.arange(len(x))
+
+    keep = preview.minmax(idx, y, len(x), points)
+
+    assert points - 2 <= len(keep) <= points
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.argmin(y) in keep and np.argmax(y) in keep
+    assert np.all(np.diff(keep) > 0)
+
+
+@pytest.mark.parametrize("method", preview.METHODS)
+def test_csv_preview_is_bounded_and_keeps_both_endpoints(tmp_path: Path, method: str) -> None:
+    path = tmp_path / "ca.csv"
+    _write_csv(path, 0, 20_000)
+
+    result = preview.PreviewCache().preview(path, "Time (s)", "Current (A)", 500, method)
+
+    assert result["rows"] == 20_000
+    assert result["points"] == len(result["data"]["x"]) <= 500
+    assert result["points"] >= 498
+    assert (result["data"]["x"][0], result["data"]["x"][-1]) == (0.0, 19_999.0)
+
+
+def test_growing_csv_preview_includes_the_new_last_row(tmp_path: Path) -> None:
+    path = tmp_path / "ca.csv"
+    cache = preview.PreviewCache()
+    _write_csv(path, 0, 5_000)
+    first = cache.preview(path, "Time (s)", "Current (A)", 300, "lttb")
+
+    _write_csv(path, 5_000, 8_000, header=False)
+    grown = cache.preview(path, "Time (s)", "Current (A)", 300, "lttb")
+
+    assert (first["rows"], grown["rows"]) == (5_000, 8_000)
+    assert grown["points"] == 300
+    assert (grown["data"]["x"][0], grown["data"]["x"][-1]) == (0.0, 7_999.0)
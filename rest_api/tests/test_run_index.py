@@ -0,0 +1,66 @@
+"""Tests for the SQLite run index and its migration from `_run_paths.json`."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import storage  # noqa: E402
+
+
+def _legacy_index(root: Path, mapping) -> Path:
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / "_run_paths.json"
+    path.write_text(json.dumps(mapping), encoding="utf-8")
+    return path
+
+
+def _rows(root: Path):
+    with sqlite3.connect(str(root / "_run_index.sqlite3")) as conn:
+        return dict(conn.execute("SELECT run_id, rel_path FROM runs"))
+
+
+def test_legacy_json_index_is_migrated(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    legacy = _legacy_index(root, {"run-a": "Exp/PlateA/2026-01-01T10-00-00", "run-b": "Exp/2026-01-01T11-00-00"})
+    (root / "Exp" / "PlateA" / "2026-01-01T10-00-00").mkdir(parents=True)
+
+    storage.configure_runs_root(root)
+
+    assert not legacy.exists()
+    assert legacy.with_name("_run_paths.json.migrated").exists()
+    assert _rows(root) == {"run-a": "Exp/PlateA/2026-01-01T10-00-00", "run-b": "Exp/2026-01-01T11-00-00"}
+    assert storage.resolve_run_directory("run-a") == root / "Exp" / "PlateA" / "2026-01-01T10-00-00"
+    assert storage.runs_for_group("platea") == ["run-a"]
+
+
+def test_migration_keeps_existing_rows_and_runs_once(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    storage.configure_runs_root(root)
+    storage.record_run_directory("run-a", root / "Exp" / "2026-01-02T10-00-00")
+    _legacy_index(root, {"run-a": "Old/2026-01-01T10-00-00", "run-b": "Old/2026-01-01T11-00-00"})
+
+    storage.configure_runs_root(root)
+    storage.forget_run_directory("run-b")
+    storage.configure_runs_root(root)
+
+    assert _rows(root) == {"run-a": "Exp/2026-01-02T10-00-00"}
+
+
+@pytest.mark.parametrize("content", ["{not json", json.dumps(["run-a"])])
+def test_unreadable_legacy_index_is_left_in_place(tmp_path: Path, content: str) -> None:
+    root = tmp_path / "runs"
+    root.mkdir()
+    legacy = root / "_run_paths.json"
+    legacy.write_text(content, encoding="utf-8")
+
+    storage.configure_runs_root(root)
+
+    assert legacy.read_text(encoding="utf-8") == content
+    assert _rows(root) == {}
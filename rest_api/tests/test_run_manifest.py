@@ -0,0 +1,147 @@
+"""Tests for run manifests fed by writer digests."""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import run_manifest  # noqa: E402
+from run_manifest import RunManifestStore  # noqa: E402
+
+
+def _write(path: Path, data: bytes) -> Tuple[int, str]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+def _capture(folder: Path) -> Dict[str, Tuple[int, str]]:
+    """Columns and header of a binary capture, with their digests like `CaptureWriter.digests`."""
+    capture = folder / "ca.beepcap"
+    return {
+        str(capture / name): _write(capture / name, data)
+        for name, data in (("time.bin", b"\x00" * 16), ("current.bin", b"\x01" * 16), ("header.json", b"{}"))
+    }
+
+
+@pytest.fixture()
+def run_dir(tmp_path: Path) -> Path:
+    path = tmp_path / "runs" / "run-a"
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> RunManifestStore:
+    return RunManifestStore(tmp_path / "runs")
+
+
+def test_writer_digests_are_used_without_hashing(run_dir, store, monkeypatch) -> None:
+    folder = run_dir / "Wells" / "slot01" / "CA"
+    csv_digest = _write(folder / "ca.csv", b"Time (s),Current (A)\r\n0,1\r\n")
+    png_digest = _write(folder / "ca.png", b"png")
+    monkeypatch.setattr(run_manifest, "file_sha256", lambda *paths: pytest.fail("file was read back"))
+
+    store.record(run_dir, folder, digests={str(folder / "ca.csv"): csv_digest})
+    store.record(run_dir, folder, digests={str(folder / "ca.png"): png_digest})
+    _, entries = store.entries(run_dir)
+
+    assert {entry.path: entry.sha256 for entry in entries} == {
+        "Wells/slot01/CA/ca.csv": csv_digest[1],
+        "Wells/slot01/CA/ca.png": png_digest[1],
+    }
+    assert not store._manifests[str(run_dir)].pending
+
+
+def test_digest_with_other_size_is_hashed_in_the_background(run_dir, store) -> None:
+    folder = run_dir / "CA"
+    size, sha = _write(folder / "ca.csv", b"0,1\r\n")
+
+    store.record(run_dir, folder, digests={str(folder / "ca.csv"): (size - 1, "stale")})
+    deadline = time.monotonic() + 5
+    while store.entries(run_dir)[1][0].sha256 is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert store.entries(run_dir)[1][0].sha256 == sha
+
+
+def test_capture_digest_matches_background_hash(run_dir, tmp_path) -> None:
+    folder = run_dir / "CA"
+    digests = _capture(folder)
+    streamed = RunManifestStore(tmp_path / "streamed")
+    hashed = RunManifestStore(tmp_path / "hashed")
+
+    streamed.record(run_dir, folder, digests=digests)
+    hashed.record(run_dir, folder)
+    hashed._hash_pending(run_dir)
+
+    entry = streamed.entries(run_dir)[1][0]
+    assert (entry.path, entry.capture) == ("CA/ca.csv", True)
+    assert entry.sha256 is not None
+    assert entry.sha256 == hashed.entries(run_dir)[1][0].sha256
+
+
+def test_listing_while_writing_does_not_scan(run_dir, store, monkeypatch) -> None:
+    done = run_dir / "Wells" / "slot01" / "CA"
+    running = run_dir / "Wells" / "slot02" / "CA"
+    store.record(run_dir, done, digests={str(done / "ca.csv"): _write(done / "ca.csv", b"0,1\r\n")})
+    store.begin(run_dir, running / "ca.csv")
+    _write(running / "ca.csv", b"0,1\r\n0,2\r\n")
+    version = store.entries(run_dir)[0]
+
+    monkeypatch.setattr(run_manifest, "scan_files", lambda *args: pytest.fail("run directory was scanned"))
+    _, entries = store.entries(run_dir, since=version)
+
+    assert [(entry.path, entry.size, entry.sha256) for entry in entries] == [
+        ("Wells/slot02/CA/ca.csv", 10, None)
+    ]
+
+
+def test_recording_the_step_ends_its_write(run_dir, store) -> None:
+    folder = run_dir / "CA"
+    store.begin(run_dir, folder / "ca.csv")
+    digest = _write(folder / "ca.csv", b"0,1\r\n")
+    version = store.entries(run_dir)[0]
+
+    store.record(run_dir, folder, digests={str(folder / "ca.csv"): digest})
+    new_version, entries = store.entries(run_dir, since=version)
+
+    assert new_version > version
+    assert [(entry.path, entry.sha256) for entry in entries] == [("CA/ca.csv", digest[1])]
+    assert not store._manifests[str(run_dir)].writing
+
+
+def test_read_only_store_reloads_the_daemon_manifest(run_dir, tmp_path) -> None:
+    daemon = RunManifestStore(tmp_path / "runs")
+    front = RunManifestStore(tmp_path / "runs")
+    front.writable = False
+    folder = run_dir / "CA"
+    daemon.begin(run_dir, folder / "ca.csv")
+    digest = _write(folder / "ca.csv", b"0,1\r\n")
+
+    assert [entry.sha256 for entry in front.entries(run_dir)[1]] == [None]
+
+    daemon.record(run_dir, folder, digests={str(folder / "ca.csv"): digest})
+    _, entries = front.entries(run_dir)
+
+    assert [(entry.path, entry.sha256) for entry in entries] == [("CA/ca.csv", digest[1])]
+    assert not front._worker
+
+
+def test_legacy_run_is_scanned_once(run_dir, store, monkeypatch) -> None:
+    _write(run_dir / "ca.csv", b"0,1\r\n")
+    scans = []
+    scan = run_manifest.scan_files
+    monkeypatch.setattr(run_manifest, "scan_files", lambda *args: scans.append(args) or scan(*args))
+
+    store.entries(run_dir)
+    store.entries(run_dir)
+
+    assert len(scans) == 1
@@ -0,0 +1,88 @@
+"""Tests for cached run archives served by `/runs/{run_id}/zip`."""
+
+from __future__ import annotations
+
+import io
+import time
+import zipfile
+
+from fastapi.testclient import TestClient
+
+
+def _run_dir(module, run_id: str = "run-a"):
+    run_dir = module.RUNS_ROOT / run_id
+    (run_dir / "Wells" / "slot01" / "CA").mkdir(parents=True)
+    (run_dir / "Wells" / "slot01" / "CA" / "ca.csv").write_text("Time (s),Current (A)\r\n0,1\r\n")
+    (run_dir / "Wells" / "slot01" / "CA" / "ca.png").write_bytes(b"png" * 100)
+    return run_dir
+
+
+def _wait_for_archive(module, run_dir, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while (cached := module.RUN_ARCHIVES.lookup(run_dir)) is None:
+        if time.monotonic() > deadline:
+            raise AssertionError("archive was not rebuilt")
+        time.sleep(0.01)
+    return cached
+
+
+def test_cached_archive_is_served_with_etag(api_module) -> None:
+    run_dir = _run_dir(api_module)
+    cached = api_module.RUN_ARCHIVES.build(run_dir)
+    client = TestClient(api_module.app)
+
+    response = client.get("/runs/run-a/zip")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == cached.etag
+    assert response.headers["Content-Length"] == str(cached.size)
+    assert response.content == cached.path.read_bytes()
+    names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+    assert sorted(names) == ["Wells/slot01/CA/ca.csv", "Wells/slot01/CA/ca.png"]
+
+
+def test_range_resumes_while_the_etag_matches(api_module) -> None:
+    run_dir = _run_dir(api_module)
+    cached = api_module.RUN_ARCHIVES.build(run_dir)
+    content = cached.path.read_bytes()
+    client = TestClient(api_module.app)
+
+    partial = client.get("/runs/run-a/zip", headers={"Range": "bytes=10-", "If-Range": cached.etag})
+    stale = client.get("/runs/run-a/zip", headers={"Range": "bytes=10-", "If-Range": '"other"'})
+
+    assert partial.status_code == 206
+    assert partial.headers["Content-Range"] == f"bytes 10-{len(content) - 1}/{len(content)}"
+    assert partial.content == content[10:]
+    assert stale.status_code == 200
+    assert stale.content == content
+
+
+def test_changed_run_invalidates_the_archive(api_module) -> None:
+    run_dir = _run_dir(api_module)
+    cached = api_module.RUN_ARCHIVES.build(run_dir)
+    client = TestClient(api_module.app)
+    (run_dir / "Wells" / "slot01" / "CA" / "ca.csv").write_text("Time (s),Current (A)\r\n0,20\r\n")
+
+    assert api_module.RUN_ARCHIVES.lookup(run_dir) is None
+    streamed = client.get("/runs/run-a/zip", headers={"Range": "bytes=10-", "If-Range": cached.etag})
+    rebuilt = _wait_for_archive(api_module, run_dir)
+
+    assert streamed.status_code == 200
+    assert "ETag" not in streamed.headers
+    archive = zipfile.ZipFile(io.BytesIO(streamed.content))
+    assert archive.read("Wells/slot01/CA/ca.csv") == b"Time (s),Current (A)\r\n0,20\r\n"
+    assert rebuilt.etag != cached.etag
+    assert client.get("/runs/run-a/zip").headers["ETag"] == rebuilt.etag
+
+
+def test_stored_compression_bypasses_the_cache(api_module) -> None:
+    run_dir = _run_dir(api_module)
+    api_module.RUN_ARCHIVES.build(run_dir)
+    client = TestClient(api_module.app)
+
+    response = client.get("/runs/run-a/zip", params={"compression": "stored"})
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    infos = zipfile.ZipFile(io.BytesIO(response.content)).infolist()
+    assert {info.compress_type for info in infos} == {zipfile.ZIP_STORED}
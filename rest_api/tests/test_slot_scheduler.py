@@ -0,0 +1,149 @@
+"""Tests for the per-slot FIFO job queues."""
+
+from __future__ import annotations
+
+import datetime
+import sys
+import threading
+import time
+from datetime import timezone
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from slot_scheduler import SlotScheduler  # noqa: E402
+
+
+def _blocking_task(started: threading.Event, release: threading.Event):
+    def run() -> None:
+        started.set()
+        release.wait(5)
+
+    return run
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+def _parse_iso(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@pytest.fixture()
+def blocked_slot():
+    """Scheduler whose ``slot01`` is busy with run ``first`` until released."""
+    scheduler = SlotScheduler()
+    started, release = threading.Event(), threading.Event()
+    order: List[str] = []
+
+    def first() -> None:
+        order.append("first")
+        _blocking_task(started, release)()
+
+    scheduler.submit("slot01", "first", first, planned_s=10.0)
+    assert started.wait(5)
+    yield scheduler, release, order
+    release.set()
+
+
+def test_runs_start_in_submission_order(blocked_slot) -> None:
+    scheduler, release, order = blocked_slot
+    ahead = [
+        scheduler.submit("slot01", run_id, lambda run_id=run_id: order.append(run_id))
+        for run_id in ("second", "third", "fourth")
+    ]
+
+    assert ahead == [1, 2, 3]
+    assert scheduler.running("slot01") == "first"
+    assert scheduler.waiting("slot01") == ["second", "third", "fourth"]
+
+    release.set()
+    _wait_until(lambda: len(order) == 4)
+    assert order == ["first", "second", "third", "fourth"]
+    _wait_until(lambda: scheduler.running("slot01") is None)
+    assert scheduler.waiting("slot01") == []
+
+
+def test_slots_run_independently(blocked_slot) -> None:
+    scheduler, _release, _order = blocked_slot
+    done = threading.Event()
+
+    assert scheduler.submit("slot02", "other", done.set) == 0
+    assert done.wait(5)
+    assert scheduler.running("slot01") == "first"
+
+
+def test_remove_drops_waiting_run(blocked_slot) -> None:
+    scheduler, release, order = blocked_slot
+    for run_id in ("second", "third"):
+        scheduler.submit("slot01", run_id, lambda run_id=run_id: order.append(run_id))
+
+    assert scheduler.remove("slot01", "second") is True
+    assert scheduler.waiting("slot01") == ["third"]
+    # Running tasks and unknown runs or slots are not touched.
+    assert scheduler.remove("slot01", "first") is False
+    assert scheduler.remove("slot01", "missing") is False
+    assert scheduler.remove("slot09", "third") is False
+
+    release.set()
+    _wait_until(lambda: len(order) == 2)
+    time.sleep(0.05)
+    assert order == ["first", "third"]
+
+
+def test_estimate_adds_planned_durations(blocked_slot) -> None:
+    scheduler, _release, _order = blocked_slot
+    scheduler.submit("slot01", "second", lambda: None, planned_s=5.0)
+    scheduler.submit("slot01", "third", lambda: None, planned_s=None)
+    scheduler.submit("slot01", "fourth", lambda: None, planned_s=1.0)
+    now = datetime.datetime.now(timezone.utc)
+
+    second = scheduler.estimate("slot01", "second")
+    assert second is not None and second.position == 1
+    assert abs((_parse_iso(second.estimated_start_at) - now).total_seconds() - 10.0) < 2.0
+
+    third = scheduler.estimate("slot01", "third")
+    assert third is not None and third.position == 2
+    assert abs((_parse_iso(third.estimated_start_at) - now).total_seconds() - 15.0) < 2.0
+
+    # A run ahead without a planned duration makes later starts unknown.
+    fourth = scheduler.estimate("slot01", "fourth")
+    assert fourth is not None and fourth.position == 3
+    assert fourth.estimated_start_at is None
+
+    assert scheduler.estimate("slot01", "first") is None
+    assert scheduler.estimate("slot09", "second") is None
+
+
+def test_estimate_unknown_while_running_task_has_no_plan() -> None:
+    scheduler = SlotScheduler()
+    started, release = threading.Event(), threading.Event()
+    scheduler.submit("slot01", "first", _blocking_task(started, release))
+    try:
+        assert started.wait(5)
+        scheduler.submit("slot01", "second", lambda: None, planned_s=5.0)
+        estimate = scheduler.estimate("slot01", "second")
+        assert estimate is not None and estimate.position == 1
+        assert estimate.estimated_start_at is None
+    finally:
+        release.set()
+
+
+def test_failing_task_does_not_stop_the_slot() -> None:
+    scheduler = SlotScheduler()
+    done = threading.Event()
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    scheduler.submit("slot01", "broken", fail)
+    scheduler.submit("slot01", "next", done.set)
+    assert done.wait(5)
@@ -0,0 +1,73 @@
+"""Tests for pyBEEP's bounded measurement queue that spills to disk."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "vendor" / "pyBEEP" / "src"))
+
+from pyBEEP.spill_queue import SpillQueue  # noqa: E402
+
+
+def _block(index: int) -> np.ndarray:
+    return np.full((3, 2), index, dtype=np.float32)
+
+
+def _indices(blocks: List[np.ndarray]) -> List[int]:
+    return [int(block[0, 0]) for block in blocks]
+
+
+def test_order_is_kept_across_spill_drain_and_respill(tmp_path: Path) -> None:
+    spill = SpillQueue(high_water=2, spill_dir=str(tmp_path))
+    received: List[np.ndarray] = []
+
+    for index in range(5):
+        spill.put(_block(index))
+    assert spill.stats()["spill_depth"] == 3
+    received += [spill.get() for _ in range(3)]
+    # Still spilling: new blocks queue behind the unread spilled ones.
+    spill.put(_block(5))
+    spill.put(_block(6))
+    assert spill.stats()["memory_depth"] == 0
+    received += [spill.get() for _ in range(4)]
+
+    # Drained: the queue is back in memory until it overflows again.
+    spill.put(_block(7))
+    assert spill.stats()["memory_depth"] == 1 and spill.stats()["spill_depth"] == 0
+    for index in range(8, 11):
+        spill.put(_block(index))
+    spill.put(None)
+    received += [spill.get() for _ in range(4)]
+    assert spill.get() is None
+
+    assert _indices(received) == list(range(11))
+    np.testing.assert_array_equal(received[4], _block(4))
+    stats = spill.stats()
+    assert (stats["spill_events"], stats["spilled_blocks"], stats["depth"]) == (2, 8, 0)
+    spill.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_concurrent_producer_and_consumer_keep_order(tmp_path: Path) -> None:
+    spill = SpillQueue(high_water=4, spill_dir=str(tmp_path))
+    received: List[np.ndarray] = []
+
+    def consume() -> None:
+        while (block := spill.get()) is not None:
+            received.append(block)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for index in range(2000):
+        spill.put(_block(index))
+    spill.put(None)
+    consumer.join(10)
+
+    assert not consumer.is_alive()
+    assert _indices(received) == list(range(2000))
+    spill.close()
@@ -3,11 +3,8 @@
 from __future__ import annotations
 
 import hashlib
-import importlib
 import json
-import sys
 import time
-import types
 import zipfile
 from pathlib import Path
 from typing import Callable
@@ -16,35 +13,6 @@ import pytest
 from fastapi.testclient import TestClient
 
 
-def _install_stub_modules() -> None:
-    serial_mod = types.ModuleType("serial")
-    serial_tools = types.ModuleType("serial.tools")
-    serial_list_ports = types.ModuleType("serial.tools.list_ports")
-    serial_list_ports.comports = lambda: []
-    serial_tools.list_ports = serial_list_ports
-    serial_mod.tools = serial_tools
-    sys.modules["serial"] = serial_mod
-    sys.modules["serial.tools"] = serial_tools
-    sys.modules["serial.tools.list_ports"] = serial_list_ports
-
-    pybeep = types.ModuleType("pyBEEP")
-    controller = types.ModuleType("pyBEEP.controller")
-    plotter = types.ModuleType("pyBEEP.plotter")
-
-    class DummyController:
-        pass
-
-    controller.connect_to_potentiostats = lambda: []
-    controller.PotentiostatController = DummyController
-    plotter.plot_cv_cycles = lambda *args, **kwargs: None
-    plotter.plot_time_series = lambda *args, **kwargs: None
-    pybeep.controller = controller
-    pybeep.plotter = plotter
-    sys.modules["pyBEEP"] = pybeep
-    sys.modules["pyBEEP.controller"] = controller
-    sys.modules["pyBEEP.plotter"] = plotter
-
-
 def _build_firmware_package(path: Path) -> Path:
     firmware_bytes = b"\x01\x02\x03\x04\x05"
     sha = hashlib.sha256(firmware_bytes).hexdigest()
@@ -69,22 +37,6 @@ def _build_firmware_package(path: Path) -> Path:
     return path
 
 
-@pytest.fixture()
-def api_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setenv("RUNS_ROOT", str(tmp_path / "runs"))
-    monkeypatch.setenv("NAS_CONFIG_PATH", str(tmp_path / "nas.json"))
-    monkeypatch.setenv("UPDATES_ROOT", str(tmp_path / "updates"))
-
-    _install_stub_modules()
-    rest_api_dir = Path(__file__).resolve().parents[1]
-    sys.path.insert(0, str(rest_api_dir))
-
-    if "app" in sys.modules:
-        del sys.modules["app"]
-    module = importlib.import_module("app")
-    yield module
-
-
 def _make_update_manager(module, root: Path, flash_callback: Callable[[Path], dict] | None = None):
     from update_package import PackageUpdateManager
 
@@ -88,6 +88,7 @@ class RetryingSession:
         accept: str = "application/json",
         timeout: Optional[int] = None,
         stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
         """Send a GET request with retries on timeout/connectivity failures.
 
@@ -97,6 +98,7 @@ class RetryingSession:
             accept: ``Accept`` header value.
             timeout: Optional timeout override in seconds.
             stream: Whether to stream the response body.
+            headers: Optional extra headers (e.g. ``Range``/``If-Range``).
 
         Returns:
             ``requests.Response`` from the first successful attempt.
@@ -110,12 +112,15 @@ class RetryingSession:
         context = f"GET {url}"
         last_err: ApiTimeoutError | None = None
         attempts = self.cfg.retries + 1
+        request_headers = self._headers(accept=accept)
+        if headers:
+            request_headers.update(headers)
         for _ in range(attempts):
             try:
                 return self.session.get(
                     url,
                     params=params,
-                    headers=self._headers(accept=accept),
+                    headers=request_headers,
                     timeout=timeout or self.cfg.request_timeout_s,
                     stream=stream,
                 )
@@ -14,6 +14,9 @@ Call context:
     - ``PollGroupStatus`` calls ``poll_group``.
     - ``CancelGroup`` and ``CancelRuns`` call cancel methods.
     - ``DownloadGroupResults`` calls ``download_group_zip``.
+    - With ``use_streaming`` the adapter subscribes to each box's
+      ``/jobs/events`` stream (``job_stream.JobEventStream``) and only polls
+      boxes whose stream is not live.
 """
 
 # seva/adapters/job_rest.py
@@ -21,8 +24,10 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from datetime import timezone
 from typing import Dict, Iterable, Tuple, Optional, Any, List, Set
+from urllib.parse import urlencode
 from uuid import uuid4
 
 import requests
@@ -38,6 +43,7 @@ from seva.domain.mapping import (
 from seva.domain.ports import JobPort, RunGroupId, BoxId
 
 from seva.adapters.http_client import HttpConfig, RetryingSession
+from seva.adapters.job_stream import JobEventStream
 from seva.adapters.api_errors import (
     ApiClientError,
     ApiError,
@@ -55,7 +61,10 @@ class JobRestAdapter(JobPort):
     Endpoints:
       - POST {base}/jobs               body: {"devices":["slot01"], "modes":["CV"], "params_by_mode":{...}}
               -> {"run_id": "..."}
+      - POST {base}/jobs/batch         body: {"jobs": [<POST /jobs body>, ...]}
+              -> [{"run_id": "..."}, ...] (boxes advertising "jobs.batch")
       - POST {base}/jobs/status        -> [{"run_id":"...", "status":"running", ...}]
+      - GET  {base}/jobs/events?group_id=...  -> text/event-stream (optional)
       - GET  {base}/runs/{run_id}/zip  -> application/zip
 
     Notes:
@@ -71,6 +80,7 @@ class JobRestAdapter(JobPort):
         request_timeout_s: int = 10,
         download_timeout_s: int = 60,
         retries: int = 2,
+        use_streaming: bool = False,
     ) -> None:
         """Initialize adapter and precompute well/slot registry.
 
@@ -80,6 +90,8 @@ class JobRestAdapter(JobPort):
             request_timeout_s: Timeout in seconds for API requests.
             download_timeout_s: Timeout in seconds for ZIP downloads.
             retries: Retry count for transport failures.
+            use_streaming: Subscribe to ``/jobs/events`` per box and poll only
+                while a box's stream is down.
 
         Side Effects:
             Builds HTTP sessions and probes ``/devices`` to build slot registry.
@@ -113,6 +125,18 @@ class JobRestAdapter(JobPort):
         # Cached run snapshots + terminal tracking
         self._run_cache: Dict[str, Dict[str, Any]] = {}
         self._terminal_runs: Set[str] = set()
+        self._cache_lock = threading.Lock()
+
+        # Optional API features advertised by each box's /health (lazy)
+        self._box_features: Dict[BoxId, Set[str]] = {}
+
+        # Job event streams: (group_id, box) -> stream
+        self.use_streaming = bool(use_streaming)
+        self._streams: Dict[Tuple[RunGroupId, BoxId], JobEventStream] = {}
+        # Unfiltered streams for slot activity: box -> stream, and
+        # box -> slot -> run_id -> slot status of runs not finished yet
+        self._activity_streams: Dict[BoxId, JobEventStream] = {}
+        self._slot_runs: Dict[BoxId, Dict[str, Dict[str, str]]] = {}
 
     # ---------- Registry ----------
 
@@ -197,7 +221,9 @@ class JobRestAdapter(JobPort):
             ApiError: If transport/session/response constraints fail.
 
         Side Effects:
-            Performs ``POST /jobs`` calls, mutates in-memory group/run caches.
+            Performs one ``POST /jobs/batch`` per box when the box advertises
+            ``jobs.batch`` (otherwise one ``POST /jobs`` per well) and mutates
+            in-memory group/run caches.
 
         Call Chain:
             ``StartExperimentBatch`` -> ``JobRestAdapter.start_batch``.
@@ -221,6 +247,7 @@ class JobRestAdapter(JobPort):
         subdir = (meta.subdir or "").strip() or None
 
         run_ids: Dict[BoxId, List[str]] = {}
+        payloads_by_box: Dict[BoxId, List[Tuple[str, Dict[str, Any]]]] = {}
         self._groups[group_id] = {}
 
         if not plan.wells:
@@ -270,33 +297,112 @@ class JobRestAdapter(JobPort):
                 "group_id": group_id,
                 "client_datetime": client_dt_text,
             }
+            payloads_by_box.setdefault(box, []).append((well_id, payload))
 
-            url = self._make_url(box, "/jobs")
-            if self._log.isEnabledFor(logging.DEBUG):
-                self._log.debug(
-                    "POST start[%s]: well=%s devices=%s modes=%s group=%s",
-                    box, well_id, devices, payload["modes"], group_id,
-                )
+        for box, entries in payloads_by_box.items():
             session = self.sessions.get(box)
             if session is None:
                 raise ApiError(f"No HTTP session configured for box '{box}'", context=f"start[{box}]")
-            resp = session.post(url, json_body=payload, timeout=self.cfg.request_timeout_s)
-
-            self._ensure_ok(resp, f"start[{box}]")
-            data = self._json(resp)
-            run_id_raw = data.get("run_id")
-            if not run_id_raw:
-                raise ApiError("Response payload missing run_id", context=f"start[{box}]", payload=data)
-            run_id = str(run_id_raw)
+            if len(entries) > 1 and self._box_supports(box, "jobs.batch"):
+                responses = self._start_box_batch(session, box, entries, group_id)
+            else:
+                responses = [
+                    self._start_box_job(session, box, well_id, payload, group_id)
+                    for well_id, payload in entries
+                ]
+            for data in responses:
+                run_id_raw = data.get("run_id")
+                if not run_id_raw:
+                    raise ApiError("Response payload missing run_id", context=f"start[{box}]", payload=data)
+                run_id = str(run_id_raw)
 
-            self._groups[group_id].setdefault(box, []).append(run_id)
-            run_ids.setdefault(box, []).append(run_id)
+                self._groups[group_id].setdefault(box, []).append(run_id)
+                run_ids.setdefault(box, []).append(run_id)
 
-            normalized = self._normalize_job_status(box, data)
-            self._store_run_snapshot(normalized)
+                normalized = self._normalize_job_status(box, data)
+                self._store_run_snapshot(normalized)
 
         return group_id, run_ids
 
+    def _start_box_job(
+        self,
+        session: RetryingSession,
+        box: BoxId,
+        well_id: str,
+        payload: Dict[str, Any],
+        group_id: RunGroupId,
+    ) -> Dict[str, Any]:
+        """Start one well with ``POST /jobs`` and return the job status payload."""
+        url = self._make_url(box, "/jobs")
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "POST start[%s]: well=%s devices=%s modes=%s group=%s",
+                box, well_id, payload["devices"], payload["modes"], group_id,
+            )
+        resp = session.post(url, json_body=payload, timeout=self.cfg.request_timeout_s)
+        self._ensure_ok(resp, f"start[{box}]")
+        return self._json(resp)
+
+    def _start_box_batch(
+        self,
+        session: RetryingSession,
+        box: BoxId,
+        entries: List[Tuple[str, Dict[str, Any]]],
+        group_id: RunGroupId,
+    ) -> List[Dict[str, Any]]:
+        """Start all wells of one box with a single ``POST /jobs/batch``.
+
+        Args:
+            session: Session of ``box``.
+            box: Target box.
+            entries: ``(well_id, payload)`` pairs in plan order.
+            group_id: Run group, for logging.
+
+        Returns:
+            Job status payloads in the order of ``entries``.
+
+        Raises:
+            ApiError: On non-2xx responses or a response of the wrong length.
+        """
+        url = self._make_url(box, "/jobs/batch")
+        self._log.debug(
+            "POST start-batch[%s]: wells=%s group=%s",
+            box, [well_id for well_id, _ in entries], group_id,
+        )
+        resp = session.post(
+            url,
+            json_body={"jobs": [payload for _, payload in entries]},
+            timeout=self.cfg.request_timeout_s,
+        )
+        self._ensure_ok(resp, f"start[{box}]")
+        data = self._json_any(resp)
+        if not isinstance(data, list) or len(data) != len(entries) or not all(
+            isinstance(item, dict) for item in data
+        ):
+            raise ApiError(
+                "Batch start response does not match the submitted jobs",
+                context=f"start[{box}]",
+                payload=data,
+            )
+        return data
+
+    def _box_supports(self, box: BoxId, feature: str) -> bool:
+        """Whether ``box`` advertises ``feature`` in its ``/health`` payload.
+
+        The feature list is read once per box; boxes that do not answer or
+        predate the list are treated as supporting nothing optional.
+        """
+        features = self._box_features.get(box)
+        if features is None:
+            try:
+                advertised = self.health(box).get("features") or []
+            except Exception as exc:
+                self._log.debug("Feature probe for box %s failed: %s", box, exc)
+                advertised = []
+            features = {str(item) for item in advertised} if isinstance(advertised, list) else set()
+            self._box_features[box] = features
+        return feature in features
+
     def cancel_run(self, box_id: BoxId, run_id: str) -> None:
         """Cancel a single run.
 
@@ -421,7 +527,9 @@ class JobRestAdapter(JobPort):
             RuntimeError: On invalid response payload shapes.
 
         Side Effects:
-            Updates run cache and terminal-run tracking sets.
+            Updates run cache and terminal-run tracking sets. With streaming
+            enabled, starts the group's event streams on first use and stops
+            them once every run is terminal.
         """
         box_runs: Dict[BoxId, List[str]] = self._groups.get(run_group_id, {}) or {}
         if not box_runs:
@@ -429,6 +537,8 @@ class JobRestAdapter(JobPort):
             if recovered:
                 self._groups[run_group_id] = recovered
                 box_runs = recovered
+        if self.use_streaming:
+            self._ensure_streams(run_group_id, box_runs)
         snapshot = {"boxes": {}, "wells": [], "activity": {}}
 
         has_runs = False
@@ -441,10 +551,16 @@ class JobRestAdapter(JobPort):
                 all_terminal = False
                 continue
 
+            # A live stream keeps the cache current; only runs it has not
+            # delivered yet still need a status request.
+            stream_live = self.is_box_streaming(run_group_id, box)
             pending_ids: List[str] = []
             for run_id in unique_runs:
-                if run_id not in self._terminal_runs:
-                    pending_ids.append(run_id)
+                if run_id in self._terminal_runs:
+                    continue
+                if stream_live and run_id in self._run_cache:
+                    continue
+                pending_ids.append(run_id)
 
             if pending_ids:
                 self._log.debug(
@@ -567,10 +683,159 @@ class JobRestAdapter(JobPort):
                 all_terminal = False
 
         snapshot["all_done"] = bool(box_runs) and has_runs and all_terminal
+        if snapshot["all_done"]:
+            self._stop_streams(run_group_id)
         return snapshot
 
+    # ---------- Job event streams ----------
+
+    def is_streaming(self, run_group_id: RunGroupId) -> bool:
+        """Return whether every box of the group has a live event stream.
+
+        Args:
+            run_group_id: Group identifier.
+
+        Returns:
+            ``True`` when status updates arrive by push and ``poll_group`` only
+            reads the local cache.
+        """
+        boxes = list((self._groups.get(run_group_id) or {}).keys())
+        return bool(boxes) and all(self.is_box_streaming(run_group_id, box) for box in boxes)
+
+    def is_box_streaming(self, run_group_id: RunGroupId, box: BoxId) -> bool:
+        """Return whether the group's stream for ``box`` is connected."""
+        stream = self._streams.get((run_group_id, box))
+        return stream is not None and stream.live
+
+    def slot_activity(self, box: BoxId) -> Optional[List[Dict[str, Any]]]:
+        """Return slot states of ``box`` derived from streamed ``job`` events.
+
+        Starts an unfiltered ``/jobs/events`` stream for the box on first use.
+        Like ``/devices/status``, a slot is ``running`` while a run executes on
+        it; slots without a running run are left out (idle).
+
+        Args:
+            box: Box identifier.
+
+        Returns:
+            Slot status payloads, or ``None`` while the stream is not live
+            (streaming disabled, connecting, dropped or unsupported) so the
+            caller polls ``/devices/status`` instead.
+        """
+        if not self.use_streaming:
+            return None
+        stream = self._activity_streams.get(box)
+        if stream is None:
+            session = self.sessions.get(box)
+            if session is None:
+                return None
+            stream = JobEventStream(
+                box, self._make_url(box, "/jobs/events"), session, self._on_activity_event
+            )
+            self._activity_streams[box] = stream
+            stream.start()
+        if not stream.live:
+            return None
+        with self._cache_lock:
+            slot_runs = self._slot_runs.get(box) or {}
+            return [
+                {"slot": slot, "status": "running"}
+                for slot, runs in sorted(slot_runs.items())
+                if "running" in runs.values()
+            ]
+
+    def close(self) -> None:
+        """Stop all event streams."""
+        for key in list(self._streams):
+            self._streams.pop(key).stop()
+        for box in list(self._activity_streams):
+            self._activity_streams.pop(box).stop()
+
+    def _ensure_streams(self, run_group_id: RunGroupId, box_runs: Dict[BoxId, List[str]]) -> None:
+        """Start an event stream for every box of the group that lacks one.
+
+        Args:
+            run_group_id: Group identifier used as stream filter.
+            box_runs: Runs of the group keyed by box.
+
+        Side Effects:
+            Spawns one daemon thread per new stream.
+        """
+        for box, run_list in box_runs.items():
+            key = (run_group_id, box)
+            if not run_list or key in self._streams:
+                continue
+            session = self.sessions.get(box)
+            if session is None:
+                continue
+            url = self._make_url(box, f"/jobs/events?{urlencode({'group_id': run_group_id})}")
+            stream = JobEventStream(box, url, session, self._on_stream_event)
+            self._streams[key] = stream
+            stream.start()
+
+    def _stop_streams(self, run_group_id: RunGroupId) -> None:
+        """Stop and forget all streams of a group."""
+        for key in [key for key in self._streams if key[0] == run_group_id]:
+            self._streams.pop(key).stop()
+
+    def _on_activity_event(self, box: BoxId, event: str, payload: Dict[str, Any]) -> None:
+        """Track which runs occupy the slots of ``box`` from its unfiltered stream.
+
+        Args:
+            box: Box the event came from.
+            event: SSE event name; only ``resync`` and ``job`` matter here.
+            payload: Decoded event data.
+        """
+        with self._cache_lock:
+            if event == "resync":
+                # Fresh ``job`` snapshots of all current runs follow.
+                self._slot_runs[box] = {}
+            elif event == "job":
+                run_id = str(payload.get("run_id") or "")
+                slot_runs = self._slot_runs.setdefault(box, {})
+                for entry in payload.get("slots") or []:
+                    slot = str(entry.get("slot") or "")
+                    status = str(entry.get("status") or "").lower()
+                    if not slot or not run_id:
+                        continue
+                    runs = slot_runs.setdefault(slot, {})
+                    if status in ("queued", "running"):
+                        runs[run_id] = status
+                    else:
+                        runs.pop(run_id, None)
+
+    def _on_stream_event(self, box: BoxId, event: str, payload: Dict[str, Any]) -> None:
+        """Apply one ``/jobs/events`` event to the run cache.
+
+        Args:
+            box: Box the event came from.
+            event: SSE event name (``job``, ``progress``, ``files``, ...).
+            payload: Decoded event data.
+
+        Side Effects:
+            Updates cached run snapshots from the stream thread.
+        """
+        if event == "job":
+            self._store_run_snapshot(self._normalize_job_status(box, payload))
+        elif event == "progress":
+            run_id = str(payload.get("run_id") or "")
+            with self._cache_lock:
+                cached = self._run_cache.get(run_id)
+                if cached is None or (cached.get("version") or 0) > (payload.get("version") or 0):
+                    return
+                self._run_cache[run_id] = {
+                    **cached,
+                    "progress_pct": payload.get("progress_pct") or 0,
+                    "remaining_s": payload.get("remaining_s"),
+                }
+        elif event == "files" and self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "Files ready box=%s run=%s slot=%s: %s",
+                box, payload.get("run_id"), payload.get("slot"), payload.get("files"),
+            )
+
     def _recover_group_runs(self, run_group_id: RunGroupId) -> Dict[BoxId, List[str]]:
-        """Recover run IDs for a group by querying ``/jobs?group_id=...``.
+        """Recover run IDs for a group by paging through ``/jobs?group_id=...``.
 
         Args:
             run_group_id: Group identifier to recover.
@@ -589,22 +854,29 @@ class JobRestAdapter(JobPort):
             session = self.sessions.get(box)
             if session is None:
                 continue
-            url = self._make_url(box, f"/jobs?group_id={group_text}")
-            resp = session.get(url, timeout=self.cfg.request_timeout_s)
-            self._ensure_ok(resp, f"jobs[{box}]")
-            payload = self._json_any(resp)
-            if not isinstance(payload, list):
-                raise RuntimeError("Invalid JSON response: expected list of jobs")
+            url = self._make_url(box, "/jobs")
+            params: Dict[str, Any] = {"group_id": group_text}
             run_ids: List[str] = []
-            for item in payload:
-                if not isinstance(item, dict):
-                    continue
-                run_id_raw = item.get("run_id")
-                if not run_id_raw:
-                    continue
-                run_id = str(run_id_raw)
-                if run_id and run_id not in run_ids:
-                    run_ids.append(run_id)
+            # The job list is paged; follow ``X-Next-Cursor`` to the last page.
+            while True:
+                resp = session.get(url, params=params, timeout=self.cfg.request_timeout_s)
+                self._ensure_ok(resp, f"jobs[{box}]")
+                payload = self._json_any(resp)
+                if not isinstance(payload, list):
+                    raise RuntimeError("Invalid JSON response: expected list of jobs")
+                for item in payload:
+                    if not isinstance(item, dict):
+                        continue
+                    run_id_raw = item.get("run_id")
+                    if not run_id_raw:
+                        continue
+                    run_id = str(run_id_raw)
+                    if run_id and run_id not in run_ids:
+                        run_ids.append(run_id)
+                next_cursor = resp.headers.get("X-Next-Cursor")
+                if not next_cursor:
+                    break
+                params = {"group_id": group_text, "cursor": next_cursor}
             if run_ids:
                 recovered[box] = run_ids
         if recovered and self._log.isEnabledFor(logging.DEBUG):
@@ -632,29 +904,77 @@ class JobRestAdapter(JobPort):
             box_dir = os.path.join(out_dir, box)
             os.makedirs(box_dir, exist_ok=True)
             for run_id in runs:
-                url = self._make_url(box, f"/runs/{run_id}/zip")
-                resp = self.sessions[box].get(
-                    url,
-                    timeout=self.cfg.download_timeout_s,
-                    stream=True,
-                    accept="application/zip",
-                )
-                if resp.status_code == 404:
-                    # Some runs may have been cleaned up server-side; skip quietly.
-                    continue
-                self._ensure_ok(resp, f"download[{box}:{run_id}]")
-
-                path = os.path.join(box_dir, f"{run_id}.zip")
-                with open(path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        # Stream in chunks to avoid loading large archives in RAM.
-                        if chunk:
-                            f.write(chunk)
+                self._download_run_zip(box, run_id, os.path.join(box_dir, f"{run_id}.zip"))
 
         return out_dir
 
     # ---------- helpers ----------
 
+    def _download_run_zip(self, box: BoxId, run_id: str, path: str) -> None:
+        """Download one run archive, resuming an interrupted earlier attempt.
+
+        Bytes are written to ``<path>.part``; the archive ``ETag`` is kept in
+        ``<path>.part.etag``. A later call asks only for the missing tail
+        (``Range`` + ``If-Range``) and starts over when the box answers with
+        the full archive because it changed or does not support ranges.
+
+        Args:
+            box: Box identifier.
+            run_id: Run whose archive is downloaded.
+            path: Final ``.zip`` path.
+
+        Side Effects:
+            Writes ``path`` and removes the partial files once complete.
+        """
+        part_path = f"{path}.part"
+        etag_path = f"{part_path}.etag"
+        headers: Dict[str, str] = {}
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        etag = None
+        if offset and os.path.exists(etag_path):
+            with open(etag_path, "r", encoding="utf-8") as f:
+                etag = f.read().strip() or None
+        if offset and etag:
+            headers = {"Range": f"bytes={offset}-", "If-Range": etag}
+
+        url = self._make_url(box, f"/runs/{run_id}/zip")
+        resp = self.sessions[box].get(
+            url,
+            timeout=self.cfg.download_timeout_s,
+            stream=True,
+            accept="application/zip",
+            headers=headers or None,
+        )
+        if resp.status_code == 404:
+            # Some runs may have been cleaned up server-side; skip quietly.
+            return
+        if resp.status_code == 416:
+            # The saved part no longer fits the archive; start over.
+            resp.close()
+            os.remove(part_path)
+            self._download_run_zip(box, run_id, path)
+            return
+        self._ensure_ok(resp, f"download[{box}:{run_id}]")
+
+        resumed = resp.status_code == 206
+        if resumed and self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Resuming download %s:%s at byte %d", box, run_id, offset)
+        new_etag = resp.headers.get("ETag")
+        if new_etag:
+            with open(etag_path, "w", encoding="utf-8") as f:
+                f.write(new_etag)
+        elif os.path.exists(etag_path):
+            os.remove(etag_path)
+
+        with open(part_path, "ab" if resumed else "wb") as f:
+            for chunk in resp.iter_content(chunk_size=8192):
+                # Stream in chunks to avoid loading large archives in RAM.
+                if chunk:
+                    f.write(chunk)
+        os.replace(part_path, path)
+        if os.path.exists(etag_path):
+            os.remove(etag_path)
+
     def _make_url(self, box: BoxId, path: str) -> str:
         """Build endpoint URL from configured base URL.
 
@@ -712,12 +1032,17 @@ class JobRestAdapter(JobPort):
         run_id = snapshot.get("run_id")
         if not run_id:
             return
-        self._run_cache[run_id] = snapshot
-        status = str(snapshot.get("status") or "").lower()
-        if self._is_terminal(status):
-            self._terminal_runs.add(run_id)
-        else:
-            self._terminal_runs.discard(run_id)
+        with self._cache_lock:
+            # Poll responses and stream events race; never go back in version.
+            cached = self._run_cache.get(run_id)
+            if cached and (cached.get("version") or 0) > (snapshot.get("version") or 0):
+                return
+            self._run_cache[run_id] = snapshot
+            status = str(snapshot.get("status") or "").lower()
+            if self._is_terminal(status):
+                self._terminal_runs.add(run_id)
+            else:
+                self._terminal_runs.discard(run_id)
 
     @staticmethod
     def _is_terminal(status: str) -> bool:
@@ -769,6 +1094,7 @@ class JobRestAdapter(JobPort):
             "current_mode": current_mode,
             "modes": payload.get("modes") or [],
             "remaining_modes": payload.get("remaining_modes") or [],
+            "version": payload.get("version") or 0,
         }
         return normalized
 
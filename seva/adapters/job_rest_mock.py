@@ -156,6 +156,14 @@ class JobRestMock(JobPort):
                 continue
             data["status"] = "cancelled"
 
+    def is_streaming(self, run_group_id: RunGroupId) -> bool:
+        """The mock has no event stream; callers keep polling."""
+        return False
+
+    def slot_activity(self, box_id: BoxId) -> Optional[List[Dict[str, Any]]]:
+        """The mock has no event stream; slot activity is polled."""
+        return None
+
     def poll_group(self, run_group_id: RunGroupId) -> Dict[str, Any]:
         """Return normalized polling snapshot from in-memory run state.
 
@@ -0,0 +1,186 @@
+"""Server-sent event subscription to a box's ``/jobs/events`` stream.
+
+``JobRestAdapter`` opens one ``JobEventStream`` per box and run group when
+streaming is enabled. Each stream runs in a daemon thread, parses SSE frames
+and hands ``(event, data)`` pairs to a callback that updates the adapter's run
+cache. Reconnects send ``Last-Event-ID`` so the box replays missed events (or
+answers with a ``resync`` followed by fresh snapshots).
+
+Dependencies:
+    - ``RetryingSession`` for API-key headers and the underlying session.
+
+Call context:
+    - Created and stopped by ``JobRestAdapter``; ``poll_group`` falls back to
+      HTTP polling for a box while its stream is not ``live``.
+    - ``LiveRestAdapter`` reuses the reader for ``/runs/{run_id}/live``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from seva.adapters.http_client import RetryingSession
+from seva.domain.ports import BoxId
+
+# Boxes send a ping every 15 s; a silent connection is considered dead after this.
+STREAM_READ_TIMEOUT_S = 30
+RECONNECT_MIN_S = 1.0
+RECONNECT_MAX_S = 30.0
+
+EventCallback = Callable[[BoxId, str, Dict[str, Any]], None]
+
+
+class JobEventStream:
+    """Background SSE reader with ``Last-Event-ID`` reconnects.
+
+    Attributes:
+        box: Box the stream belongs to.
+        url: Absolute ``/jobs/events`` URL including the group filter.
+        unsupported: ``True`` once the box answered 404 (no stream endpoint).
+    """
+
+    def __init__(
+        self,
+        box: BoxId,
+        url: str,
+        session: RetryingSession,
+        on_event: EventCallback,
+    ) -> None:
+        """Prepare the stream without connecting.
+
+        Args:
+            box: Box identifier passed to ``on_event``.
+            url: Absolute stream URL.
+            session: Session providing API-key headers.
+            on_event: Callback invoked from the stream thread for every event.
+        """
+        self._log = logging.getLogger(__name__)
+        self.box = box
+        self.url = url
+        self.unsupported = False
+        self._session = session
+        self._on_event = on_event
+        self._last_event_id: Optional[str] = None
+        self._live = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def live(self) -> bool:
+        """Whether the stream is connected and delivering events."""
+        return self._live.is_set()
+
+    def start(self) -> None:
+        """Start the reader thread (no-op when already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-events-{self.box}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the reader thread to stop without waiting for it.
+
+        The thread closes its connection after the next line it reads (at the
+        latest the box's next ping); closing the response from this thread
+        would block until then.
+        """
+        self._stop.set()
+        self._live.clear()
+
+    def _run(self) -> None:
+        """Connect, read and reconnect with capped backoff until stopped."""
+        delay = RECONNECT_MIN_S
+        while not self._stop.is_set():
+            try:
+                if self._read_once():
+                    delay = RECONNECT_MIN_S
+            except Exception as exc:
+                if not self._stop.is_set():
+                    self._log.debug("Job stream %s dropped: %s", self.box, exc)
+            finally:
+                self._live.clear()
+            if self.unsupported or self._stop.wait(delay):
+                return
+            delay = min(delay * 2, RECONNECT_MAX_S)
+
+    def _read_once(self) -> bool:
+        """Read one connection until it ends.
+
+        Returns:
+            ``True`` when at least one event was received.
+        """
+        headers = {"Last-Event-ID": self._last_event_id} if self._last_event_id else None
+        response = self._session.get(
+            self.url,
+            accept="text/event-stream",
+            timeout=STREAM_READ_TIMEOUT_S,
+            stream=True,
+            headers=headers,
+        )
+        with response:
+            if response.status_code == 404:
+                self._log.info("Box %s has no job event stream; polling only", self.box)
+                self.unsupported = True
+                return False
+            if response.status_code != 200:
+                self._log.warning(
+                    "Job stream %s rejected: HTTP %s", self.box, response.status_code
+                )
+                return False
+            return self._read_events(response)
+
+    def _read_events(self, response) -> bool:
+        """Parse SSE frames from ``response`` until it ends or ``stop`` is called.
+
+        Returns:
+            ``True`` when at least one event was received.
+        """
+        received = False
+        event_name, event_id, data_lines = "message", None, []
+        for raw in response.iter_lines():
+            if self._stop.is_set():
+                break
+            line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+            if line:
+                if line.startswith(":"):
+                    continue
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "event":
+                    event_name = value
+                elif field == "id":
+                    event_id = value
+                elif field == "data":
+                    data_lines.append(value)
+                continue
+            if data_lines:
+                self._dispatch(event_name, "\n".join(data_lines))
+                if event_id is not None:
+                    self._last_event_id = event_id
+                received = True
+                self._live.set()
+            event_name, event_id, data_lines = "message", None, []
+        return received
+
+    def _dispatch(self, event: str, data: str) -> None:
+        """Decode one event payload and pass it to the callback."""
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            self._log.debug("Job stream %s: invalid %s payload", self.box, event)
+            return
+        if not isinstance(payload, dict):
+            return
+        try:
+            self._on_event(self.box, event, payload)
+        except Exception:
+            self._log.exception("Job stream %s: handler failed for %s", self.box, event)
+
+
+__all__ = ["JobEventStream"]
@@ -0,0 +1,120 @@
+"""REST adapter implementing ``StreamPort`` for live measurement data.
+
+Each subscription follows ``GET /runs/{run_id}/live`` on one box through a
+``JobEventStream`` reader thread and forwards decoded ``block`` events
+(``{"seq", "slot", "mode", "t", "E", "I"}``) to a callback until the box sends
+``end``. Reconnects replay the box's ring buffer, so blocks already delivered
+are dropped by sequence number.
+
+Dependencies:
+    - ``RetryingSession``/``HttpConfig`` for API-key headers.
+    - ``job_stream.JobEventStream`` for SSE parsing and reconnects.
+
+Call context:
+    - Built by ``AppController.ensure_ready`` when ``use_streaming`` is enabled.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from seva.adapters.http_client import HttpConfig, RetryingSession
+from seva.adapters.job_stream import JobEventStream
+from seva.domain.ports import BoxId, StreamPort
+
+BlockCallback = Callable[[Dict[str, Any]], None]
+
+
+class LiveRestAdapter(StreamPort):
+    """Subscribes to live measurement blocks of running runs."""
+
+    def __init__(
+        self,
+        base_urls: Dict[BoxId, str],
+        *,
+        api_keys: Optional[Dict[BoxId, str]] = None,
+        request_timeout_s: int = 10,
+    ) -> None:
+        """Create one session per box.
+
+        Args:
+            base_urls: Mapping from ``BoxId`` to base URL.
+            api_keys: Optional mapping from ``BoxId`` to API key.
+            request_timeout_s: Connect timeout in seconds for stream requests.
+        """
+        self.base_urls = dict(base_urls)
+        self.api_keys = dict(api_keys or {})
+        self.cfg = HttpConfig(request_timeout_s=request_timeout_s, retries=0)
+        self.sessions: Dict[BoxId, RetryingSession] = {
+            box: RetryingSession(self.api_keys.get(box), self.cfg)
+            for box in self.base_urls
+        }
+        self._streams: Dict[Tuple[BoxId, str, Optional[str]], JobEventStream] = {}
+
+    def subscribe(
+        self,
+        box_id: BoxId,
+        run_id: str,
+        on_block: BlockCallback,
+        slot: Optional[str] = None,
+    ) -> Callable[[], None]:
+        """Start forwarding live blocks of ``run_id`` to ``on_block``.
+
+        Args:
+            box_id: Box running the run.
+            run_id: Run identifier.
+            on_block: Called from the reader thread for every new block.
+            slot: Optional slot filter (``slot01``); all slots when omitted.
+
+        Returns:
+            Callable that ends the subscription.
+
+        Raises:
+            ValueError: If ``box_id`` is not configured.
+        """
+        session = self.sessions.get(box_id)
+        base = self.base_urls.get(box_id)
+        if session is None or not base:
+            raise ValueError(f"No base URL configured for box '{box_id}'")
+        key = (box_id, run_id, slot)
+        previous = self._streams.pop(key, None)
+        if previous is not None:
+            previous.stop()
+
+        url = f"{base.rstrip('/')}/runs/{quote(run_id, safe='')}/live"
+        if slot:
+            url += f"?slot={quote(slot, safe='')}"
+        delivered: Dict[str, int] = {}
+
+        def _on_event(_box: BoxId, event: str, payload: Dict[str, Any]) -> None:
+            if event == "end":
+                stream.stop()
+                return
+            if event != "block":
+                return
+            block_slot = str(payload.get("slot") or "")
+            seq = int(payload.get("seq") or 0)
+            if seq <= delivered.get(block_slot, 0):
+                return
+            delivered[block_slot] = seq
+            on_block(payload)
+
+        stream = JobEventStream(box_id, url, session, _on_event)
+        self._streams[key] = stream
+        stream.start()
+
+        def _unsubscribe() -> None:
+            stream.stop()
+            if self._streams.get(key) is stream:
+                self._streams.pop(key, None)
+
+        return _unsubscribe
+
+    def close(self) -> None:
+        """Stop all subscriptions."""
+        for key in list(self._streams):
+            self._streams.pop(key).stop()
+
+
+__all__ = ["LiveRestAdapter"]
@@ -11,6 +11,7 @@ from typing import Optional
 
 from seva.adapters.device_rest import DeviceRestAdapter
 from seva.adapters.job_rest import JobRestAdapter
+from seva.adapters.live_rest import LiveRestAdapter
 from seva.adapters.update_rest import UpdateRestAdapter
 from seva.usecases.cancel_group import CancelGroup
 from seva.usecases.download_group_results import DownloadGroupResults
@@ -49,6 +50,7 @@ class AppController:
         self._job_adapter: Optional[JobRestAdapter] = None
         self._device_adapter: Optional[DeviceRestAdapter] = None
         self._update_adapter: Optional[UpdateRestAdapter] = None
+        self._live_adapter: Optional[LiveRestAdapter] = None
         self.uc_start: Optional[StartExperimentBatch] = None
         self.uc_poll: Optional[PollGroupStatus] = None
         self.uc_download: Optional[DownloadGroupResults] = None
@@ -65,6 +67,11 @@ class AppController:
         """Return the cached job adapter used for run lifecycle requests."""
         return self._job_adapter
 
+    @property
+    def live_adapter(self) -> Optional[LiveRestAdapter]:
+        """Return the live-data adapter (only built when streaming is enabled)."""
+        return self._live_adapter
+
     @property
     def device_adapter(self) -> Optional[DeviceRestAdapter]:
         """Return the cached device adapter used for health/status requests."""
@@ -75,9 +82,15 @@ class AppController:
 
         Side Effects:
             Clears runtime objects so the next ``ensure_ready`` call rebuilds
-            everything from current settings values.
+            everything from current settings values. Open job event streams
+            of the dropped job adapter are stopped.
         """
+        if self._job_adapter is not None and hasattr(self._job_adapter, "close"):
+            self._job_adapter.close()
+        if self._live_adapter is not None:
+            self._live_adapter.close()
         self._job_adapter = None
+        self._live_adapter = None
         self._device_adapter = None
         self._update_adapter = None
         self.uc_start = None
@@ -118,6 +131,7 @@ class AppController:
                 request_timeout_s=self.settings_vm.request_timeout_s,
                 download_timeout_s=self.settings_vm.download_timeout_s,
                 retries=2,
+                use_streaming=bool(self.settings_vm.use_streaming),
             )
             self.uc_poll = PollGroupStatus(self._job_adapter)
             self.uc_download = DownloadGroupResults(self._job_adapter)
@@ -142,10 +156,17 @@ class AppController:
                 retries=2,
             )
 
+        if self._live_adapter is None and self.settings_vm.use_streaming:
+            self._live_adapter = LiveRestAdapter(
+                base_urls=base_urls,
+                api_keys=api_keys,
+                request_timeout_s=self.settings_vm.request_timeout_s,
+            )
+
         if self._job_adapter and self._device_adapter:
             self.uc_start = StartExperimentBatch(self._job_adapter)
             self.uc_test_connection = TestConnection(self._device_adapter)
-            self.uc_poll_device_status = PollDeviceStatus(self._device_adapter)
+            self.uc_poll_device_status = PollDeviceStatus(self._device_adapter, self._job_adapter)
             self.uc_refresh_box_versions = RefreshBoxVersions(self._device_adapter)
         if self._update_adapter:
             self.uc_start_remote_update = StartRemoteUpdate(self._update_adapter)
@@ -594,7 +594,12 @@ class RunFlowPresenter:
         self._scheduler.schedule("activity", delay, self._on_activity_poll_tick)
 
     def _on_activity_poll_tick(self) -> None:
-        """Poll device activity and adapt next delay based on change signature."""
+        """Poll device activity and adapt next delay based on change signature.
+
+        While every box's activity comes from its job event stream, the tick
+        only reads the adapter's stream state and runs every second; polled
+        boxes back off to 10 s while nothing changes.
+        """
         if not self.controller.ensure_ready() or not self.controller.uc_poll_device_status:
             self._activity_delay_ms = 10000
             self._schedule_activity_poll(self._activity_delay_ms)
@@ -612,7 +617,10 @@ class RunFlowPresenter:
 
         snapshot = self.controller.uc_poll_device_status(sorted(boxes))
         signature = tuple(sorted((entry.well_id, entry.status) for entry in snapshot.entries))
-        if signature == self._activity_signature:
+        if snapshot.streamed:
+            self._activity_delay_ms = 1000
+            self._activity_signature = signature
+        elif signature == self._activity_signature:
             self._activity_delay_ms = min(10000, self._activity_delay_ms + 2000)
         else:
             self._activity_delay_ms = 2000
@@ -27,8 +27,11 @@ class DeviceActivitySnapshot:
     
     Attributes:
         Instances are passed between use cases, adapters, and view models.
+        ``streamed`` is ``True`` when every box's activity came from its job
+        event stream instead of a ``/devices/status`` request.
     """
     entries: Tuple[SlotActivityEntry, ...]
+    streamed: bool = False
 
 
 __all__ = ["DeviceActivitySnapshot", "SlotActivityEntry"]
@@ -7,7 +7,7 @@ outside orchestration and view-model layers.
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, List, Literal, Optional, Protocol, Tuple
 
 from seva.domain.entities import BoxId, ExperimentPlan, WellId
 from seva.domain.remote_update import UpdateSnapshot, UpdateStartReceipt
@@ -53,6 +53,14 @@ class JobPort(Protocol):
         """Cancel all runs associated with one group id."""
         ...
 
+    def is_streaming(self, run_group_id: RunGroupId) -> bool:
+        """Whether status updates for the group currently arrive by push."""
+        ...
+
+    def slot_activity(self, box_id: BoxId) -> Optional[List[Dict[str, Any]]]:
+        """Per-slot activity of a box from pushed job events, or ``None`` to poll it."""
+        ...
+
     def poll_group(self, run_group_id: RunGroupId) -> Dict:
         """Return a normalized polling snapshot for the specified group."""
         ...
@@ -125,10 +133,16 @@ class StoragePort(Protocol):
 
 
 class StreamPort(Protocol):
-    """Placeholder for SSE/WebSocket streaming (not implemented yet)."""
-
-    def subscribe(self, run_group_id: RunGroupId):
-        """Subscribe to live stream updates for a run group."""
+    """Live measurement data pushed by the boxes while runs are acquiring."""
+
+    def subscribe(
+        self,
+        box_id: BoxId,
+        run_id: str,
+        on_block: Callable[[Dict[str, Any]], None],
+        slot: Optional[str] = None,
+    ) -> Callable[[], None]:
+        """Forward decimated ``{"slot","mode","t","E","I"}`` blocks; returns an unsubscribe callable."""
         ...
 
 
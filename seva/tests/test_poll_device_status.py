@@ -0,0 +1,60 @@
+"""Tests for channel activity snapshots from polling and job event streams."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from seva.usecases.poll_device_status import PollDeviceStatus
+
+
+class FakeDevicePort:
+    """Device port with two slots per box and recorded status calls."""
+
+    def __init__(self) -> None:
+        self.status_calls: List[str] = []
+
+    def list_devices(self, box_id: str):
+        return [{"slot": "slot01"}, {"slot": "slot02"}]
+
+    def list_device_status(self, box_id: str):
+        self.status_calls.append(box_id)
+        return [{"slot": "slot01", "status": "idle"}, {"slot": "slot02", "status": "running"}]
+
+
+class FakeJobPort:
+    """Job port whose streamed slot activity is set per box."""
+
+    def __init__(self, activity: Dict[str, Optional[List[Dict[str, Any]]]]) -> None:
+        self.activity = activity
+
+    def slot_activity(self, box_id: str):
+        return self.activity.get(box_id)
+
+
+def _statuses(snapshot) -> Dict[str, str]:
+    return {entry.well_id: entry.status for entry in snapshot.entries}
+
+
+def test_streamed_boxes_skip_device_status_requests() -> None:
+    devices = FakeDevicePort()
+    jobs = FakeJobPort({"A": [{"slot": "slot02", "status": "running"}], "B": []})
+    uc = PollDeviceStatus(devices, jobs)
+
+    snapshot = uc(["A", "B"])
+
+    assert devices.status_calls == []
+    assert snapshot.streamed is True
+    assert _statuses(snapshot) == {"A1": "Idle", "A2": "Running", "B3": "Idle", "B4": "Idle"}
+
+
+def test_boxes_without_live_stream_are_polled() -> None:
+    devices = FakeDevicePort()
+    jobs = FakeJobPort({"A": [], "B": None})
+    uc = PollDeviceStatus(devices, jobs)
+
+    snapshot = uc(["A", "B"])
+
+    assert devices.status_calls == ["B"]
+    assert snapshot.streamed is False
+    assert _statuses(snapshot) == {"A1": "Idle", "A2": "Idle", "B3": "Idle", "B4": "Running"}
+
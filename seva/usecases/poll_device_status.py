@@ -1,29 +1,33 @@
 """Use case for polling device-level activity status.
 
 This workflow maps adapter slot payloads to well identifiers and emits typed
-activity snapshots for channel-level UI widgets.
+activity snapshots for channel-level UI widgets. Boxes whose job event stream
+is live are read from the job adapter's stream state; only the others are
+polled via ``/devices/status``.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from seva.domain.device_activity import DeviceActivitySnapshot, SlotActivityEntry
 from seva.domain.mapping import build_slot_registry, extract_slot_labels, parse_slot_number, resolve_well_id
-from seva.domain.ports import DevicePort
+from seva.domain.ports import DevicePort, JobPort
 class PollDeviceStatus:
     """Use-case callable for channel activity polling.
     
     Attributes:
         Fields are consumed by use-case orchestration code and callers.
     """
-    def __init__(self, device_port: DevicePort) -> None:
+    def __init__(self, device_port: DevicePort, job_port: Optional[JobPort] = None) -> None:
         """Initialize polling use case with adapter and cached slot registry.
 
         Args:
             device_port: Adapter implementing device inventory and status calls.
+            job_port: Optional job adapter providing streamed slot activity.
         """
         self.device_port = device_port
+        self.job_port = job_port
         self._slot_registry: Dict[Tuple[str, int], str] = {}
         self._boxes: List[str] = []
 
@@ -41,6 +45,7 @@ class PollDeviceStatus:
 
         Call Chain:
             Periodic presenter poll -> ``PollDeviceStatus.__call__`` ->
+            ``JobPort.slot_activity`` or, without a live stream,
             ``DevicePort.list_device_status``.
 
         Usage:
@@ -52,8 +57,12 @@ class PollDeviceStatus:
             self._rebuild_registry(box_list)
 
         entries: List[SlotActivityEntry] = []
+        streamed = bool(box_list)
         for box in box_list:
-            statuses = self.device_port.list_device_status(box)
+            statuses = self._streamed_statuses(box)
+            if statuses is None:
+                streamed = False
+                statuses = self.device_port.list_device_status(box)
             for status in statuses:
                 slot_label = str(status.get("slot") or "").strip()
                 if not slot_label:
@@ -70,7 +79,32 @@ class PollDeviceStatus:
                     )
                 )
 
-        return DeviceActivitySnapshot(entries=tuple(entries))
+        return DeviceActivitySnapshot(entries=tuple(entries), streamed=streamed)
+
+    def _streamed_statuses(self, box: str) -> Optional[List[Dict[str, Any]]]:
+        """Return slot payloads for ``box`` from its job event stream.
+
+        Args:
+            box: Box identifier.
+
+        Returns:
+            One payload per registered slot of the box (``idle`` unless the
+            stream reports it running), or ``None`` when the box must be polled.
+        """
+        if self.job_port is None:
+            return None
+        active = self.job_port.slot_activity(box)
+        if active is None:
+            return None
+        running = {
+            parse_slot_number(str(item.get("slot") or "")): str(item.get("status") or "idle")
+            for item in active
+        }
+        return [
+            {"slot": f"slot{slot_num:02d}", "status": running.get(slot_num, "idle")}
+            for registry_box, slot_num in sorted(self._slot_registry)
+            if registry_box == box
+        ]
 
     def _rebuild_registry(self, boxes: Sequence[str]) -> None:
         """Recompute ``(box, slot) -> well`` mapping from adapter inventories.
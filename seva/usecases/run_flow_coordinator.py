@@ -24,6 +24,9 @@ if TYPE_CHECKING:  # pragma: no cover - type checking helper
 
 GroupRunIndex = Dict[WellId, RunId]
 _UNSET = object()
+# Poll cadence while the job port receives pushed updates: polls only read the
+# adapter cache then, so they stay short and never back off.
+STREAMING_POLL_INTERVAL_MS = 250
 
 
 def _noop(*_: object, **__: object) -> None:
@@ -211,6 +214,11 @@ class RunFlowCoordinator:
             self._active = False
             return FlowTick(event="completed", snapshot=snapshot)
 
+        if self._is_streaming(ctx.group):
+            self._current_delay_ms = self._baseline_poll_interval()
+            delay = min(STREAMING_POLL_INTERVAL_MS, self._current_delay_ms)
+            return FlowTick(event="tick", snapshot=snapshot, next_delay_ms=delay)
+
         # Back off polling while no progress is reported to avoid busy looping.
         delay = self._compute_next_delay(progress_changed)
         return FlowTick(event="tick", snapshot=snapshot, next_delay_ms=delay)
@@ -282,6 +290,16 @@ class RunFlowCoordinator:
         delay = max(200, delay)
         return delay
 
+    def _is_streaming(self, group: GroupId) -> bool:
+        """Return whether the job port currently receives pushed status updates."""
+        is_streaming = getattr(self.job_port, "is_streaming", None)
+        if not callable(is_streaming):
+            return False
+        try:
+            return bool(is_streaming(str(group)))
+        except Exception:  # pragma: no cover - defensive guard
+            return False
+
     def _max_poll_backoff(self, baseline: int) -> int:
         """Return the effective backoff ceiling, honoring configuration defaults."""
         raw = getattr(self.settings, "poll_backoff_max_ms", None)